@@ -11,4 +11,7 @@ from .userGoal import *
 from .userBudget import *
 from .userCircle import  *
 from .userTransaction import *
-from .transactionAttachment import *
\ No newline at end of file
+from .transactionAttachment import *
+from .transactionImport import *
+from .transactionExport import *
+from .circleVersion import *
\ No newline at end of file
@@ -1,33 +1,42 @@
 from App.models.user import User
-from App.controllers.user import create_user
+from App.controllers.user import create_user, get_user
+from App.services.cache import get_reference
 from flask_jwt_extended import create_access_token, JWTManager, get_jwt_identity, verify_jwt_in_request
 
+# Tokens Carry The User's ID (sub) & Active Circle As Signed Claims, So Authenticated Reads Needn't Look The User Up
+def create_user_token(user):
+  return create_access_token(identity=user, additional_claims={"activeCircleID": user.activeCircleID})
+
 def login(email, password):
   user = User.query.filter_by(email=email).first()
   if user and user.check_password(password):
-    return create_access_token(identity=email)
+    return create_user_token(user)
   return None
 
 def signup(name, email, password):
   user = create_user(name, email, password)
   if user:
-    return create_access_token(identity=email)
+    return create_user_token(user)
+  return None
+
+# New Token Once The Active Circle Changes - Earlier Tokens Keep Naming The Old Circle Until They Expire
+def refresh_user_token(userID):
+  user = get_user(userID)
+  if user:
+    return create_user_token(user)
   return None
 
 def setup_jwt(app):
   jwt = JWTManager(app)
 
   @jwt.user_identity_loader
-  def user_identity_lookup(identity):
-    user = User.query.filter_by(email=identity).one_or_none()
-    if user:
-        return user.id
-    return None
+  def user_identity_lookup(user):
+    return user.id
 
+  # current_user Is The User's Reference Row (id, name, email, activeCircleID) - Read-Only & Usually Cached
   @jwt.user_lookup_loader
   def user_lookup_callback(_jwt_header, jwt_data):
-    identity = jwt_data["sub"]
-    return User.query.get(identity)
+    return get_reference(User, jwt_data["sub"])
   return jwt
 
 # Context processor to make 'is_authenticated' available to all templates
@@ -37,10 +46,10 @@ def add_auth_context(app):
       try:
           verify_jwt_in_request()
           user_id = get_jwt_identity()
-          current_user = User.query.get(user_id)
+          current_user = get_reference(User, user_id)
           is_authenticated = True
       except Exception as e:
           print(e)
           is_authenticated = False
           current_user = None
-      return dict(is_authenticated=is_authenticated, current_user=current_user)
\ No newline at end of file
+      return dict(is_authenticated=is_authenticated, current_user=current_user)
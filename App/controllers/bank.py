@@ -1,8 +1,12 @@
+from sqlalchemy.orm import selectinload
 from App.database import db
+from App.services.fields import field_loads, to_json, to_json_list
 from App.controllers.user import get_user_json
 from App.services.currency import CurrencyService
 from App.models import Bank, Budget, UserBank, Transaction
 from App.controllers.userBank import create_user_bank, is_bank_owner
+from App.controllers.circleVersion import bump_circle_version, bump_user_circle_versions, cached_entities_json, uses_entity_cache
+from App.controllers.budget import budget_list_query, get_budgets_json, get_cached_budgets_json
 
 # Create A New Bank
 def create_bank(userID, bankTitle, bankCurrency, bankAmount, isPrimary, color, userIDs=None):
@@ -29,6 +33,11 @@ def create_bank(userID, bankTitle, bankCurrency, bankAmount, isPrimary, color, u
         if userIDs:
             for otherUserID in userIDs:
                 create_user_bank(otherUserID, new_bank.bankID)
+
+        # Owners' Budgets & Goals In Other Circles Take Their Currency From The Primary Bank
+        bump_circle_version(circleID)
+        bump_user_circle_versions(userID, *(userIDs or []))
+        db.session.commit()
         return new_bank
 
     except Exception as e:
@@ -40,19 +49,45 @@ def create_bank(userID, bankTitle, bankCurrency, bankAmount, isPrimary, color, u
 def get_bank(bankID):
     return Bank.query.get(bankID)
 
+# Loader Options Behind Each Field
+BANK_FIELD_LOADS = {
+    'owner': (selectinload(Bank.user_banks).joinedload(UserBank.user),)
+}
+BANK_FIELD_LOADS_V2 = {
+    'ownerID': (selectinload(Bank.user_banks),)
+}
+
+# Bank List Query | Eager Loads What get_json Needs For The Requested Fields
+def bank_list_query(*criterion, fields=None, version=1, **filters):
+    return Bank.query.options(
+        *field_loads(fields, BANK_FIELD_LOADS_V2 if version == 2 else BANK_FIELD_LOADS)
+    ).filter(*criterion).filter_by(**filters)
+
+# Full Bank JSON Through The Entity Cache | Only Banks That Miss Are Serialized
+def get_cached_banks_json(*criterion, version=1):
+    return cached_entities_json(
+        'Bank', Bank.bankID, bank_list_query(*criterion, version=version),
+        lambda banks: to_json_list(Bank, banks, None, version), version
+    )
+
 # Get Bank Based On Circle
-def get_bank_by_circle_json(circleID):
-    banks = Bank.query.filter_by(circleID=circleID).all()
+def get_bank_by_circle_json(circleID, fields=None, version=1):
+    if uses_entity_cache(fields):
+        return get_cached_banks_json(Bank.circleID == circleID, version=version)
+    banks = bank_list_query(circleID=circleID, fields=fields, version=version).all()
     if not banks:
         return []
-    banks = [bank.get_json() for bank in banks]
+    banks = to_json_list(Bank, banks, fields, version)
     return banks
 
 # Get Bank By ID (JSON)
-def get_bank_json(bankID):
+def get_bank_json(bankID, fields=None, version=1):
+    if uses_entity_cache(fields):
+        banks = get_cached_banks_json(Bank.bankID == bankID, version=version)
+        return banks[0] if banks else None
     bank = Bank.query.get(bankID)
     if bank:
-        return bank.get_json()
+        return to_json(bank, fields, version)
     return None
 
 # Get All Banks
@@ -86,6 +121,8 @@ def update_bank(bankID, bankTitle=None, bankCurrency=None, bankAmount=None, isPr
                 bank.remainingBankAmount = bankAmount
             if isPrimary is not None:
                 bank.isPrimary = isPrimary
+            bump_circle_version(bank.circleID)
+            bump_user_circle_versions(*[user_bank.userID for user_bank in bank.user_banks])
             db.session.commit()
 
             print(f"Bank With ID {bankID} Updated Successfully.")
@@ -98,9 +135,11 @@ def update_bank(bankID, bankTitle=None, bankCurrency=None, bankAmount=None, isPr
         return None
 
 # Get Budgets Associated With A Bank
-def get_all_bank_budgets(bankID):
-    budgets = Budget.query.filter_by(bankID=bankID).all()
-    return [budget.get_json() for budget in budgets]
+def get_all_bank_budgets(bankID, fields=None, version=1):
+    if uses_entity_cache(fields):
+        return get_cached_budgets_json(Budget.bankID == bankID, version=version)
+    budgets = budget_list_query(bankID=bankID, fields=fields, version=version).all()
+    return get_budgets_json(budgets, fields, version)
 
 # Get Bank Transactions
 def get_bank_transactions(bankID):
@@ -108,7 +147,8 @@ def get_bank_transactions(bankID):
 
 # Get Bank Transactions (JSON)
 def get_bank_transactions_json(bankID):
-    transactions = Transaction.query.filter_by(bankID=bankID).all()
+    from App.controllers.transaction import transaction_list_query
+    transactions = transaction_list_query(bankID=bankID).all()
     if not transactions:
         return []
     transactions = [transaction.get_json() for transaction in transactions]
@@ -125,6 +165,8 @@ def delete_bank(userID, bankID):
             return None
 
         user_banks = UserBank.query.filter_by(bankID=bankID).all()
+        bump_circle_version(bank.circleID)
+        bump_user_circle_versions(*[user_bank.userID for user_bank in user_banks])
         for user_bank in user_banks:
             db.session.delete(user_bank)
 
@@ -1,9 +1,13 @@
+from sqlalchemy.orm import selectinload
 from App.database import db
+from App.services.fields import field_loads, wants_any, to_json_list
 from App.models import Budget, UserBudget
 from App.controllers.user import get_user_json
+from App.controllers.userBank import get_primary_bank_currencies
 from App.services.category import CategoryService
 from App.services.datetime import convert_to_date
 from App.controllers.userBudget import create_user_budget, is_budget_owner
+from App.controllers.circleVersion import bump_circle_version, cached_entities_json, uses_entity_cache
 
 # Create A New Budget
 def create_budget(budgetTitle, budgetAmount, budgetType, budgetCategory, transactionScope, color, startDate, endDate, userID, bankID, userIDs=None):
@@ -36,6 +40,9 @@ def create_budget(budgetTitle, budgetAmount, budgetType, budgetCategory, transac
         if userIDs:
             for otherUserID in userIDs:
                 create_user_budget(otherUserID, new_budget.budgetID)
+
+        bump_circle_version(new_budget.circleID)
+        db.session.commit()
         return new_budget
 
     except Exception as e:
@@ -47,19 +54,52 @@ def create_budget(budgetTitle, budgetAmount, budgetType, budgetCategory, transac
 def get_budget(budgetID):
     return Budget.query.get(budgetID)
 
+# Loader Options Behind Each Field | Currency Fields Need The Owner Link To Find Their Primary Bank
+BUDGET_FIELD_LOADS = {
+    **{field: (selectinload(Budget.user_budgets),) for field in Budget.CURRENCY_FIELDS},
+    'owner': (selectinload(Budget.user_budgets).joinedload(UserBudget.user),)
+}
+BUDGET_FIELD_LOADS_V2 = {
+    field: (selectinload(Budget.user_budgets),) for field in Budget.CURRENCY_FIELDS_V2 | {'ownerID'}
+}
+
+# Budget List Query | Eager Loads What get_json Needs For The Requested Fields
+def budget_list_query(*criterion, fields=None, version=1, **filters):
+    return Budget.query.options(
+        *field_loads(fields, BUDGET_FIELD_LOADS_V2 if version == 2 else BUDGET_FIELD_LOADS)
+    ).filter(*criterion).filter_by(**filters)
+
+# Serialize Budgets | Every Owner's Currency Is Resolved Together - And Only When A Currency Field Is Requested
+def get_budgets_json(budgets, fields=None, version=1):
+    if not wants_any(fields, Budget.CURRENCY_FIELDS_V2 if version == 2 else Budget.CURRENCY_FIELDS):
+        return to_json_list(Budget, budgets, fields, version, [(None,)] * len(budgets))
+    currencies = get_primary_bank_currencies([budget.get_owner_id() for budget in budgets])
+    return to_json_list(Budget, budgets, fields, version, [(currencies.get(budget.get_owner_id()),) for budget in budgets])
+
+# Full Budget JSON Through The Entity Cache | Only Budgets That Miss Are Serialized
+def get_cached_budgets_json(*criterion, version=1):
+    return cached_entities_json(
+        'Budget', Budget.budgetID, budget_list_query(*criterion, version=version),
+        lambda budgets: get_budgets_json(budgets, None, version), version
+    )
+
 # Get Budget Based On Circle
-def get_budget_by_circle_json(circleID):
-    budgets = Budget.query.filter_by(circleID=circleID).all()
+def get_budget_by_circle_json(circleID, fields=None, version=1):
+    if uses_entity_cache(fields):
+        return get_cached_budgets_json(Budget.circleID == circleID, version=version)
+    budgets = budget_list_query(circleID=circleID, fields=fields, version=version).all()
     if not budgets:
         return []
-    budgets = [budget.get_json() for budget in budgets]
-    return budgets
+    return get_budgets_json(budgets, fields, version)
 
 # Get Budget By ID (JSON)
-def get_budget_json(budgetID):
+def get_budget_json(budgetID, fields=None, version=1):
+    if uses_entity_cache(fields):
+        budgets = get_cached_budgets_json(Budget.budgetID == budgetID, version=version)
+        return budgets[0] if budgets else None
     budget = Budget.query.get(budgetID)
     if budget:
-        return budget.get_json()
+        return get_budgets_json([budget], fields, version)[0]
     return None
 
 # Get All Budgets
@@ -68,11 +108,10 @@ def get_all_budgets():
 
 # Get All Budgets (JSON)
 def get_all_budgets_json():
-    budgets = Budget.query.all()
+    budgets = budget_list_query().all()
     if not budgets:
         return []
-    budgets = [budget.get_json() for budget in budgets]
-    return budgets
+    return get_budgets_json(budgets)
 
 # Update Existing Budget
 def update_budget(budgetID, budgetTitle=None, budgetAmount=None, budgetType=None, budgetCategory=None, startDate=None, endDate=None, bankID=None, color=None):
@@ -99,6 +138,7 @@ def update_budget(budgetID, budgetTitle=None, budgetAmount=None, budgetType=None
                 budget.bankID = bankID
             if color:
                 budget.color = color
+            bump_circle_version(budget.circleID)
             db.session.commit()
 
             print(f"Budget With ID {budgetID} Updated Successfully.")
@@ -124,6 +164,7 @@ def delete_budget(userID, budgetID):
         for user_budget in user_budgets:
             db.session.delete(user_budget)
 
+        bump_circle_version(budget.circleID)
         db.session.delete(budget)
         db.session.commit()
         return True
@@ -135,5 +176,5 @@ def delete_budget(userID, budgetID):
 
 # Get Budget By Category
 def get_budgets_by_category(category_name):
-    budgets = Budget.query.filter(Budget.budgetCategory.like(f"%{category_name}%")).all()
-    return [budget.get_json() for budget in budgets]
\ No newline at end of file
+    budgets = budget_list_query(Budget.budgetCategory.like(f"%{category_name}%")).all()
+    return get_budgets_json(budgets)
\ No newline at end of file
@@ -1,10 +1,14 @@
 from App.controllers.bank import get_bank_by_circle_json
 from App.controllers.budget import get_budget_by_circle_json
 from App.controllers.goal import get_goal_by_circle_json
-from App.controllers.transaction import get_transaction_by_circle_json
+from App.controllers.transaction import get_transaction_by_circle_json, get_circle_transactions_page
 from App.database import db
+from sqlalchemy.orm import selectinload
+from App.services.concurrency import run_sections
+from App.services.fields import field_loads, to_json
 from App.models import Circle, UserCircle
 from App.controllers.userCircle import create_user_circle, is_circle_owner
+from App.controllers.circleVersion import bump_circle_version
 
 # Create A New Circle
 def create_circle(circleName, circleType, circleColor, circleImage, userID, userIDs=None):
@@ -23,6 +27,9 @@ def create_circle(circleName, circleType, circleColor, circleImage, userID, user
         if userIDs:
             for otherUserID in userIDs:
                 create_user_circle(otherUserID, new_circle.circleID)
+
+        bump_circle_version(new_circle.circleID)
+        db.session.commit()
         return new_circle
 
     except Exception as e:
@@ -34,11 +41,25 @@ def create_circle(circleName, circleType, circleColor, circleImage, userID, user
 def get_circle(circleID):
     return Circle.query.get(circleID)
 
+# Loader Options Behind Each Field
+CIRCLE_FIELD_LOADS = {
+    'owner': (selectinload(Circle.user_circles).joinedload(UserCircle.user),)
+}
+CIRCLE_FIELD_LOADS_V2 = {
+    'ownerID': (selectinload(Circle.user_circles),)
+}
+
+# Circle List Query | Eager Loads What get_json Needs For The Requested Fields
+def circle_list_query(*criterion, fields=None, version=1, **filters):
+    return Circle.query.options(
+        *field_loads(fields, CIRCLE_FIELD_LOADS_V2 if version == 2 else CIRCLE_FIELD_LOADS)
+    ).filter(*criterion).filter_by(**filters)
+
 # Get Circle By ID (JSON)
-def get_circle_json(circleID):
-    circle = Circle.query.get(circleID)
+def get_circle_json(circleID, fields=None, version=1):
+    circle = circle_list_query(fields=fields, version=version).filter_by(circleID=circleID).first()
     if circle:
-        return circle.get_json()
+        return to_json(circle, fields, version)
     return None
 
 # Get All Circles
@@ -65,6 +86,7 @@ def update_circle(circleID, circleName=None, circleColor=None, circleImage=None)
                 circle.circleColor = circleColor
             if circleImage is not None:
                 circle.circleImage = circleImage
+            bump_circle_version(circleID)
             db.session.commit()
 
             print(f"Circle With ID {circleID} Updated Successfully.")
@@ -89,6 +111,7 @@ def delete_circle(userID, circleID):
         user_circles = UserCircle.query.filter_by(circleID=circleID).all()
         for user_circle in user_circles:
             db.session.delete(user_circle)
+        bump_circle_version(circleID)
         db.session.commit()
 
         db.session.delete(circle)
@@ -101,9 +124,9 @@ def delete_circle(userID, circleID):
         return None
 
 # Get All Banks With The Circle
-def get_circle_banks_json(circleID):
+def get_circle_banks_json(circleID, fields=None, version=1):
     try:
-        circle_bank = get_bank_by_circle_json(circleID)
+        circle_bank = get_bank_by_circle_json(circleID, fields, version)
 
         if circle_bank:
             return circle_bank
@@ -115,9 +138,9 @@ def get_circle_banks_json(circleID):
         return []
 
 # Get All Budgets With The Circle
-def get_circle_budgets_json(circleID):
+def get_circle_budgets_json(circleID, fields=None, version=1):
     try:
-        circle_budget = get_budget_by_circle_json(circleID)
+        circle_budget = get_budget_by_circle_json(circleID, fields, version)
 
         if circle_budget:
             return circle_budget
@@ -129,9 +152,9 @@ def get_circle_budgets_json(circleID):
         return []
 
 # Get All Goals With The Circle
-def get_circle_goals_json(circleID):
+def get_circle_goals_json(circleID, fields=None, version=1):
     try:
-        circle_goal = get_goal_by_circle_json(circleID)
+        circle_goal = get_goal_by_circle_json(circleID, fields, version)
 
         if circle_goal:
             return circle_goal
@@ -154,4 +177,30 @@ def get_circle_transactions_json(circleID):
 
     except Exception as e:
         print(f"Error Fetching Transactions For Circle {circleID}: {e}")
-        return []
\ No newline at end of file
+        return []
+
+# Recent Transactions Included In A Snapshot | Older Ones Are Paged In Via next_cursor
+SNAPSHOT_TRANSACTION_LIMIT = 20
+
+# Everything The Dashboard Renders For A Circle, In One Call | None If The Circle Doesn't Exist Or The User Isn't In It
+def get_circle_snapshot(circleID, userID, transaction_limit=SNAPSHOT_TRANSACTION_LIMIT, version=1):
+    # One Query Serves The Circle, Its Members & The Membership Check
+    circle = db.session.get(Circle, circleID, options=[selectinload(Circle.user_circles).joinedload(UserCircle.user)])
+    if not circle or not any(str(user_circle.userID) == str(userID) for user_circle in circle.user_circles):
+        return None
+
+    sections = run_sections({
+        'banks': lambda: get_bank_by_circle_json(circleID, version=version),
+        'budgets': lambda: get_budget_by_circle_json(circleID, version=version),
+        'goals': lambda: get_goal_by_circle_json(circleID, version=version),
+        'transactions': lambda: get_circle_transactions_page(circleID, limit=transaction_limit, version=version)
+    }, db.engine)
+    transactions, next_cursor = sections.pop('transactions')
+
+    return {
+        'circle': to_json(circle, version=version),
+        'users': [user_circle.user.get_json() for user_circle in circle.user_circles],
+        **sections,
+        'transactions': transactions,
+        'next_cursor': next_cursor
+    }
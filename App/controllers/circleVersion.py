@@ -0,0 +1,73 @@
+from sqlalchemy import select, update
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from App.database import db
+from App.models import Circle, User, UserCircle
+from App.services.cache import get_entity_cache, get_reference, mark_served_stale, run_after_response
+
+# Marks Circles' Data As Changed | An Atomic version + 1, Committed By The Caller Along With Its Own Changes
+# Bump In (Or After) A Change's Last Commit - A Poll Between Commits Then Caches Under The Old Version & Is Refreshed
+def bump_circle_version(*circleIDs):
+    circleIDs = {circleID for circleID in circleIDs if circleID is not None}
+    if circleIDs:
+        db.session.execute(
+            update(Circle).where(Circle.circleID.in_(circleIDs)).values(circleVersion=Circle.circleVersion + 1)
+        )
+
+# Every Circle The Users Belong To - Their Names & Primary Bank Currencies Appear In Each One's Data
+def bump_user_circle_versions(*userIDs):
+    bump_circle_version(*db.session.execute(
+        select(UserCircle.circleID).where(UserCircle.userID.in_(userIDs)).distinct()
+    ).scalars())
+
+def version_tag(circleID, circleVersion):
+    return f"{circleID}.{circleVersion}"
+
+# "circleID.version" | None When The Circle Doesn't Exist
+def get_circle_version_tag(circleID):
+    circleVersion = db.session.execute(select(Circle.circleVersion).where(Circle.circleID == circleID)).scalar()
+    return None if circleVersion is None else version_tag(circleID, circleVersion)
+
+# The Requesting User's Active Circle (Behind @jwt_required) | Read From The Token's Claim -
+# Tokens Issued Before The Claim Was Carried Fall Back To The User's Reference Row
+def current_active_circle_id():
+    claims = get_jwt()
+    if "activeCircleID" in claims:
+        return claims["activeCircleID"]
+    user = get_reference(User, get_jwt_identity())
+    return user.activeCircleID if user else None
+
+# Tag For Views Serving The Requesting User's Active Circle (Behind @jwt_required)
+def active_circle_version_tag():
+    circleID = current_active_circle_id()
+    return None if circleID is None else get_circle_version_tag(circleID)
+
+# Only Full Serializations Are Cached - Sparse Fieldsets Are Cheap To Build & Vary Too Much To Share
+def uses_entity_cache(fields):
+    return fields is None and get_entity_cache() is not None
+
+# Full get_json Output Of A List Query's Rows, Through The Entity Cache
+# Rows Are Read With Their Circle's Version In The Same Query & Only The Misses Go Through serialize(rows) -> [json];
+# Stale Hits Are Reloaded & Serialized Again Once The Response Is Sent
+def cached_entities_json(entity, idColumn, query, serialize, version=1):
+    model = idColumn.class_
+    rows = query.join(Circle, Circle.circleID == model.circleID).add_columns(Circle.circleVersion).all()
+    instances = {getattr(instance, idColumn.key): instance for instance, _ in rows}
+    versions = {getattr(instance, idColumn.key): circleVersion for instance, circleVersion in rows}
+
+    entity_cache = get_entity_cache()
+    found, stale = entity_cache.get_many(entity, versions, version)
+
+    missing = [entityID for entityID in instances if entityID not in found]
+    if missing:
+        computed = dict(zip(missing, serialize([instances[entityID] for entityID in missing])))
+        entity_cache.set_many(entity, computed, versions, version)
+        found.update(computed)
+
+    if stale:
+        mark_served_stale()
+
+        def refresh():
+            reloaded = query.with_session(db.session()).filter(idColumn.in_(stale)).all()
+            entity_cache.set_many(entity, dict(zip((getattr(instance, idColumn.key) for instance in reloaded), serialize(reloaded))), versions, version)
+        run_after_response(refresh)
+    return [found[entityID] for entityID in instances]
@@ -1,8 +1,12 @@
+from sqlalchemy.orm import selectinload
 from App.database import db
+from App.services.fields import field_loads, wants_any, to_json_list
 from App.models import Goal, UserGoal
 from App.controllers.user import get_user_json
+from App.controllers.userBank import get_primary_bank_currencies
 from App.services.datetime import convert_to_date
 from App.controllers.userGoal import create_user_goal, is_goal_owner
+from App.controllers.circleVersion import bump_circle_version, cached_entities_json, uses_entity_cache
 
 # Create A New Goal
 def create_goal(goalTitle, targetAmount, goalType, color, startDate, endDate, userID, userIDs=None):
@@ -27,6 +31,9 @@ def create_goal(goalTitle, targetAmount, goalType, color, startDate, endDate, us
         if userIDs:
             for otherUserID in userIDs:
                 create_user_goal(otherUserID, new_goal.goalID)
+
+        bump_circle_version(new_goal.circleID)
+        db.session.commit()
         return new_goal
 
     except Exception as e:
@@ -41,19 +48,52 @@ def get_goal(goalID):
     return Goal.query.get(goalID)
 
 
+# Loader Options Behind Each Field | Currency Fields Need The Owner Link To Find Their Primary Bank
+GOAL_FIELD_LOADS = {
+    **{field: (selectinload(Goal.user_goals),) for field in Goal.CURRENCY_FIELDS},
+    'owner': (selectinload(Goal.user_goals).joinedload(UserGoal.user),)
+}
+GOAL_FIELD_LOADS_V2 = {
+    field: (selectinload(Goal.user_goals),) for field in Goal.CURRENCY_FIELDS_V2 | {'ownerID'}
+}
+
+# Goal List Query | Eager Loads What get_json Needs For The Requested Fields
+def goal_list_query(*criterion, fields=None, version=1, **filters):
+    return Goal.query.options(
+        *field_loads(fields, GOAL_FIELD_LOADS_V2 if version == 2 else GOAL_FIELD_LOADS)
+    ).filter(*criterion).filter_by(**filters)
+
+# Serialize Goals | Every Owner's Currency Is Resolved Together - And Only When A Currency Field Is Requested
+def get_goals_json(goals, fields=None, version=1):
+    if not wants_any(fields, Goal.CURRENCY_FIELDS_V2 if version == 2 else Goal.CURRENCY_FIELDS):
+        return to_json_list(Goal, goals, fields, version, [(None,)] * len(goals))
+    currencies = get_primary_bank_currencies([goal.get_owner_id() for goal in goals])
+    return to_json_list(Goal, goals, fields, version, [(currencies.get(goal.get_owner_id()),) for goal in goals])
+
+# Full Goal JSON Through The Entity Cache | Only Goals That Miss Are Serialized
+def get_cached_goals_json(*criterion, version=1):
+    return cached_entities_json(
+        'Goal', Goal.goalID, goal_list_query(*criterion, version=version),
+        lambda goals: get_goals_json(goals, None, version), version
+    )
+
 # Get Goal Based On Circle
-def get_goal_by_circle_json(circleID):
-    goals = Goal.query.filter_by(circleID=circleID).all()
+def get_goal_by_circle_json(circleID, fields=None, version=1):
+    if uses_entity_cache(fields):
+        return get_cached_goals_json(Goal.circleID == circleID, version=version)
+    goals = goal_list_query(circleID=circleID, fields=fields, version=version).all()
     if not goals:
         return []
-    goals = [goal.get_json() for goal in goals]
-    return goals
+    return get_goals_json(goals, fields, version)
 
 # Get Goal By ID (JSON)
-def get_goal_json(goalID):
+def get_goal_json(goalID, fields=None, version=1):
+    if uses_entity_cache(fields):
+        goals = get_cached_goals_json(Goal.goalID == goalID, version=version)
+        return goals[0] if goals else None
     goal = Goal.query.get(goalID)
     if goal:
-        return goal.get_json()
+        return get_goals_json([goal], fields, version)[0]
     return None
 
 # Get All Goals
@@ -62,11 +102,10 @@ def get_all_goals():
 
 # Get All Goals (JSON)
 def get_all_goals_json():
-    goals = Goal.query.all()
+    goals = goal_list_query().all()
     if not goals:
         return []
-    goals = [goal.get_json() for goal in goals]
-    return goals
+    return get_goals_json(goals)
 
 # Update Existing Goal
 def update_goal(goalID, goalTitle=None, targetAmount=None, startDate=None, endDate=None, color=None):
@@ -84,6 +123,7 @@ def update_goal(goalID, goalTitle=None, targetAmount=None, startDate=None, endDa
                 goal.endDate = convert_to_date(endDate)
             if color:
                 goal.color = color
+            bump_circle_version(goal.circleID)
             db.session.commit()
 
             print(f"Goal With ID {goalID} Updated Successfully.")
@@ -109,6 +149,7 @@ def delete_goal(userID, goalID):
         for user_goal in user_goals:
             db.session.delete(user_goal)
 
+        bump_circle_version(goal.circleID)
         db.session.delete(goal)
         db.session.commit()
         return True
@@ -1,4 +1,5 @@
 from App.database import db
+from App.services.cache import get_entity_cache, clear_references
 from App.controllers.goal import create_goal
 from App.controllers.bank import create_bank
 from App.controllers.circle import create_circle
@@ -15,6 +16,11 @@ def initialize():
     db.drop_all()
     db.create_all()
 
+    entity_cache = get_entity_cache()
+    if entity_cache is not None:
+        entity_cache.clear()
+    clear_references()
+
     # Users
     bob = create_user('Bob Bobberson', 'bob@mail.com', 'bobpass')
     alice = create_user('Alice Bobberson','alice@mail.com', 'alicepass')
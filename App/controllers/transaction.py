@@ -1,23 +1,50 @@
-from App.controllers.transactionAttachment import add_transaction_attachment
 from App.database import db
-from App.controllers.goal import get_goal
-from App.controllers.bank import get_bank
-from App.controllers.budget import get_budget
 from App.controllers.user import get_user_json
 from App.models.bank import Bank
 from App.models.goal import Goal
 from App.services.category import CategoryService
+import json
+from datetime import date, time
+from sqlalchemy import String, cast, false, func, or_, select, tuple_, update
+from sqlalchemy.orm import joinedload, selectinload
+from App.services.pagination import encode_cursor, decode_cursor, split_page
+from App.services.fingerprint import transaction_fingerprint
+from App.services.fields import field_loads, to_json, to_json_list, json_columns
+from App.services.columnar import to_columnar
 from App.services.datetime import convert_to_date, convert_to_time
-from App.models import Transaction, TransactionType, Budget, TransactionScope
-from App.controllers.userTransaction import create_user_transaction, is_transaction_owner, get_user_transaction_by_transaction_id
+from App.models import Transaction, TransactionType, Budget, TransactionScope, UserTransaction, TransactionAttachment
+from App.controllers.userTransaction import is_transaction_owner
+from App.controllers.circleVersion import bump_circle_version
+
+DUPLICATE_TRANSACTION = "Duplicate Transaction"
+
+# Live (Non-Voided) Transactions In The Circle With This Fingerprint | Served By ix_transaction_circle_fingerprint
+def find_duplicate_transactions(circleID, fingerprints):
+    if not fingerprints:
+        return set()
+    return set(db.session.scalars(
+        select(Transaction.transactionFingerprint).where(
+            Transaction.circleID == circleID,
+            Transaction.transactionFingerprint.in_(fingerprints),
+            Transaction.voided.is_not(True)
+        )
+    ))
 
-# Add A New Transaction
-def add_transaction(transactionTitle, transactionDesc, transactionType, transactionCategory, transactionAmount, bankID, userID, goalID, userIDs=None, transactionDate=None, transactionTime=None, budgetID=None, attachments=None):
+# Add A New Transaction | Balances, The Transaction, Its Attachments & User Links Are Staged Then Committed Once
+def add_transaction(transactionTitle, transactionDesc, transactionType, transactionCategory, transactionAmount, bankID, userID, goalID, userIDs=None, transactionDate=None, transactionTime=None, budgetID=None, attachments=None, allowDuplicates=False):
     try:
         userIDs = userIDs or []
         attachments = attachments or []
         user = get_user_json(userID)
         circleID=user['activeCircle']
+        transactionDate = convert_to_date(transactionDate)
+        transactionTime = convert_to_time(transactionTime)
+
+        # Retried Or Re-Entered Posts Must Not Move The Balances A Second Time
+        if not allowDuplicates:
+            fingerprint = transaction_fingerprint(transactionTitle, transactionAmount, transactionDate, transactionTime, bankID)
+            if find_duplicate_transactions(circleID, [fingerprint]):
+                return None, DUPLICATE_TRANSACTION
 
         transaction_data, error = transaction_handler(
             userID, userIDs, transactionTitle, transactionDesc, 
@@ -25,6 +52,7 @@ def add_transaction(transactionTitle, transactionDesc, transactionType, transact
             transactionDate, transactionTime, budgetID, bankID, goalID, attachments, circleID
         )
         if error:
+            db.session.rollback()
             return None, error
 
         new_transaction = Transaction(
@@ -39,26 +67,26 @@ def add_transaction(transactionTitle, transactionDesc, transactionType, transact
             bankID=transaction_data['bankID'],
             circleID=circleID,
             goalID=transaction_data['goalID'],
-            attachments=None
-        )
-        db.session.add(new_transaction)
-        db.session.commit()
-
-        if attachments:
-            for attachment in attachments:
-                print(attachment)
-                add_transaction_attachment(
-                    transactionID=new_transaction.transactionID,
+            attachments=[
+                TransactionAttachment(
                     fileName=attachment.get('name'),
                     fileType=attachment.get('mimeType'),
                     fileSize=attachment.get('size'),
                     fileUri=attachment.get('uri')
                 )
+                for attachment in attachments
+            ]
+        )
 
-        create_user_transaction(userID, new_transaction.transactionID)
-        if userIDs:
-            for otherUserID in userIDs:
-                create_user_transaction(otherUserID, new_transaction.transactionID)
+        # Creator First - is_transaction_owner Relies On The Lowest userTransactionID
+        new_transaction.user_transactions = [
+            UserTransaction(userID=memberID) for memberID in [userID, *userIDs]
+        ]
+
+        # One Flush Inserts The Transaction Then Batches The Attachment & User Link Rows
+        db.session.add(new_transaction)
+        bump_circle_version(circleID)
+        db.session.commit()
         return new_transaction, None
 
     except Exception as e:
@@ -70,19 +98,123 @@ def add_transaction(transactionTitle, transactionDesc, transactionType, transact
 def get_transaction(transactionID):
     return Transaction.query.get(transactionID)
 
+# Loader Options Behind Each Field
+TRANSACTION_FIELD_LOADS = {
+    'transactionAmount': (joinedload(Transaction.bank),),
+    'attachments': (selectinload(Transaction.attachments),),
+    'owner': (selectinload(Transaction.user_transactions).joinedload(UserTransaction.user),)
+}
+TRANSACTION_FIELD_LOADS_V2 = {
+    'currency': (joinedload(Transaction.bank),),
+    'attachments': (selectinload(Transaction.attachments),),
+    'ownerID': (selectinload(Transaction.user_transactions),)
+}
+
+# Transaction List Query | Eager Loads What get_json Needs For The Requested Fields (Bank, Attachments, Owner)
+# So A List Of Any Length Costs A Fixed Number Of Queries
+def transaction_list_query(*criterion, fields=None, version=1, **filters):
+    return Transaction.query.options(
+        *field_loads(fields, TRANSACTION_FIELD_LOADS_V2 if version == 2 else TRANSACTION_FIELD_LOADS)
+    ).filter(*criterion).filter_by(**filters)
+
+# Stable Newest-First Ordering Shared By Every Paginated Transaction List
+TRANSACTION_PAGE_ORDER = (
+    Transaction.transactionDate.desc(),
+    Transaction.transactionTime.desc(),
+    Transaction.transactionID.desc()
+)
+
+def transaction_cursor(transaction):
+    return encode_cursor([
+        transaction.transactionDate.isoformat(),
+        transaction.transactionTime.isoformat(),
+        transaction.transactionID
+    ])
+
+def decode_transaction_cursor(cursor):
+    try:
+        transactionDate, transactionTime, transactionID = decode_cursor(cursor)
+        return date.fromisoformat(transactionDate), time.fromisoformat(transactionTime), int(transactionID)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid Cursor")
+
+# Keyset Ordering + "Strictly After The Cursor" Filter
+def transaction_page_query(query, cursor=None):
+    query = query.order_by(*TRANSACTION_PAGE_ORDER)
+    if cursor:
+        query = query.filter(
+            tuple_(Transaction.transactionDate, Transaction.transactionTime, Transaction.transactionID)
+            < tuple_(*decode_transaction_cursor(cursor))
+        )
+    return query
+
+# Paginate A Transaction Query | Without A Limit The Whole List Is Returned (Legacy Behaviour)
+def paginate_transactions(query, limit=None, cursor=None):
+    if limit is None:
+        return query.all(), None
+    rows = transaction_page_query(query, cursor).limit(limit + 1).all()
+    return split_page(rows, limit, transaction_cursor)
+
+# Rows Loaded Per Round Trip While Streaming A Page
+TRANSACTION_STREAM_BATCH_SIZE = 100
+
+class TransactionStream:
+    """Lazily Serialized Transaction Page | next_cursor Is Set Once Iteration Reaches The End Of The Page"""
+
+    def __init__(self, query, limit=None, cursor=None, fields=None, version=1):
+        # Applying The Cursor Here Surfaces An Invalid Cursor Before Any Output Is Sent
+        if limit is not None:
+            query = transaction_page_query(query, cursor).limit(limit + 1)
+        self.query = query
+        self.limit = limit
+        self.fields = fields
+        self.version = version
+        self.next_cursor = None
+
+    def __iter__(self):
+        previous, count = None, 0
+        for transaction in self.query.yield_per(TRANSACTION_STREAM_BATCH_SIZE):
+            if count == self.limit:
+                self.next_cursor = transaction_cursor(previous)
+                break
+            yield to_json(transaction, self.fields, self.version)
+            previous, count = transaction, count + 1
+
+# Serialized Page - Or, With stream=True, A TransactionStream That Serializes Rows As They're Read
+# And With columnar=True, One Array Per Field
+def transactions_page(query, limit=None, cursor=None, stream=False, fields=None, version=1, columnar=False):
+    if stream:
+        return TransactionStream(query, limit, cursor, fields, version), None
+    transactions, next_cursor = paginate_transactions(query, limit, cursor)
+    if columnar:
+        return columnar_transactions(transactions, fields, version), next_cursor
+    return to_json_list(Transaction, transactions, fields, version), next_cursor
+
+# Low-Cardinality Fields (v1 & v2) Sent Once Each In A Columnar Page
+TRANSACTION_DICTIONARY_FIELDS = frozenset({
+    'transactionType', 'transactionCategory', 'transactionBank', 'transactionBudget', 'transactionGoal', 'owner',
+    'currency', 'bankID', 'budgetID', 'goalID', 'ownerID'
+})
+
+# Columnar Form Of Loaded Transactions | Each Column Is Filled Straight From Its Getter, With No Per-Row Object In Between
+# Columns Follow The Requested Fields, Else The Schema's Field Order
+def columnar_transactions(transactions, fields=None, version=1):
+    columns = json_columns(Transaction, transactions, fields, version)
+    return to_columnar(columns, len(transactions), TRANSACTION_DICTIONARY_FIELDS)
+
 # Get Transaction Based On Circle
 def get_transaction_by_circle_json(circleID):
-    transactions = Transaction.query.filter_by(circleID=circleID).all()
+    transactions = transaction_list_query(circleID=circleID).all()
     if not transactions:
         return []
-    transactions = [transaction.get_json() for transaction in transactions]
+    transactions = to_json_list(Transaction, transactions)
     return transactions
 
 # Get Transaction By ID (JSON)
-def get_transaction_json(transactionID):
+def get_transaction_json(transactionID, fields=None, version=1):
     transaction = Transaction.query.get(transactionID)
     if transaction:
-        return transaction.get_json()
+        return to_json(transaction, fields, version)
     return None
 
 # Get All Transactions
@@ -91,145 +223,173 @@ def get_all_transactions():
 
 # Get All Transactions (JSON)
 def get_all_transactions_json():
-    transactions = Transaction.query.all()
+    transactions = transaction_list_query().all()
     if not transactions:
         return []
-    transactions = [transaction.get_json() for transaction in transactions]
+    transactions = to_json_list(Transaction, transactions)
     return transactions
 
-# Get Transactions for Specific User (JSON)
-def get_user_transactions_json(userID):
-    transactions = Transaction.query.filter_by(userID=userID).all()
-    if not transactions:
-        return []
-    transactions = [transactions.get_json() for transactions in transactions]
-    return transactions
+# Categories Are Stored As JSON Lists, So Each One Is Matched As A Quoted Element Of The Serialized Column
+def category_overlap(column, categories):
+    serialized = cast(column, String)
+    return or_(false(), *[serialized.contains(json.dumps(category), autoescape=True) for category in categories or []])
+
+# Transactions Counted By An Inclusive Budget | Same Circle, Inside The Budget Period, Not Voided & Sharing A Category
+def inclusive_budget_criteria(budget):
+    return (
+        Transaction.circleID == budget.circleID,
+        Transaction.transactionDate.between(budget.startDate, budget.endDate),
+        Transaction.voided.is_not(True),
+        category_overlap(Transaction.transactionCategory, budget.budgetCategory)
+    )
 
 # Get Transaction Associated With A Budget | Considers Both Inclusive & Exclusive
 def get_all_budget_transactions(budgetID):
+    return get_budget_transactions_page(budgetID)[0]
+
+def get_budget_transactions_page(budgetID, limit=None, cursor=None, stream=False, fields=None, version=1, columnar=False):
     budget = Budget.query.get(budgetID)
     if not budget:
-        return {"error": "Budget Not Found"}
+        return {"error": "Budget Not Found"}, None
 
-    transactions = []
     if budget.transactionScope.value == TransactionScope.INCLUSIVE.value:
-        all_transactions = Transaction.query.filter_by(circleID=budget.circleID).all()
-        for transaction in all_transactions:
-            if isinstance(transaction.transactionCategory, list):
-                if any(cat in budget.budgetCategory for cat in transaction.transactionCategory):
-                    transactions.append(transaction)
-            else:
-                if transaction.transactionCategory in budget.budgetCategory:
-                    transactions.append(transaction)
+        query = transaction_list_query(*inclusive_budget_criteria(budget), fields=fields, version=version)
     else:
-        transactions = Transaction.query.filter_by(budgetID=budgetID).all()
+        query = transaction_list_query(budgetID=budgetID, fields=fields, version=version)
 
-    return [transaction.get_json() for transaction in transactions]
+    return transactions_page(query, limit, cursor, stream, fields, version, columnar)
 
 # Get Transaction Associated With A Bank
 def get_all_bank_transactions(bankID):
+    return get_bank_transactions_page(bankID)[0]
+
+def get_bank_transactions_page(bankID, limit=None, cursor=None, stream=False, fields=None, version=1, columnar=False):
     bank = Bank.query.get(bankID)
     if not bank:
-        return {"error": "Bank Not Found"}
-    transactions = Transaction.query.filter_by(circleID=bank.circleID).all()
-    return [transaction.get_json() for transaction in transactions]
+        return {"error": "Bank Not Found"}, None
+    return transactions_page(transaction_list_query(circleID=bank.circleID, fields=fields, version=version), limit, cursor, stream, fields, version, columnar)
 
 # Get Transaction Associated With A Goal
 def get_all_goal_transactions(goalID):
+    return get_goal_transactions_page(goalID)[0]
+
+def get_goal_transactions_page(goalID, limit=None, cursor=None, stream=False, fields=None, version=1, columnar=False):
     goal = Goal.query.get(goalID)
     if not goal:
-        return {"error": "Budget Not Found"}
-    transactions = Transaction.query.filter_by(circleID=goal.circleID, goalID=goalID).all()
-    return [transaction.get_json() for transaction in transactions]
+        return {"error": "Budget Not Found"}, None
+    return transactions_page(transaction_list_query(circleID=goal.circleID, goalID=goalID, fields=fields, version=version), limit, cursor, stream, fields, version, columnar)
 
 # Get Transaction Associated With A Circle
 def get_all_circle_transactions(circleID):
-    transactions = Transaction.query.filter_by(circleID=circleID).all()
-    return [transaction.get_json() for transaction in transactions]
-
-# Update Existing Transaction
+    return get_circle_transactions_page(circleID)[0]
+
+def get_circle_transactions_page(circleID, limit=None, cursor=None, stream=False, fields=None, version=1, columnar=False):
+    return transactions_page(transaction_list_query(circleID=circleID, fields=fields, version=version), limit, cursor, stream, fields, version, columnar)
+
+# Balance Columns Touched By A Transaction's Effects
+BALANCE_TARGETS = {
+    Bank: (Bank.remainingBankAmount, "Bank Not Found", "Insufficient Bank Balance"),
+    Budget: (Budget.remainingBudgetAmount, "Budget Not Found", "Insufficient Budget Balance"),
+    Goal: (Goal.currentAmount, "Goal Not Found", "Insufficient Goal Balance")
+}
+
+# What A Transaction Contributes To Each Balance | {Model: {ID: Delta}}
+# Inclusive Budgets Are Matched On Categories; A Linked Budget That Is Also Inclusive Counts Twice, As It Does On Add
+def transaction_effects(state, inclusive_budgets):
+    delta = transaction_factor(state['transactionType']) * state['transactionAmount']
+    effects = {Bank: {}, Budget: {}, Goal: {}}
+
+    def add(model, entityID):
+        effects[model][entityID] = effects[model].get(entityID, 0) + delta
+
+    add(Bank, state['bankID'])
+    if state['budgetID']:
+        add(Budget, state['budgetID'])
+    if state['goalID']:
+        add(Goal, state['goalID'])
+
+    categories = set(state['transactionCategory'] or [])
+    for budgetID, budgetCategory in inclusive_budgets:
+        if categories.intersection(budgetCategory or []):
+            add(Budget, budgetID)
+    return effects
+
+def transaction_state(transaction):
+    return {
+        'transactionType': transaction.transactionType,
+        'transactionAmount': transaction.transactionAmount,
+        'transactionCategory': transaction.transactionCategory,
+        'bankID': transaction.bankID,
+        'budgetID': transaction.budgetID,
+        'goalID': transaction.goalID
+    }
+
+# Marks budgetID / goalID As "Leave As Is" - None Still Means "Unlink"
+UNCHANGED = object()
+
+# Update Existing Transaction | The Old & New Effects Are Diffed So Each Affected Balance Moves Once, In One Commit
 def update_transaction(transactionID, transactionTitle=None, transactionDesc=None, transactionType=None,
                        transactionCategory=None, transactionAmount=None, transactionDate=None,
-                       transactionTime=None, voided=None, budgetID=None, bankID=None, goalID=None):
+                       transactionTime=None, voided=None, budgetID=UNCHANGED, bankID=None, goalID=UNCHANGED):
     try:
         transaction = get_transaction(transactionID)
+        if not transaction:
+            return None
 
-        if transaction:
-
-            # Retrieving The UserID For The Transaction
-            userTransaction = get_user_transaction_by_transaction_id(transactionID)
-            if userTransaction:
-                userID = userTransaction.userID
-            else:
-                print("UserID Not Found For The Transaction")
-                return None
-
-            currBankID = transaction.bankID
-            currGoalID = transaction.goalID
-            currBudgetID = transaction.budgetID
-            currTransactionType = transaction.transactionType
-            currTransactionAmount = transaction.transactionAmount
-            currTransactionCategory = transaction.transactionCategory
-
-            goal_changed = goalID is not None and goalID != currGoalID
-            budget_changed = budgetID is not None and budgetID != currBudgetID
-            bank_changed = bankID and bankID != currBankID
-            type_changed = transactionType and transactionType != currTransactionType
-            amount_changed = transactionAmount is not None and transactionAmount != currTransactionAmount
-
-            # Revert Old Data If Change
-            if budget_changed or bank_changed or goal_changed or amount_changed or type_changed:
-                if currGoalID:
-                    adjust_goal_balance(currGoalID, currTransactionType, -currTransactionAmount)
-                if currBankID:
-                    adjust_bank_balance(currBankID, currTransactionType, -currTransactionAmount)
-                if currBudgetID:
-                    adjust_exclusive_budget_balance(currBudgetID, currTransactionType, -currTransactionAmount)
-                adjust_inclusive_budgets(userID, currTransactionCategory, currTransactionType, -currTransactionAmount)
-
-            if transactionTitle:
-                transaction.transactionTitle = transactionTitle
-            if transactionDesc:
-                transaction.transactionDesc = transactionDesc
-            if transactionType:
-                transaction.transactionType = transactionType
-            if transactionCategory:
-                transaction.transactionCategory = CategoryService.get_category(transactionCategory)
-            if transactionAmount is not None:
-                transaction.transactionAmount = transactionAmount
-            if transactionDate:
-                transaction.transactionDate = convert_to_date(transactionDate)
-            if transactionTime:
-                transaction.transactionTime = convert_to_time(transactionTime)
-            if voided is not None:
-                transaction.voided = voided
-            if budgetID is not None:
-                transaction.budgetID = budgetID
-            else:
-                transaction.budgetID = None
-            if bankID:
-                transaction.bankID = bankID
-            if goalID is not None:
-                transaction.goalID = goalID
-            else:
-                transaction.goalID = None
-            db.session.commit()
-
-            if (amount_changed or type_changed) and not budget_changed and not bank_changed and not goal_changed:
-                adjust_goal_balance(transaction.goalID, transaction.transactionType, transaction.transactionAmount)
-                adjust_bank_balance(transaction.bankID, transaction.transactionType, transaction.transactionAmount)
-                adjust_exclusive_budget_balance(transaction.budgetID, transaction.transactionType, transaction.transactionAmount)
-
-            elif budget_changed or bank_changed or goal_changed:
-                adjust_goal_balance(transaction.goalID, transaction.transactionType, transaction.transactionAmount)
-                adjust_bank_balance(transaction.bankID, transaction.transactionType, transaction.transactionAmount)
-                adjust_exclusive_budget_balance(transaction.budgetID, transaction.transactionType, transaction.transactionAmount)
-
-            adjust_inclusive_budgets(userID, transaction.transactionCategory, transaction.transactionType, transaction.transactionAmount)
-
-            print(f"Transaction With ID {transactionID} Updated Successfully.")
-            return transaction
-        return None
+        old_state = transaction_state(transaction)
+        new_state = dict(old_state)
+        if transactionType:
+            new_state['transactionType'] = normalize_transaction_type(transactionType)
+        if transactionAmount is not None:
+            new_state['transactionAmount'] = transactionAmount
+        if transactionCategory:
+            new_state['transactionCategory'] = CategoryService.get_category(transactionCategory)
+        if bankID:
+            new_state['bankID'] = bankID
+        if budgetID is not UNCHANGED:
+            new_state['budgetID'] = budgetID
+        if goalID is not UNCHANGED:
+            new_state['goalID'] = goalID
+
+        if new_state != old_state:
+            inclusive_budgets = []
+            if old_state['transactionCategory'] or new_state['transactionCategory']:
+                inclusive_budgets = db.session.execute(
+                    select(Budget.budgetID, Budget.budgetCategory)
+                    .where(Budget.circleID == transaction.circleID, Budget.transactionScope == TransactionScope.INCLUSIVE)
+                ).all()
+
+            old_effects = transaction_effects(old_state, inclusive_budgets)
+            new_effects = transaction_effects(new_state, inclusive_budgets)
+            for model, (column, not_found_message, insufficient_message) in BALANCE_TARGETS.items():
+                deltas = {
+                    entityID: new_effects[model].get(entityID, 0) - old_effects[model].get(entityID, 0)
+                    for entityID in new_effects[model].keys() | old_effects[model].keys()
+                }
+                apply_balance_deltas(model, column, deltas, not_found_message, insufficient_message)
+
+        if transactionTitle:
+            transaction.transactionTitle = transactionTitle
+        if transactionDesc:
+            transaction.transactionDesc = transactionDesc
+        if transactionDate:
+            transaction.transactionDate = convert_to_date(transactionDate)
+        if transactionTime:
+            transaction.transactionTime = convert_to_time(transactionTime)
+        if voided is not None:
+            transaction.voided = voided
+        transaction.transactionType = new_state['transactionType']
+        transaction.transactionAmount = new_state['transactionAmount']
+        transaction.transactionCategory = new_state['transactionCategory']
+        transaction.bankID = new_state['bankID']
+        transaction.budgetID = new_state['budgetID']
+        transaction.goalID = new_state['goalID']
+        transaction.refresh_fingerprint()
+        bump_circle_version(transaction.circleID)
+        db.session.commit()
+
+        print(f"Transaction With ID {transactionID} Updated Successfully.")
+        return transaction
 
     except Exception as e:
         db.session.rollback()
@@ -247,6 +407,7 @@ def void_transaction(userID, transactionID):
             return None
 
         transaction.voided = True
+        bump_circle_version(transaction.circleID)
         db.session.commit()
 
     except Exception as e:
@@ -254,82 +415,99 @@ def void_transaction(userID, transactionID):
         print(f"Failed To Void Transaction: {e}")
         return None
 
-# Adjusts Goal Balance Based On Transaction Type (Income/Expense)
-def adjust_goal_balance(goalID, transactionType, transactionAmount):
-    if goalID:
-        goal = get_goal(goalID)
-        if not goal:
-            raise ValueError("Goal Not Found")
+TRANSACTION_TYPES = {
+    **{member.name.lower(): member for member in TransactionType},
+    **{member.value.lower(): member for member in TransactionType}
+}
+
+# Accepts The Enum, Its Value ("Expense") Or Its Name ("EXPENSE")
+def normalize_transaction_type(transactionType):
+    if isinstance(transactionType, TransactionType):
+        return transactionType
+    member = TRANSACTION_TYPES.get(str(transactionType).strip().lower())
+    if member is None:
+        raise ValueError(f"Invalid Transaction Type: {transactionType}")
+    return member
+
+# +1 For Income, -1 For Expense
+def transaction_factor(transactionType):
+    return 1 if normalize_transaction_type(transactionType) is TransactionType.INCOME else -1
+
+# Loaded Copies Would Otherwise Keep The Pre-UPDATE Balance For The Rest Of The Session
+def expire_balances(model, attribute):
+    for instance in list(db.session.identity_map.values()):
+        if isinstance(instance, model):
+            db.session.expire(instance, [attribute])
+
+# Applies Balance Changes As Conditional UPDATEs | Concurrent Posts Can't Lose Updates, And Rows That
+# Would Go Negative Are Simply Not Matched - So Only The Failure Path Needs To Read Them
+# Rows Sharing A Delta Go Out In One Statement, In Key Order To Keep Lock Ordering Consistent
+def apply_balance_deltas(model, column, deltas, not_found_message, insufficient_message):
+    primary_key = model.__mapper__.primary_key[0]
+    by_delta = {}
+    for entityID in sorted(deltas):
+        if deltas[entityID]:
+            by_delta.setdefault(deltas[entityID], []).append(entityID)
+
+    for delta, entityIDs in by_delta.items():
+        result = db.session.execute(
+            update(model)
+            .where(primary_key.in_(entityIDs), column + delta >= 0)
+            .values({column.key: column + delta})
+            .execution_options(synchronize_session=False)
+        )
+        expire_balances(model, column.key)
 
-        transaction_type_str = str(transactionType).lower() if isinstance(transactionType, str) else transactionType.value.lower()
+        if result.rowcount != len(entityIDs):
+            found = db.session.scalar(select(func.count()).select_from(model).where(primary_key.in_(entityIDs)))
+            raise ValueError(not_found_message if found != len(entityIDs) else insufficient_message)
 
-        factor = 1 if transaction_type_str == TransactionType.INCOME.value.lower() else -1
-        goal.currentAmount += factor * transactionAmount
+def apply_balance_delta(model, column, entityID, delta, not_found_message, insufficient_message):
+    apply_balance_deltas(model, column, {entityID: delta}, not_found_message, insufficient_message)
 
-        # Handle Insufficient Goal Balance
-        if goal.currentAmount < 0:
-            raise ValueError("Insufficient Goal Balance")
-        db.session.commit()
+# Adjusts Goal Balance Based On Transaction Type (Income/Expense)
+def adjust_goal_balance(goalID, transactionType, transactionAmount):
+    if goalID:
+        delta = transaction_factor(transactionType) * transactionAmount
+        apply_balance_delta(Goal, Goal.currentAmount, goalID, delta, "Goal Not Found", "Insufficient Goal Balance")
 
 # Adjusts Bank Balance Based On Transaction Type (Income/Expense)
 def adjust_bank_balance(bankID, transactionType, transactionAmount):
-    bank = get_bank(bankID)
-    if not bank:
-        raise ValueError("Bank Not Found")
-
-    transaction_type_str = str(transactionType).lower() if isinstance(transactionType, str) else transactionType.value.lower()
-
-    factor = 1 if transaction_type_str == TransactionType.INCOME.value.lower() else -1
-    bank.remainingBankAmount += factor * transactionAmount
-
-
-    # Handle Insufficient Bank Balance
-    if bank.remainingBankAmount < 0:
-        raise ValueError("Insufficient Bank Balance")
-    db.session.commit()
+    delta = transaction_factor(transactionType) * transactionAmount
+    apply_balance_delta(Bank, Bank.remainingBankAmount, bankID, delta, "Bank Not Found", "Insufficient Bank Balance")
 
 # Adjusts Exclusive Budget Balance Based On Transaction Type (Income/Expense)
 def adjust_exclusive_budget_balance(budgetID, transactionType, transactionAmount):
     if budgetID:
-        budget = get_budget(budgetID)
-        if not budget:
-            raise ValueError("Budget Not Found")
-
-        transaction_type_str = str(transactionType).lower() if isinstance(transactionType, str) else transactionType.value.lower()
-
-        factor = 1 if transaction_type_str == TransactionType.INCOME.value.lower() else -1
-        budget.remainingBudgetAmount += factor * transactionAmount
-
-        # Handle Insufficient Budget Balance
-        if budget.remainingBudgetAmount < 0:
-            raise ValueError("Insufficient Budget Balance")
-        db.session.commit()
+        delta = transaction_factor(transactionType) * transactionAmount
+        apply_balance_delta(Budget, Budget.remainingBudgetAmount, budgetID, delta, "Budget Not Found", "Insufficient Budget Balance")
 
 # Adjusts Inclusive Budget Balance Based On Transaction Type (Income/Expense)
+# Every Matching Budget Is Updated By One Statement - If Fewer Rows Change Than Match, One Would Have Gone Negative
 def adjust_inclusive_budgets(circleID, transactionCategory, transactionType, transactionAmount):
     try:
-        from App.controllers.circle import get_circle_budgets_json
-        user_circles_json = get_circle_budgets_json(circleID)
-
-        for user_circle in user_circles_json:
-            inclusive_budget = get_budget(user_circle['budgetID'])
-            if inclusive_budget and inclusive_budget.transactionScope.value == TransactionScope.INCLUSIVE.value:
-
-                # Rather Do This Here Than In Frontend
-                normalized_budget_categories = [category.lower() for category in inclusive_budget.budgetCategory]
-                normalized_transaction_categories = [category.lower() for category in transactionCategory]
-
-                if any(cat in normalized_budget_categories for cat in normalized_transaction_categories):
-                    transaction_type_str = str(transactionType).lower() if isinstance(transactionType, str) else transactionType.value.lower()
-
-                    if transaction_type_str == TransactionType.INCOME.value.lower():
-                        inclusive_budget.remainingBudgetAmount += transactionAmount
-                    else:
-                        inclusive_budget.remainingBudgetAmount -= transactionAmount
+        categories = CategoryService.get_category(transactionCategory) if transactionCategory else []
+        if not categories:
+            return
+
+        delta = transaction_factor(transactionType) * transactionAmount
+        criteria = (
+            Budget.circleID == circleID,
+            Budget.transactionScope == TransactionScope.INCLUSIVE,
+            category_overlap(Budget.budgetCategory, categories)
+        )
+        result = db.session.execute(
+            update(Budget)
+            .where(*criteria, Budget.remainingBudgetAmount + delta >= 0)
+            .values(remainingBudgetAmount=Budget.remainingBudgetAmount + delta)
+            .execution_options(synchronize_session=False)
+        )
+        expire_balances(Budget, 'remainingBudgetAmount')
 
-                    if inclusive_budget.remainingBudgetAmount < 0:
-                        raise ValueError("Insufficient Budget Balance in Inclusive Budget")
-        db.session.commit()
+        if delta < 0:
+            matched = db.session.scalar(select(func.count()).select_from(Budget).where(*criteria))
+            if result.rowcount < matched:
+                raise ValueError("Insufficient Budget Balance in Inclusive Budget")
 
     except Exception as e:
         db.session.rollback()
@@ -0,0 +1,69 @@
+import io
+import csv
+import json
+from sqlalchemy import select
+from App.database import db
+from App.models import Transaction
+from App.controllers.transactionImport import IMPORT_COLUMNS, CSV_CATEGORY_SEPARATOR
+
+# Rows Fetched Per Round Trip From The Server-Side Cursor (And Written Per Response Chunk)
+EXPORT_BATCH_SIZE = 1000
+
+# Import Columns Plus The Row's Identity & Void Flag - Imports Ignore transactionID & Skip Voided Rows
+EXPORT_COLUMNS = ('transactionID', *IMPORT_COLUMNS, 'voided')
+
+EXPORT_MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+# Streams The Circle's Rows In Batches | yield_per Opens A Server-Side Cursor Where The Driver Supports One
+def iter_export_batches(circleID, batch_size=EXPORT_BATCH_SIZE):
+    statement = (
+        select(*[getattr(Transaction, column) for column in EXPORT_COLUMNS])
+        .where(Transaction.circleID == circleID)
+        .order_by(Transaction.transactionID)
+        .execution_options(yield_per=batch_size)
+    )
+    yield from db.session.execute(statement).partitions()
+
+# Selected Row -> Plain Values In The Shape import_transactions Reads Back
+def export_record(row):
+    record = row._asdict()
+    record['transactionType'] = row.transactionType.name if row.transactionType else None
+    record['transactionDate'] = row.transactionDate.isoformat() if row.transactionDate else None
+    record['transactionTime'] = row.transactionTime.isoformat() if row.transactionTime else None
+    return record
+
+def write_csv(circleID, batch_size=EXPORT_BATCH_SIZE):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # The Header Goes Out Before The First Query So Clients See Bytes Immediately
+    writer.writerow(EXPORT_COLUMNS)
+    yield buffer.getvalue()
+
+    for batch in iter_export_batches(circleID, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        for row in batch:
+            record = export_record(row)
+            record['transactionCategory'] = CSV_CATEGORY_SEPARATOR.join(record['transactionCategory'] or [])
+            writer.writerow([record[column] for column in EXPORT_COLUMNS])
+        yield buffer.getvalue()
+
+def write_ndjson(circleID, batch_size=EXPORT_BATCH_SIZE):
+    for batch in iter_export_batches(circleID, batch_size):
+        yield "".join(json.dumps(export_record(row)) + "\n" for row in batch)
+
+EXPORT_WRITERS = {
+    'csv': write_csv,
+    'ndjson': write_ndjson
+}
+
+# Returns (Chunk Generator, Mimetype) For A Circle's Transactions | Nothing Is Queried Until The Generator Is Consumed
+def export_circle_transactions(circleID, export_format="csv", batch_size=EXPORT_BATCH_SIZE):
+    writer = EXPORT_WRITERS.get(export_format)
+    if not writer:
+        raise ValueError(f"Unsupported Export Format: {export_format}")
+    return writer(circleID, batch_size), EXPORT_MIMETYPES[export_format]
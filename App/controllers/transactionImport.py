@@ -0,0 +1,256 @@
+import io
+import csv
+import gzip
+import json
+import math
+from sqlalchemy import insert, select
+from App.database import db
+from App.models import Transaction, UserTransaction, Bank, Budget, Goal, TransactionScope, User
+from App.services.category import CategoryService
+from App.services.datetime import parse_iso_date, parse_iso_time
+from App.services.fingerprint import transaction_fingerprint
+from App.controllers.circleVersion import bump_circle_version
+from App.controllers.transaction import (
+    normalize_transaction_type,
+    find_duplicate_transactions,
+    transaction_effects,
+    apply_balance_deltas,
+    BALANCE_TARGETS
+)
+
+# Rows Inserted, Balanced & Committed Together
+IMPORT_CHUNK_SIZE = 1000
+
+# Column Order Shared By CSV Imports & Exports | Categories Are "|"-Separated In CSV
+IMPORT_COLUMNS = (
+    'transactionTitle',
+    'transactionDesc',
+    'transactionType',
+    'transactionCategory',
+    'transactionAmount',
+    'transactionDate',
+    'transactionTime',
+    'bankID',
+    'budgetID',
+    'goalID'
+)
+CSV_CATEGORY_SEPARATOR = "|"
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Wraps A Binary Stream, Transparently Inflating gzip (Detected From The Magic Bytes)
+def open_import_stream(stream):
+    if not hasattr(stream, 'peek'):
+        stream = io.BufferedReader(stream)
+    if stream.peek(2)[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=stream)
+    return stream
+
+# Yields (Line Number, Raw Row) Pairs - Malformed Lines Are Yielded As Exceptions So One Bad Line Doesn't Stop The Import
+def read_ndjson(stream):
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("Each Line Must Be A JSON Object")
+            yield line_number, row
+        except ValueError as e:
+            yield line_number, e
+
+def read_csv(stream):
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    for row in reader:
+        category = row.get('transactionCategory')
+        row['transactionCategory'] = [value for value in category.split(CSV_CATEGORY_SEPARATOR) if value] if category else None
+        yield reader.line_num, row
+
+IMPORT_READERS = {
+    'ndjson': read_ndjson,
+    'csv': read_csv
+}
+
+def optional_id(value):
+    if value is None or value == "":
+        return None
+    return int(value)
+
+# Exports Carry A voided Column ("True" In CSV) - Voided Rows Are History, Not Balance Movements
+def is_voided_row(row):
+    voided = row.get('voided')
+    if isinstance(voided, str):
+        return voided.strip().lower() in ('true', '1')
+    return bool(voided)
+
+# Raw Row -> Insert Values | Raises ValueError With A Message Fit For The Import Report
+def parse_import_row(row, circleID, entities, categories):
+    title = (row.get('transactionTitle') or "").strip()
+    if not title:
+        raise ValueError("Missing transactionTitle")
+
+    try:
+        amount = float(row.get('transactionAmount'))
+    except (TypeError, ValueError):
+        amount = None
+    if not amount or not math.isfinite(amount) or amount <= 0:
+        raise ValueError("Invalid Transaction Amount")
+
+    if not row.get('transactionDate') or not row.get('transactionTime'):
+        raise ValueError("Missing transactionDate Or transactionTime")
+
+    bankID = optional_id(row.get('bankID'))
+    if bankID not in entities[Bank]:
+        raise ValueError(f"Bank {bankID} Not Found In Circle")
+
+    budgetID = optional_id(row.get('budgetID'))
+    if budgetID is not None and budgetID not in entities[Budget]:
+        raise ValueError(f"Budget {budgetID} Not Found In Circle")
+
+    goalID = optional_id(row.get('goalID'))
+    if goalID is not None and goalID not in entities[Goal]:
+        raise ValueError(f"Goal {goalID} Not Found In Circle")
+
+    # Imports Repeat A Handful Of Category Lists, So Each Distinct One Is Resolved Once
+    category = row.get('transactionCategory')
+    if isinstance(category, str):
+        category = [category]
+    if category:
+        key = tuple(category)
+        if key not in categories:
+            categories[key] = CategoryService.get_category(category)
+        category = list(categories[key])
+
+    transactionDate = parse_iso_date(row.get('transactionDate'))
+    transactionTime = parse_iso_time(row.get('transactionTime'))
+
+    return {
+        'transactionTitle': title,
+        'transactionDesc': row.get('transactionDesc') or None,
+        'transactionType': normalize_transaction_type(row.get('transactionType')),
+        'transactionCategory': category or None,
+        'transactionAmount': amount,
+        'transactionDate': transactionDate,
+        'transactionTime': transactionTime,
+        'voided': False,
+        'bankID': bankID,
+        'budgetID': budgetID,
+        'goalID': goalID,
+        'circleID': circleID,
+        'transactionFingerprint': transaction_fingerprint(title, amount, transactionDate, transactionTime, bankID)
+    }
+
+# Drops Rows Already Posted To The Circle, Or Imported Earlier In This File | One Indexed IN Lookup Per Chunk
+def split_duplicates(chunk, lines, circleID, imported):
+    existing = find_duplicate_transactions(circleID, [row['transactionFingerprint'] for row in chunk])
+    kept, kept_lines, duplicates = [], [], []
+    chunk_fingerprints = set()
+    for row, line in zip(chunk, lines):
+        fingerprint = row['transactionFingerprint']
+        if fingerprint in existing or fingerprint in imported or fingerprint in chunk_fingerprints:
+            duplicates.append({"line": line, "transactionTitle": row['transactionTitle']})
+            continue
+        chunk_fingerprints.add(fingerprint)
+        kept.append(row)
+        kept_lines.append(line)
+    return kept, kept_lines, duplicates
+
+# IDs A Row May Reference, Plus The Inclusive Budgets Its Categories May Count Towards - Loaded Once Per Import
+def load_import_entities(circleID):
+    return {
+        Bank: set(db.session.scalars(select(Bank.bankID).where(Bank.circleID == circleID))),
+        Budget: set(db.session.scalars(select(Budget.budgetID).where(Budget.circleID == circleID))),
+        Goal: set(db.session.scalars(select(Goal.goalID).where(Goal.circleID == circleID))),
+        'inclusive_budgets': db.session.execute(
+            select(Budget.budgetID, Budget.budgetCategory)
+            .where(Budget.circleID == circleID, Budget.transactionScope == TransactionScope.INCLUSIVE)
+        ).all()
+    }
+
+# Every Row In An Import Is Linked To The Same User, So The IDs Are Needed But Not Their Order -
+# Leaving Order Unconstrained Lets Many Rows Share Each INSERT .. RETURNING, And Inserting Into
+# The Table (Not The Mapped Class) Skips Per-Row ORM Bookkeeping
+def insert_transactions(rows):
+    if db.engine.dialect.insert_executemany_returning:
+        return db.session.execute(insert(Transaction.__table__).returning(Transaction.transactionID), rows).scalars().all()
+
+    # Drivers Without executemany RETURNING Fall Back To One Statement Per Row
+    return [db.session.execute(insert(Transaction.__table__).values(**row)).inserted_primary_key[0] for row in rows]
+
+# Inserts One Chunk & Applies Its Aggregated Balance Deltas | One Commit Per Chunk
+def import_chunk(rows, userID, entities):
+    try:
+        totals = {model: {} for model in BALANCE_TARGETS}
+        for row in rows:
+            for model, effects in transaction_effects(row, entities['inclusive_budgets']).items():
+                model_totals = totals[model]
+                for entityID, delta in effects.items():
+                    model_totals[entityID] = model_totals.get(entityID, 0) + delta
+
+        for model, (column, not_found_message, insufficient_message) in BALANCE_TARGETS.items():
+            apply_balance_deltas(model, column, totals[model], not_found_message, insufficient_message)
+
+        transactionIDs = insert_transactions(rows)
+        db.session.execute(
+            insert(UserTransaction.__table__),
+            [{'userID': userID, 'transactionID': transactionID} for transactionID in transactionIDs]
+        )
+        bump_circle_version(*{row['circleID'] for row in rows})
+        db.session.commit()
+        return None
+
+    except Exception as e:
+        db.session.rollback()
+        return str(e)
+
+# Import NDJSON / CSV (Optionally gzip) Into The User's Active Circle
+def import_transactions(stream, userID, import_format="ndjson", chunk_size=IMPORT_CHUNK_SIZE, allow_duplicates=False):
+    reader = IMPORT_READERS.get(import_format)
+    if not reader:
+        raise ValueError(f"Unsupported Import Format: {import_format}")
+
+    user = db.session.get(User, userID)
+    if not user or not user.activeCircleID:
+        raise ValueError("User Has No Active Circle")
+
+    circleID = user.activeCircleID
+    entities = load_import_entities(circleID)
+    categories = {}
+    report = {"imported": 0, "failed": [], "duplicates": [], "voided": [], "chunks": 0}
+    imported = set()
+
+    def flush(chunk, lines):
+        if not allow_duplicates:
+            chunk, lines, duplicates = split_duplicates(chunk, lines, circleID, imported)
+            report["duplicates"].extend(duplicates)
+            if not chunk:
+                return
+        error = import_chunk(chunk, userID, entities)
+        report["chunks"] += 1
+        if error:
+            report["failed"].extend({"line": line, "error": error} for line in lines)
+        else:
+            report["imported"] += len(chunk)
+            imported.update(row['transactionFingerprint'] for row in chunk)
+
+    chunk, lines = [], []
+    for line_number, row in reader(open_import_stream(stream)):
+        try:
+            if isinstance(row, Exception):
+                raise row
+            if is_voided_row(row):
+                report["voided"].append({"line": line_number, "transactionTitle": row.get('transactionTitle')})
+                continue
+            chunk.append(parse_import_row(row, circleID, entities, categories))
+            lines.append(line_number)
+        except (TypeError, ValueError, KeyError) as e:
+            report["failed"].append({"line": line_number, "error": str(e)})
+            continue
+
+        if len(chunk) >= chunk_size:
+            flush(chunk, lines)
+            chunk, lines = [], []
+
+    if chunk:
+        flush(chunk, lines)
+    return report
@@ -1,5 +1,6 @@
 from App.models import User, Circle
 from App.database import db
+from App.controllers.circleVersion import bump_user_circle_versions
 
 # Create A New User
 def create_user(name, email, password):
@@ -52,6 +53,9 @@ def update_user(userID, newName=None, newEmail=None, newPassword=None):
         user = get_user(userID)
 
         if user:
+            # Names, Emails & Active Circles Are Part Of Every Member List - Their Circles' Tags Must Move
+            if newName or newEmail:
+                bump_user_circle_versions(userID)
             if newName:
                 user.name = newName
             if newEmail:
@@ -75,6 +79,7 @@ def set_active_circle(userID, circleID):
 
     if user and circle:
         user.activeCircleID = circle.circleID
+        bump_user_circle_versions(userID)
         db.session.commit()
 
 def get_active_circle(userID):
@@ -1,5 +1,7 @@
+from flask import g, has_request_context
 from App.database import db
-from App.models import UserBank
+from App.models import Bank, UserBank
+from App.services.currency import DEFAULT_CURRENCY
 
 # Associates A User With A Bank
 def create_user_bank(userID, bankID):
@@ -34,6 +36,27 @@ def get_bank_users_json(bankID):
         print(f"Error Fetching Users For Bank {bankID}: {e}")
         return []
 
+# Resolves The Primary Bank Currency For Each Owner In One Query
+# Results Are Kept For The Rest Of The Request So Each Owner Is Looked Up At Most Once
+def get_primary_bank_currencies(userIDs):
+    resolved = g.setdefault('primary_bank_currencies', {}) if has_request_context() else {}
+    missing = {userID for userID in userIDs if userID not in resolved}
+
+    if missing:
+        rows = (
+            db.session.query(UserBank.userID, Bank.bankCurrency)
+            .join(Bank, Bank.bankID == UserBank.bankID)
+            .filter(UserBank.userID.in_(missing), Bank.isPrimary == True)
+            .order_by(UserBank.userBankID)
+            .all()
+        )
+        for userID, bankCurrency in rows:
+            resolved.setdefault(userID, bankCurrency)
+        for userID in missing:
+            resolved.setdefault(userID, DEFAULT_CURRENCY)
+
+    return {userID: resolved[userID] for userID in userIDs}
+
 # Verifies Whether The User Is The Creator Of The Bank
 def is_bank_owner(currentUserID, bankID):
     user_bank = UserBank.query.filter_by(bankID=bankID).order_by(UserBank.userBankID).first()
@@ -1,5 +1,5 @@
 from App.database import db
-from App.models import UserBudget
+from App.models import Budget, UserBudget
 
 # Associates A User With A Budget
 def create_user_budget(userID, budgetID):
@@ -15,10 +15,17 @@ def create_user_budget(userID, budgetID):
         return None
 
 # Retrieves All Budgets Associated With A User
-def get_user_budgets_json(userID):
+def get_user_budgets_json(userID, fields=None):
     try:
-        user_budgets = UserBudget.query.filter_by(userID=userID).all()
-        return [user_budget.budget.get_json() for user_budget in user_budgets] if user_budgets else []
+        from App.controllers.budget import budget_list_query, get_budgets_json
+        budgets = (
+            budget_list_query(fields=fields)
+            .join(UserBudget, UserBudget.budgetID == Budget.budgetID)
+            .filter(UserBudget.userID == userID)
+            .order_by(UserBudget.userBudgetID)
+            .all()
+        )
+        return get_budgets_json(budgets, fields)
 
     except Exception as e:
         print(f"Error Fetching Budgets For User {userID}: {e}")
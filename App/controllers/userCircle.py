@@ -1,6 +1,9 @@
+from sqlalchemy.orm import joinedload
 from App.database import db
+from App.services.fields import to_json
 from App.models import UserCircle
 from App.models.circle import Circle
+from App.controllers.circleVersion import bump_circle_version
 
 # Associates A User With A Circle
 def create_user_circle(userID, circleID):
@@ -16,10 +19,17 @@ def create_user_circle(userID, circleID):
         return None
 
 # Retrieves All Circles Associated With A User
-def get_user_circles_json(userID):
+def get_user_circles_json(userID, fields=None, version=1):
     try:
-        user_circles = UserCircle.query.filter_by(userID=userID).all()
-        return [user_circle.circle.get_json() for user_circle in user_circles] if user_circles else []
+        from App.controllers.circle import circle_list_query
+        circles = (
+            circle_list_query(fields=fields, version=version)
+            .join(UserCircle, UserCircle.circleID == Circle.circleID)
+            .filter(UserCircle.userID == userID)
+            .order_by(UserCircle.userCircleID)
+            .all()
+        )
+        return [to_json(circle, fields, version) for circle in circles]
 
     except Exception as e:
         print(f"Error Fetching Circles For User {userID}: {e}")
@@ -32,10 +42,14 @@ def is_circle_owner(currentUserID, circleID):
         return True
     return False
 
+# Verifies Whether The User Belongs To The Circle
+def is_circle_member(userID, circleID):
+    return UserCircle.query.filter_by(userID=userID, circleID=circleID).first() is not None
+
 # Retrieves All Users Associated With A Circle
 def get_circle_users_json(circleID):
     try:
-        circle_users = UserCircle.query.filter_by(circleID=circleID).all()
+        circle_users = UserCircle.query.options(joinedload(UserCircle.user)).filter_by(circleID=circleID).order_by(UserCircle.userCircleID).all()
         return [circle_user.user.get_json() for circle_user in circle_users] if circle_users else []
 
     except Exception as e:
@@ -57,6 +71,8 @@ def add_to_circle(circleCode, userID):
             return {"status": "error", "message": "User is already a member of this circle."}
 
         create_user_circle(userID, circle.circleID)
+        bump_circle_version(circle.circleID)
+        db.session.commit()
         print(f"User Successfully Added To Circle: {circle.circleName}")
         
         return {"status": "success", "message": f"User successfully added to circle: {circle.circleName}"}
@@ -83,6 +99,7 @@ def remove_from_circle(circleCode, userID):
             return {"status": "error", "message": "User is not a member of this circle."}
 
         db.session.delete(user_circle)
+        bump_circle_version(circle.circleID)
         db.session.commit()
         print(f"User Successfully Removed From Circle: {circle.circleName}")
 
@@ -1,5 +1,5 @@
 from App.database import db
-from App.models import UserGoal
+from App.models import Goal, UserGoal
 
 # Associates A User With A Goal
 def create_user_goal(userID, goalID):
@@ -15,10 +15,17 @@ def create_user_goal(userID, goalID):
         return None
 
 # Retrieves All Goals Associated With A User
-def get_user_goals_json(userID):
+def get_user_goals_json(userID, fields=None):
     try:
-        user_goals = UserGoal.query.filter_by(userID=userID).all()
-        return [user_goal.goal.get_json() for user_goal in user_goals] if user_goals else []
+        from App.controllers.goal import goal_list_query, get_goals_json
+        goals = (
+            goal_list_query(fields=fields)
+            .join(UserGoal, UserGoal.goalID == Goal.goalID)
+            .filter(UserGoal.userID == userID)
+            .order_by(UserGoal.userGoalID)
+            .all()
+        )
+        return get_goals_json(goals, fields)
 
     except Exception as e:
         print(f"Error Fetching Goals For User {userID}: {e}")
@@ -1,5 +1,5 @@
 from App.database import db
-from App.models import UserTransaction
+from App.models import Transaction, UserTransaction
 
 # Associates A User With A Transaction
 def create_user_transaction(userID, transactionID):
@@ -17,8 +17,15 @@ def create_user_transaction(userID, transactionID):
 # Retrieves All Transactions Associated With A User
 def get_user_transactions_json(userID):
     try:
-        user_transactions = UserTransaction.query.filter_by(userID=userID).all()
-        return [user_transaction.transaction.get_json() for user_transaction in user_transactions] if user_transactions else []
+        from App.controllers.transaction import transaction_list_query
+        transactions = (
+            transaction_list_query()
+            .join(UserTransaction, UserTransaction.transactionID == Transaction.transactionID)
+            .filter(UserTransaction.userID == userID)
+            .order_by(UserTransaction.userTransactionID)
+            .all()
+        )
+        return [transaction.get_json() for transaction in transactions]
 
     except Exception as e:
         print(f"Error Fetching Transactions For User {userID}: {e}")
@@ -7,6 +7,9 @@ from werkzeug.utils import secure_filename
 from werkzeug.datastructures import  FileStorage
 from App.database import init_db
 from App.config import load_config
+from App.services.jsonProvider import setup_json
+from App.services.cache import setup_cache
+from App.services.coalesce import setup_coalescing
 
 from flask_jwt_extended import (
     JWTManager,
@@ -31,6 +34,9 @@ def add_views(app):
 def create_app(overrides={}):
     app = Flask(__name__)
     load_config(app, overrides)
+    setup_json(app)
+    setup_cache(app)
+    setup_coalescing(app)
     CORS(app)
     add_auth_context(app)
     photos = UploadSet('photos', TEXT + DOCUMENTS + IMAGES)
@@ -1,9 +1,15 @@
 from App.database import db
 from App.services.currency import CurrencyService
+from App.services.fields import select_fields
 
 class Bank(db.Model):
     __tablename__='bank'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_bank_circle_primary', 'circleID', 'isPrimary'),
+    )
+
     # Attributes
     bankID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     bankTitle = db.Column(db.String(120), nullable=False)
@@ -19,7 +25,7 @@ class Bank(db.Model):
     # Relationships
     circle = db.relationship('Circle', backref='banks', lazy=True) # 1 Circle -> Many Banks
     budgets = db.relationship('Budget', back_populates='banks', cascade='all, delete-orphan')
-    user_banks = db.relationship('UserBank', back_populates='bank') # UserBanks
+    user_banks = db.relationship('UserBank', back_populates='bank', order_by='UserBank.userBankID') # UserBanks
 
     def __init__(self, bankTitle, bankCurrency, bankAmount, remainingBankAmount, isPrimary, color, circleID):
         self.circleID = circleID
@@ -30,24 +36,48 @@ class Bank(db.Model):
         self.isPrimary = isPrimary
         self.color = color
 
-    def get_json(self):
-        balance = CurrencyService.format_currency(self.bankAmount, self.bankCurrency)
-        remainingBalance = CurrencyService.format_currency(self.remainingBankAmount, self.bankCurrency)
+    # Read-Only Columns Served From Reference Rows (See App.services.cache) | Balances Excluded
+    REFERENCE_COLUMNS = ('bankID', 'bankTitle', 'bankCurrency', 'bankAmount', 'isPrimary', 'color', 'circleID')
+
+    # Serializable Fields, In Response Order
+    JSON_FIELDS = {
+        'bankID': lambda bank: bank.bankID,
+        'bankTitle': lambda bank: bank.bankTitle,
+        'bankCurrency': lambda bank: bank.bankCurrency,
+        'bankAmount': lambda bank: CurrencyService.format_currency(bank.bankAmount, bank.bankCurrency),
+        'remainingBankAmount': lambda bank: CurrencyService.format_currency(bank.remainingBankAmount, bank.bankCurrency),
+        'isPrimary': lambda bank: bank.isPrimary,
+        'color': lambda bank: bank.color,
+        'owner': lambda bank: bank.user_banks[0].user.name
+    }
+
+    # v1 Amount Fields As (Amount, Currency) Getters - Lists Format Each Currency's Amounts Together
+    AMOUNT_COLUMNS = {
+        'bankAmount': (lambda bank: bank.bankAmount, lambda bank: bank.bankCurrency),
+        'remainingBankAmount': (lambda bank: bank.remainingBankAmount, lambda bank: bank.bankCurrency)
+    }
+
+    # v2 Wire Schema | Raw Amounts With A Currency Code & Owner IDs
+    JSON_FIELDS_V2 = {
+        'bankID': lambda bank: bank.bankID,
+        'bankTitle': lambda bank: bank.bankTitle,
+        'currency': lambda bank: bank.bankCurrency,
+        'bankAmount': lambda bank: bank.bankAmount,
+        'remainingBankAmount': lambda bank: bank.remainingBankAmount,
+        'isPrimary': lambda bank: bool(bank.isPrimary),
+        'color': lambda bank: bank.color,
+        'circleID': lambda bank: bank.circleID,
+        'ownerID': lambda bank: bank.user_banks[0].userID
+    }
+
+    def get_json(self, fields=None):
+        return select_fields(self, self.JSON_FIELDS, fields)
 
-        return {
-            'bankID': self.bankID,
-            'bankTitle': self.bankTitle,
-            'bankCurrency': self.bankCurrency,
-            'bankAmount': balance,
-            'remainingBankAmount': remainingBalance,
-            'isPrimary': self.isPrimary,
-            'color': self.color,
-            'owner': self.user_banks[0].user.name
-        }
+    def get_json_v2(self, fields=None):
+        return select_fields(self, self.JSON_FIELDS_V2, fields)
 
     def __str__(self):
-        balance = CurrencyService.format_currency(self.bankAmount, self.bankCurrency)
-        remainingBalance = CurrencyService.format_currency(self.remainingBankAmount, self.bankCurrency)
+        balance, remainingBalance = CurrencyService.format_many([self.bankAmount, self.remainingBankAmount], self.bankCurrency)
 
         return (
             f"Bank ID: {self.bankID}, Title: {self.bankTitle}, "
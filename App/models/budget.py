@@ -5,7 +5,8 @@ from App.models.bank import Bank
 from App.models.userBank import UserBank
 from App.models.userBudget import UserBudget
 from sqlalchemy.ext.mutable import MutableList
-from App.services.currency import CurrencyService
+from App.services.currency import CurrencyService, DEFAULT_CURRENCY
+from App.services.fields import select_fields, wants_any
 from App.services.datetime import convert_to_date
 
 class BudgetType(enum.Enum):
@@ -19,6 +20,12 @@ class TransactionScope(enum.Enum):
 class Budget(db.Model):
     __tablename__='budget'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_budget_circle', 'circleID'),
+        db.Index('ix_budget_bank', 'bankID'),
+    )
+
     # Attributes
     budgetID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     budgetTitle = db.Column(db.String(120), nullable=False)
@@ -38,7 +45,7 @@ class Budget(db.Model):
     # Relationships
     circle = db.relationship('Circle', backref='budgets', lazy=True) # 1 Circle -> Many Budgets
     banks = db.relationship('Bank', back_populates='budgets')
-    user_budgets = db.relationship('UserBudget', back_populates='budget') # UserBudget
+    user_budgets = db.relationship('UserBudget', back_populates='budget', order_by='UserBudget.userBudgetID') # UserBudget
 
     def __init__(self, budgetTitle, budgetAmount, remainingBudgetAmount, budgetType, budgetCategory, transactionScope, startDate, endDate, bankID, circleID, color):
         self.circleID = circleID
@@ -53,7 +60,7 @@ class Budget(db.Model):
         self.endDate = convert_to_date(endDate)
         self.color = color
 
-    def get_json(self):
+    def get_currency(self):
         main_bank = None
         user_budget = UserBudget.query.filter_by(budgetID=self.budgetID).first()
         if user_budget:
@@ -62,25 +69,67 @@ class Budget(db.Model):
             user_bank = UserBank.query.filter_by(userID=userID).join(Bank).filter(Bank.isPrimary == True).first()
             if user_bank:
                 main_bank = user_bank.bank
-        bank_currency = main_bank.bankCurrency if main_bank else "TTD"
-
-        amount = CurrencyService.format_currency(self.budgetAmount, bank_currency)
-        remainingAmount = CurrencyService.format_currency(self.remainingBudgetAmount, bank_currency)
-
-        return{
-            'budgetID': self.budgetID,
-            'budgetTitle': self.budgetTitle,
-            'budgetAmount': amount,
-            'remainingBudgetAmount': remainingAmount,
-            'budgetType': self.budgetType.value,
-            'budgetCategory': self.budgetCategory,
-            'transactionScope': self.transactionScope.value,
-            'startDate': self.startDate.strftime("%a, %d %b %Y"),
-            'endDate': self.endDate.strftime("%a, %d %b %Y"),
-            'bankID': self.bankID,
-            'color': self.color,
-            'owner': self.user_budgets[0].user.name
-        }
+        return main_bank.bankCurrency if main_bank else DEFAULT_CURRENCY
+
+    def get_owner_id(self):
+        return self.user_budgets[0].userID if self.user_budgets else None
+
+    # Read-Only Columns Served From Reference Rows (See App.services.cache) | Balances Excluded
+    REFERENCE_COLUMNS = ('budgetID', 'budgetTitle', 'budgetAmount', 'budgetType', 'budgetCategory', 'transactionScope', 'startDate', 'endDate', 'bankID', 'color', 'circleID')
+
+    # Serializable Fields, In Response Order | Getters Take (budget, currency)
+    JSON_FIELDS = {
+        'budgetID': lambda budget, currency: budget.budgetID,
+        'budgetTitle': lambda budget, currency: budget.budgetTitle,
+        'budgetAmount': lambda budget, currency: CurrencyService.format_currency(budget.budgetAmount, currency),
+        'remainingBudgetAmount': lambda budget, currency: CurrencyService.format_currency(budget.remainingBudgetAmount, currency),
+        'budgetType': lambda budget, currency: budget.budgetType.value,
+        'budgetCategory': lambda budget, currency: budget.budgetCategory,
+        'transactionScope': lambda budget, currency: budget.transactionScope.value,
+        'startDate': lambda budget, currency: budget.startDate.strftime("%a, %d %b %Y"),
+        'endDate': lambda budget, currency: budget.endDate.strftime("%a, %d %b %Y"),
+        'bankID': lambda budget, currency: budget.bankID,
+        'color': lambda budget, currency: budget.color,
+        'owner': lambda budget, currency: budget.user_budgets[0].user.name
+    }
+
+    # v1 Amount Fields As (Amount, Currency) Getters - Lists Format Each Currency's Amounts Together
+    AMOUNT_COLUMNS = {
+        'budgetAmount': (lambda budget, currency: budget.budgetAmount, lambda budget, currency: currency),
+        'remainingBudgetAmount': (lambda budget, currency: budget.remainingBudgetAmount, lambda budget, currency: currency)
+    }
+
+    # v2 Wire Schema | Raw Amounts With A Currency Code, ISO Dates & Owner IDs
+    JSON_FIELDS_V2 = {
+        'budgetID': lambda budget, currency: budget.budgetID,
+        'budgetTitle': lambda budget, currency: budget.budgetTitle,
+        'budgetAmount': lambda budget, currency: budget.budgetAmount,
+        'remainingBudgetAmount': lambda budget, currency: budget.remainingBudgetAmount,
+        'currency': lambda budget, currency: currency,
+        'budgetType': lambda budget, currency: budget.budgetType.name,
+        'budgetCategory': lambda budget, currency: budget.budgetCategory,
+        'transactionScope': lambda budget, currency: budget.transactionScope.name,
+        'startDate': lambda budget, currency: budget.startDate,
+        'endDate': lambda budget, currency: budget.endDate,
+        'bankID': lambda budget, currency: budget.bankID,
+        'color': lambda budget, currency: budget.color,
+        'ownerID': lambda budget, currency: budget.get_owner_id()
+    }
+
+    # Fields That Need The Owner's Currency
+    CURRENCY_FIELDS = frozenset({'budgetAmount', 'remainingBudgetAmount'})
+    CURRENCY_FIELDS_V2 = frozenset({'currency'})
+
+    # Currency Can Be Supplied By The Caller (See get_budgets_json) To Skip The Per-Row Lookup
+    def get_json(self, currency=None, fields=None):
+        if currency is None and wants_any(fields, self.CURRENCY_FIELDS):
+            currency = self.get_currency()
+        return select_fields(self, self.JSON_FIELDS, fields, currency)
+
+    def get_json_v2(self, currency=None, fields=None):
+        if currency is None and wants_any(fields, self.CURRENCY_FIELDS_V2):
+            currency = self.get_currency()
+        return select_fields(self, self.JSON_FIELDS_V2, fields, currency)
 
     def __str__(self):
         amount = CurrencyService.format_currency(self.budgetAmount, self.banks.bankCurrency)
@@ -1,6 +1,7 @@
 import enum
 import secrets  # To Generate A Random Code
 from App.database import db
+from App.services.fields import select_fields
 
 class CircleType(enum.Enum):
     # Circle Name Would Be Set To  "Self" In Frontend - Upon Self Option Being Choosen
@@ -18,9 +19,11 @@ class Circle(db.Model):
     circleColor = db.Column(db.String(120), nullable=False)
     circleImage = db.Column(db.String(255), nullable=False)
     circleCode = db.Column(db.String(120), nullable=False, unique=True)
+    # Bumped By Every Change To The Circle's Data - GET Endpoints Derive Their ETags From It
+    circleVersion = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     # Relationships
-    user_circles = db.relationship('UserCircle', back_populates='circle') # UserCircle
+    user_circles = db.relationship('UserCircle', back_populates='circle', order_by='UserCircle.userCircleID') # UserCircle
 
     def __init__(self, circleName, circleType, circleColor, circleImage):
         self.circleName = circleName
@@ -34,16 +37,33 @@ class Circle(db.Model):
         return f"{self.circleName[:3].upper()}-{secrets.token_hex(4)}"
 
 
-    def get_json(self):
-        return{
-            'circleID': self.circleID,
-            'circleName': self.circleName,
-            'circleType': self.circleType.value,
-            'circleColor': self.circleColor,
-            'circleImage': self.circleImage,
-            'circleCode': self.circleCode,
-            'owner': self.user_circles[0].user.name
-        }
+    # Serializable Fields, In Response Order
+    JSON_FIELDS = {
+        'circleID': lambda circle: circle.circleID,
+        'circleName': lambda circle: circle.circleName,
+        'circleType': lambda circle: circle.circleType.value,
+        'circleColor': lambda circle: circle.circleColor,
+        'circleImage': lambda circle: circle.circleImage,
+        'circleCode': lambda circle: circle.circleCode,
+        'owner': lambda circle: circle.user_circles[0].user.name
+    }
+
+    # v2 Wire Schema | Enum Names & Owner IDs
+    JSON_FIELDS_V2 = {
+        'circleID': lambda circle: circle.circleID,
+        'circleName': lambda circle: circle.circleName,
+        'circleType': lambda circle: circle.circleType.name,
+        'circleColor': lambda circle: circle.circleColor,
+        'circleImage': lambda circle: circle.circleImage,
+        'circleCode': lambda circle: circle.circleCode,
+        'ownerID': lambda circle: circle.user_circles[0].userID
+    }
+
+    def get_json(self, fields=None):
+        return select_fields(self, self.JSON_FIELDS, fields)
+
+    def get_json_v2(self, fields=None):
+        return select_fields(self, self.JSON_FIELDS_V2, fields)
 
     def __str__(self):
         return f"{self.circleName}- {self.circleType.value} | ({self.circleColor})"
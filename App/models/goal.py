@@ -3,7 +3,8 @@ from App.database import db
 from App.models.bank import Bank
 from App.models.userBank import UserBank
 from App.models.userGoal import UserGoal
-from App.services.currency import CurrencyService
+from App.services.currency import CurrencyService, DEFAULT_CURRENCY
+from App.services.fields import select_fields, wants_any
 from App.services.datetime import convert_to_date
 
 class GoalType(enum.Enum):
@@ -13,6 +14,11 @@ class GoalType(enum.Enum):
 class Goal(db.Model):
     __tablename__='goal'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_goal_circle', 'circleID'),
+    )
+
     # Attributes
     goalID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     goalTitle = db.Column(db.String(120), nullable=False)
@@ -27,7 +33,7 @@ class Goal(db.Model):
     circleID = db.Column(db.Integer, db.ForeignKey('circle.circleID'), nullable=False)
 
     # Relationships
-    user_goals = db.relationship('UserGoal', back_populates='goal') # UserGoal
+    user_goals = db.relationship('UserGoal', back_populates='goal', order_by='UserGoal.userGoalID') # UserGoal
     circle = db.relationship('Circle', backref='goals', lazy=True) # 1 Circle -> Many Goals
 
     def __init__(self, goalTitle, targetAmount, currentAmount, goalType, startDate, endDate, circleID, color):
@@ -47,7 +53,7 @@ class Goal(db.Model):
         else:
             self.currentAmount = currentAmount
 
-    def get_json(self):
+    def get_currency(self):
         main_bank = None
         user_goal = UserGoal.query.filter_by(goalID=self.goalID).first()
 
@@ -56,35 +62,64 @@ class Goal(db.Model):
             user_bank = UserBank.query.filter_by(userID=userID).join(Bank).filter(Bank.isPrimary == True).first()
             if user_bank:
                 main_bank = user_bank.bank
-        bank_currency = main_bank.bankCurrency if main_bank else "TTD"
-
-        targetAmount = CurrencyService.format_currency(self.targetAmount, bank_currency)
-        currentAmount = CurrencyService.format_currency(self.currentAmount, bank_currency)
-
-        return{
-            'goalID': self.goalID,
-            'goalTitle': self.goalTitle,
-            'targetAmount': targetAmount,
-            'currentAmount': currentAmount,
-            'goalType': self.goalType.value,
-            'startDate': self.startDate.strftime("%a, %d %b %Y"),
-            'endDate': self.endDate.strftime("%a, %d %b %Y"),
-            'color': self.color,
-            'owner': self.user_goals[0].user.name
-        }
+        return main_bank.bankCurrency if main_bank else DEFAULT_CURRENCY
+
+    def get_owner_id(self):
+        return self.user_goals[0].userID if self.user_goals else None
+
+    # Read-Only Columns Served From Reference Rows (See App.services.cache) | Balances Excluded
+    REFERENCE_COLUMNS = ('goalID', 'goalTitle', 'targetAmount', 'goalType', 'startDate', 'endDate', 'color', 'circleID')
+
+    # Serializable Fields, In Response Order | Getters Take (goal, currency)
+    JSON_FIELDS = {
+        'goalID': lambda goal, currency: goal.goalID,
+        'goalTitle': lambda goal, currency: goal.goalTitle,
+        'targetAmount': lambda goal, currency: CurrencyService.format_currency(goal.targetAmount, currency),
+        'currentAmount': lambda goal, currency: CurrencyService.format_currency(goal.currentAmount, currency),
+        'goalType': lambda goal, currency: goal.goalType.value,
+        'startDate': lambda goal, currency: goal.startDate.strftime("%a, %d %b %Y"),
+        'endDate': lambda goal, currency: goal.endDate.strftime("%a, %d %b %Y"),
+        'color': lambda goal, currency: goal.color,
+        'owner': lambda goal, currency: goal.user_goals[0].user.name
+    }
+
+    # v1 Amount Fields As (Amount, Currency) Getters - Lists Format Each Currency's Amounts Together
+    AMOUNT_COLUMNS = {
+        'targetAmount': (lambda goal, currency: goal.targetAmount, lambda goal, currency: currency),
+        'currentAmount': (lambda goal, currency: goal.currentAmount, lambda goal, currency: currency)
+    }
+
+    # v2 Wire Schema | Raw Amounts With A Currency Code, ISO Dates & Owner IDs
+    JSON_FIELDS_V2 = {
+        'goalID': lambda goal, currency: goal.goalID,
+        'goalTitle': lambda goal, currency: goal.goalTitle,
+        'targetAmount': lambda goal, currency: goal.targetAmount,
+        'currentAmount': lambda goal, currency: goal.currentAmount,
+        'currency': lambda goal, currency: currency,
+        'goalType': lambda goal, currency: goal.goalType.name,
+        'startDate': lambda goal, currency: goal.startDate,
+        'endDate': lambda goal, currency: goal.endDate,
+        'color': lambda goal, currency: goal.color,
+        'ownerID': lambda goal, currency: goal.get_owner_id()
+    }
+
+    # Fields That Need The Owner's Currency
+    CURRENCY_FIELDS = frozenset({'targetAmount', 'currentAmount'})
+    CURRENCY_FIELDS_V2 = frozenset({'currency'})
+
+    # Currency Can Be Supplied By The Caller (See get_goals_json) To Skip The Per-Row Lookup
+    def get_json(self, currency=None, fields=None):
+        if currency is None and wants_any(fields, self.CURRENCY_FIELDS):
+            currency = self.get_currency()
+        return select_fields(self, self.JSON_FIELDS, fields, currency)
+
+    def get_json_v2(self, currency=None, fields=None):
+        if currency is None and wants_any(fields, self.CURRENCY_FIELDS_V2):
+            currency = self.get_currency()
+        return select_fields(self, self.JSON_FIELDS_V2, fields, currency)
 
     def __str__(self):
-        main_bank = None
-        user_goal = UserGoal.query.filter_by(goalID=self.goalID).first()
-
-        if user_goal:
-            userID = user_goal.userID
-            user_bank = UserBank.query.filter_by(userID=userID).join(Bank).filter(Bank.isPrimary == True).first()
-            if user_bank:
-                main_bank = user_bank.bank
-        bank_currency = main_bank.bankCurrency if main_bank else "TTD"
-
-        targetAmount = CurrencyService.format_currency(self.targetAmount, bank_currency)
+        targetAmount = CurrencyService.format_currency(self.targetAmount, self.get_currency())
         return f"{self.goalTitle} ({self.goalType.value} | {targetAmount}) (Start: {self.startDate}, End: {self.endDate})"
 
     def __repr__(self):
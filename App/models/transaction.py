@@ -1,9 +1,13 @@
 import enum
+from datetime import datetime
 from App.database import db
 from sqlalchemy import types
 from sqlalchemy.ext.mutable import MutableList
 from App.services.currency import CurrencyService
+from App.services.cache import related_reference
+from App.services.fields import select_fields
 from App.services.datetime import convert_to_date, convert_to_time
+from App.services.fingerprint import transaction_fingerprint
 
 class TransactionType(enum.Enum):
     INCOME = "Income"
@@ -12,6 +16,15 @@ class TransactionType(enum.Enum):
 class Transaction(db.Model):
     __tablename__='transaction'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_transaction_circle_date', 'circleID', 'transactionDate', 'transactionTime', 'transactionID'),
+        db.Index('ix_transaction_bank_date', 'bankID', 'transactionDate', 'transactionTime', 'transactionID'),
+        db.Index('ix_transaction_budget_date', 'budgetID', 'transactionDate', 'transactionTime', 'transactionID'),
+        db.Index('ix_transaction_goal_date', 'goalID', 'transactionDate', 'transactionTime', 'transactionID'),
+        db.Index('ix_transaction_circle_fingerprint', 'circleID', 'transactionFingerprint'),
+    )
+
     # Attributes
     transactionID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     transactionTitle = db.Column(db.String(120), nullable=False)
@@ -22,6 +35,7 @@ class Transaction(db.Model):
     transactionDate = db.Column(db.Date, nullable=False)
     transactionTime = db.Column(db.Time, nullable=False)
     voided = db.Column(db.Boolean, default=False)
+    transactionFingerprint = db.Column(db.String(64), nullable=True)
 
     # Foreign Keys
     budgetID = db.Column(db.Integer, db.ForeignKey('budget.budgetID'), nullable=True)
@@ -34,7 +48,7 @@ class Transaction(db.Model):
     goal = db.relationship('Goal', backref='transactions', lazy=True) # 1 Goal -> Many Transactions
     bank = db.relationship('Bank', backref='transactions', lazy=True) # 1 Bank -> Many Transactions
     circle = db.relationship('Circle', backref='transactions', lazy=True) # 1 Circle -> Many Transactions
-    user_transactions = db.relationship('UserTransaction', back_populates='transaction') # UserTransaction
+    user_transactions = db.relationship('UserTransaction', back_populates='transaction', order_by='UserTransaction.userTransactionID') # UserTransaction
     attachments = db.relationship('TransactionAttachment', backref='transaction', cascade="all, delete-orphan") # TransactionAttachments
 
     def __init__(self, transactionTitle, transactionDesc, transactionType, transactionCategory, transactionAmount, transactionDate, transactionTime, attachments, circleID, bankID, goalID=None, budgetID=None):
@@ -50,28 +64,66 @@ class Transaction(db.Model):
         self.transactionDate = convert_to_date(transactionDate)
         self.transactionTime = convert_to_time(transactionTime)
         self.attachments = attachments if attachments else []
+        self.refresh_fingerprint()
+
+    # Must Be Called Whenever Title, Amount, Date, Time Or Bank Change
+    def refresh_fingerprint(self):
+        self.transactionFingerprint = transaction_fingerprint(
+            self.transactionTitle, self.transactionAmount, self.transactionDate, self.transactionTime, self.bankID
+        )
+
+    # Serializable Fields, In Response Order
+    JSON_FIELDS = {
+        'transactionID': lambda transaction: transaction.transactionID,
+        'transactionTitle': lambda transaction: transaction.transactionTitle,
+        'transactionDescription': lambda transaction: transaction.transactionDesc,
+        'transactionType': lambda transaction: transaction.transactionType.value,
+        'transactionCategory': lambda transaction: transaction.transactionCategory,
+        'transactionAmount': lambda transaction: CurrencyService.format_currency(transaction.transactionAmount, transaction.get_bank_currency()),
+        'transactionDate': lambda transaction: transaction.transactionDate.strftime("%a, %b %d %Y"),
+        'transactionTime': lambda transaction: transaction.transactionTime.strftime("%H:%M"),
+        'transactionBank': lambda transaction: transaction.bankID,
+        'transactionBudget': lambda transaction: transaction.budgetID,
+        'transactionGoal': lambda transaction: transaction.goalID,
+        'attachments': lambda transaction: [attachment.get_json() for attachment in transaction.attachments],
+        'owner': lambda transaction: transaction.user_transactions[0].user.name
+    }
+
+    # v1 Amount Fields As (Amount, Currency) Getters - Lists Format Each Currency's Amounts Together
+    AMOUNT_COLUMNS = {
+        'transactionAmount': (lambda transaction: transaction.transactionAmount, lambda transaction: transaction.get_bank_currency())
+    }
+
+    # v2 Wire Schema | Raw Amounts With A Currency Code, ISO Timestamps & Owner IDs
+    JSON_FIELDS_V2 = {
+        'transactionID': lambda transaction: transaction.transactionID,
+        'transactionTitle': lambda transaction: transaction.transactionTitle,
+        'transactionDescription': lambda transaction: transaction.transactionDesc,
+        'transactionType': lambda transaction: transaction.transactionType.name,
+        'transactionCategory': lambda transaction: transaction.transactionCategory,
+        'transactionAmount': lambda transaction: transaction.transactionAmount,
+        'currency': lambda transaction: transaction.get_bank_currency(),
+        'transactionAt': lambda transaction: datetime.combine(transaction.transactionDate, transaction.transactionTime),
+        'bankID': lambda transaction: transaction.bankID,
+        'budgetID': lambda transaction: transaction.budgetID,
+        'goalID': lambda transaction: transaction.goalID,
+        'voided': lambda transaction: bool(transaction.voided),
+        'attachments': lambda transaction: [attachment.get_json_v2() for attachment in transaction.attachments],
+        'ownerID': lambda transaction: transaction.user_transactions[0].userID
+    }
+
+    # Off The Bank When It's Loaded, Else Its Reference Row - So A Just-Committed Transaction Doesn't Reload Its Bank
+    def get_bank_currency(self):
+        return related_reference(self, 'bank').bankCurrency
 
-    def get_json(self):
-        amount = CurrencyService.format_currency(self.transactionAmount, self.bank.bankCurrency)
+    def get_json(self, fields=None):
+        return select_fields(self, self.JSON_FIELDS, fields)
 
-        return {
-            'transactionID': self.transactionID,
-            'transactionTitle': self.transactionTitle,
-            'transactionDescription': self.transactionDesc,
-            'transactionType': self.transactionType.value,
-            'transactionCategory': self.transactionCategory,
-            'transactionAmount': amount,
-            'transactionDate': self.transactionDate.strftime("%a, %b %d %Y"),
-            'transactionTime': self.transactionTime.strftime("%H:%M"),
-            'transactionBank': self.bankID,
-            'transactionBudget': self.budgetID,
-            'transactionGoal': self.goalID,
-            'attachments': [attachment.get_json() for attachment in self.attachments],
-            'owner': self.user_transactions[0].user.name
-        }
+    def get_json_v2(self, fields=None):
+        return select_fields(self, self.JSON_FIELDS_V2, fields)
         
     def __str__(self):
-        amount = CurrencyService.format_currency(self.transactionAmount, self.bank.bankCurrency)
+        amount = CurrencyService.format_currency(self.transactionAmount, self.get_bank_currency())
         return f"{self.transactionTitle} ({self.transactionType.value} | {self.transactionCategory}): {amount} on {self.transactionDate} at {self.transactionTime}"
 
     def __repr__(self):
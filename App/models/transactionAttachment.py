@@ -4,6 +4,11 @@ from App.database import db
 class TransactionAttachment(db.Model):
     __tablename__ = 'transactionAttachment'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_transactionAttachment_transaction', 'transactionID'),
+    )
+
     attachmentID = db.Column(db.Integer, primary_key=True)
     transactionID = db.Column(db.Integer, db.ForeignKey('transaction.transactionID'), nullable=False)
     fileName = db.Column(db.String(255), nullable=False)
@@ -23,6 +28,17 @@ class TransactionAttachment(db.Model):
             'uploaded': self.uploadedAt.strftime("%Y-%m-%d %H:%M:%S")
         }
 
+    def get_json_v2(self):
+        return {
+            'attachmentID': self.attachmentID,
+            'transactionID': self.transactionID,
+            'fileName': self.fileName,
+            'fileSize': self.fileSize,
+            'fileType': self.fileType,
+            'fileUri': self.fileUri,
+            'uploadedAt': self.uploadedAt
+        }
+
     def __str__(self):
         return f"TransactionAttachment(attachmentID={self.attachmentID}, transactionID={self.transactionID}, fileName={self.fileName}, fileUri={self.fileUri})"
 
@@ -20,6 +20,9 @@ class User(db.Model, UserMixin):
     user_circles = db.relationship('UserCircle', back_populates='user') # UserCircle
     user_transactions = db.relationship('UserTransaction', back_populates='user') # UserTransaction
 
+    # Read-Only Columns Served From Reference Rows (See App.services.cache) | The Password Hash Is Never Cached
+    REFERENCE_COLUMNS = ('id', 'name', 'email', 'activeCircleID')
+
     def __init__(self, name, email, activeCircleID, password):
         self.name = name
         self.email = email
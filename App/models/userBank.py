@@ -3,6 +3,12 @@ from App.database import db
 class UserBank(db.Model):
     __tablename__='userBank'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_userBank_bank_user', 'bankID', 'userID'),
+        db.Index('ix_userBank_user_bank', 'userID', 'bankID'),
+    )
+
     # Attributes
     userBankID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     userID = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
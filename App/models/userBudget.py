@@ -3,6 +3,12 @@ from App.database import db
 class UserBudget(db.Model):
     __tablename__='userBudget'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_userBudget_budget_user', 'budgetID', 'userID'),
+        db.Index('ix_userBudget_user_budget', 'userID', 'budgetID'),
+    )
+
     # Attributes
     userBudgetID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     userID = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
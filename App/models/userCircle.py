@@ -3,6 +3,12 @@ from App.database import db
 class UserCircle(db.Model):
     __tablename__='userCircle'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_userCircle_circle_user', 'circleID', 'userID'),
+        db.Index('ix_userCircle_user_circle', 'userID', 'circleID'),
+    )
+
     # Attributes
     userCircleID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     userID = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -3,6 +3,12 @@ from App.database import db
 class UserGoal(db.Model):
     __tablename__='userGoal'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_userGoal_goal_user', 'goalID', 'userID'),
+        db.Index('ix_userGoal_user_goal', 'userID', 'goalID'),
+    )
+
     # Attributes
     userGoalID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     userID = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
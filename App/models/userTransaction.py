@@ -3,6 +3,12 @@ from App.database import db
 class UserTransaction(db.Model):
     __tablename__='userTransaction'
 
+    # Indexes
+    __table_args__ = (
+        db.Index('ix_userTransaction_transaction_user', 'transactionID', 'userTransactionID'),
+        db.Index('ix_userTransaction_user_transaction', 'userID', 'transactionID'),
+    )
+
     # Attributes
     userTransactionID = db.Column(db.Integer, primary_key=True, autoincrement=True)
     userID = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -0,0 +1,366 @@
+import os
+import time
+import pickle
+import sqlite3
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from flask import after_this_request, current_app, g, has_app_context, has_request_context
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from App.database import db
+
+try:
+    import redis
+except ImportError:  # redis Is Optional - Only The "redis" Backend Needs It
+    redis = None
+
+# Entity JSON Cache | get_json Output Of Banks, Budgets & Goals, Shared By Every Request (And, With A Shared Backend, Every Worker)
+# An Entry Is Only Fresh For The Circle Version It Was Built At, So Any Change To The Circle Makes It A Miss;
+# Rows Changed Through The ORM Are Also Dropped When Their Transaction Commits
+
+# Entries Are Pickled - Shared Stores Must Only Be Writable By The App
+class LRUCache:
+    """In-Process Cache | The Least Recently Used Entries Are Evicted Past max_entries"""
+
+    def __init__(self, max_entries=4096):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = {}
+        with self.lock:
+            for key in keys:
+                entry = self.entries.get(key)
+                if entry is None:
+                    continue
+                value, expires = entry
+                if expires is not None and expires < now:
+                    del self.entries[key]
+                    continue
+                self.entries.move_to_end(key)
+                found[key] = value
+        return found
+
+    def set_many(self, items, ttl=None):
+        expires = time.monotonic() + ttl if ttl else None
+        with self.lock:
+            for key, value in items.items():
+                self.entries[key] = (value, expires)
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete_many(self, keys):
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+# Entries Are Unpickled, So The Shared File Lives In A Directory Only The App's User Can Enter -
+# One Left Behind By Anyone Else (Or Opened Up To Them) Is Refused Rather Than Trusted
+def private_directory(base=None):
+    base = base or ("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir())
+    directory = os.path.join(base, f"ffm-cache-{os.getuid()}")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"Cache Directory {directory} Must Be Owned By This User With Mode 0700")
+    return directory
+
+class SharedMemoryCache:
+    """Cache Shared By Every Worker On The Host | A SQLite File Kept In /dev/shm (RAM) Where Available
+    An ENTITY_CACHE_PATH Must Likewise Sit In A Directory Only The App Can Write"""
+    PURGE_EVERY = 256
+
+    def __init__(self, path=None, max_entries=65536):
+        self.path = path or os.path.join(private_directory(), "entity-cache.sqlite")
+        self.max_entries = max_entries
+        self.local = threading.local()
+        self.writes = 0
+
+    # One Connection Per Thread, Reopened After A Fork (Gunicorn Workers Are Forked From The Master)
+    def connection(self):
+        pid = os.getpid()
+        if getattr(self.local, 'pid', None) != pid:
+            os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+            connection = sqlite3.connect(self.path, timeout=1, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)")
+            self.local.pid, self.local.connection = pid, connection
+        return self.local.connection
+
+    def get_many(self, keys):
+        keys = list(keys)
+        if not keys:
+            return {}
+        rows = self.connection().execute(
+            f"SELECT key, value FROM entries WHERE key IN ({', '.join('?' * len(keys))}) AND (expires IS NULL OR expires >= ?)",
+            [*keys, time.time()]
+        ).fetchall()
+        return {key: pickle.loads(value) for key, value in rows}
+
+    def set_many(self, items, ttl=None):
+        expires = time.time() + ttl if ttl else None
+        connection = self.connection()
+        connection.executemany(
+            "INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)",
+            [(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires) for key, value in items.items()]
+        )
+
+        # Expired Rows & Any Overflow Are Trimmed Every Few Hundred Writes, Not On Every One
+        self.writes += len(items)
+        if self.writes >= self.PURGE_EVERY:
+            self.writes = 0
+            connection.execute("DELETE FROM entries WHERE expires < ?", (time.time(),))
+            connection.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY expires LIMIT max(0, (SELECT count(*) FROM entries) - ?))",
+                (self.max_entries,)
+            )
+
+    def delete_many(self, keys):
+        self.connection().executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+
+    def clear(self):
+        self.connection().execute("DELETE FROM entries")
+
+class RedisCache:
+    """Cache Shared By Every Worker (And Host) Through Redis"""
+
+    def __init__(self, url="redis://localhost:6379/0", prefix="ffm:"):
+        if redis is None:
+            raise RuntimeError("ENTITY_CACHE Is redis But redis Is Not Installed")
+        self.client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get_many(self, keys):
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = self.client.mget([self.prefix + key for key in keys])
+        return {key: pickle.loads(value) for key, value in zip(keys, values) if value is not None}
+
+    def set_many(self, items, ttl=None):
+        pipeline = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipeline.set(self.prefix + key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=ttl)
+        pipeline.execute()
+
+    def delete_many(self, keys):
+        keys = [self.prefix + key for key in keys]
+        if keys:
+            self.client.delete(*keys)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+CACHE_BACKENDS = {
+    'lru': lambda config: LRUCache(config.get('ENTITY_CACHE_SIZE', 4096)),
+    'shared': lambda config: SharedMemoryCache(config.get('ENTITY_CACHE_PATH')),
+    'redis': lambda config: RedisCache(config.get('ENTITY_CACHE_URL', "redis://localhost:6379/0"))
+}
+
+# Serialization Schemas Cached Per Entity (API v1 & v2)
+SCHEMA_VERSIONS = (1, 2)
+
+class EntityCache:
+    """(entity, id, circle version) -> JSON | stale_seconds > 0 Serves Entries Left Behind By A Newer Circle Version
+    While They're Younger Than That, Refreshing Them Once The Response Is Sent"""
+
+    def __init__(self, backend, ttl=3600, stale_seconds=0):
+        self.backend = backend
+        self.ttl = ttl
+        self.stale_seconds = stale_seconds
+
+    @staticmethod
+    def key(entity, entityID, version=1):
+        return f"{entity}.v{version}:{entityID}"
+
+    # {id: circleVersion} -> ({id: json} Usable Now, [ids] Served Stale That Need A Refresh)
+    def get_many(self, entity, versions, version=1):
+        keys = {self.key(entity, entityID, version): entityID for entityID in versions}
+        found, stale = {}, []
+        now = time.time()
+        for key, (circleVersion, storedAt, value) in self.backend.get_many(keys).items():
+            entityID = keys[key]
+            if circleVersion == versions[entityID]:
+                found[entityID] = value
+            elif self.stale_seconds and now - storedAt <= self.stale_seconds:
+                found[entityID] = value
+                stale.append(entityID)
+        return found, stale
+
+    def set_many(self, entity, values, versions, version=1):
+        now = time.time()
+        self.backend.set_many(
+            {self.key(entity, entityID, version): (versions[entityID], now, value) for entityID, value in values.items()},
+            self.ttl
+        )
+
+    def invalidate(self, entities):
+        self.backend.delete_many([self.key(entity, entityID, version) for entity, entityID in entities for version in SCHEMA_VERSIONS])
+
+    # Recreated Databases Reuse IDs & Versions, So Nothing Built Against The Old One Can Stay
+    def clear(self):
+        self.backend.clear()
+
+def get_entity_cache():
+    return current_app.extensions.get('entity_cache') if has_app_context() else None
+
+# ENTITY_CACHE Config: "lru" (Default), "shared", "redis" Or "none"
+# REFERENCE_CACHE_TTL Config: Seconds Bank, Budget & Goal Reference Rows Are Shared Across Requests - 0 (Default) Keeps Them Per Request
+# USER_CACHE_TTL Config: The Same For User Rows (Default 60)
+def setup_cache(app):
+    name = app.config.get('ENTITY_CACHE', 'lru')
+    if name == 'none':
+        cache = None
+    elif name in CACHE_BACKENDS:
+        cache = EntityCache(
+            CACHE_BACKENDS[name](app.config),
+            ttl=app.config.get('ENTITY_CACHE_TTL', 3600),
+            stale_seconds=app.config.get('ENTITY_CACHE_STALE_SECONDS', 0)
+        )
+    else:
+        raise ValueError(f"Unknown Entity Cache: {name}")
+    app.extensions['entity_cache'] = cache
+
+    app.config.setdefault('REFERENCE_CACHE_TTL', 0)
+    app.config.setdefault('USER_CACHE_TTL', 60)
+    ttl_keys = ['REFERENCE_CACHE_TTL', *REFERENCE_TTL_CONFIG.values()]
+    app.extensions['reference_cache'] = LRUCache(app.config.get('REFERENCE_CACHE_SIZE', 4096)) if any(app.config[key] for key in ttl_keys) else None
+    return cache
+
+# Reference Rows | Snapshots Of The Columns Code Only Reads Off A Bank, Budget Or Goal (Currency, Title, Circle...),
+# Listed In Each Model's REFERENCE_COLUMNS - Balances Are Left Out, As They Move Through Conditional UPDATEs
+# That Never Reach The ORM Events Below
+# Request Tier: A Row Is Read At Most Once Per Request, Commits Included (flask.g Holds The Map)
+# Process Tier: With A TTL Set, Snapshots Are Also Shared By The Worker's Requests For That Long
+
+# Models Whose TTL Has Its Own Config Key - Others Use REFERENCE_CACHE_TTL
+REFERENCE_TTL_CONFIG = {'User': 'USER_CACHE_TTL'}
+
+def reference_ttl(entity):
+    return current_app.config.get(REFERENCE_TTL_CONFIG.get(entity, 'REFERENCE_CACHE_TTL'), 0)
+
+def get_reference_cache():
+    return current_app.extensions.get('reference_cache') if has_app_context() else None
+
+def reference_key(entity, entityID):
+    return f"{entity}:{entityID}"
+
+# Snapshot Row Of model's REFERENCE_COLUMNS, Or None When It Doesn't Exist
+def get_reference(model, entityID):
+    if entityID is None:
+        return None
+    key = reference_key(model.__name__, entityID)
+    rows = g.setdefault('reference_rows', {})
+    if key in rows:
+        return rows[key]
+
+    ttl = reference_ttl(model.__name__)
+    reference_cache = get_reference_cache() if ttl else None
+    found = reference_cache.get_many([key]) if reference_cache is not None else {}
+    if key in found:
+        row = found[key]
+    else:
+        row = db.session.execute(
+            select(*(getattr(model, column) for column in model.REFERENCE_COLUMNS))
+            .where(model.__mapper__.primary_key[0] == entityID)
+        ).one_or_none()
+        if row is not None and reference_cache is not None:
+            reference_cache.set_many({key: row}, ttl)
+    rows[key] = row
+    return row
+
+# instance.<relationship> When It's Already Loaded, Otherwise The Related Row's Reference Snapshot (Many-To-One Only)
+# Serializers Reading A Column Or Two Off A Related Row Skip Reloading It After Each Commit
+def related_reference(instance, relationship):
+    if relationship in instance.__dict__:
+        return getattr(instance, relationship)
+    prop = instance.__mapper__.relationships[relationship]
+    (column, _), = prop.local_remote_pairs
+    return get_reference(prop.mapper.class_, getattr(instance, column.key))
+
+def invalidate_references(entities):
+    keys = [reference_key(entity, entityID) for entity, entityID in entities]
+    rows = g.get('reference_rows', {})
+    for key in keys:
+        rows.pop(key, None)
+    reference_cache = get_reference_cache()
+    if reference_cache is not None:
+        reference_cache.delete_many(keys)
+
+def clear_references():
+    g.pop('reference_rows', None)
+    reference_cache = get_reference_cache()
+    if reference_cache is not None:
+        reference_cache.clear()
+
+# A Body Built From Stale Entries Belongs To An Older Circle Version, So conditional_view Must Not Tag It With The Current One
+def mark_served_stale():
+    g.served_stale = True
+
+def pop_served_stale():
+    return g.pop('served_stale', False)
+
+# Runs fn Once The Response Has Been Sent (Straight Away Outside A Request), In Its Own App Context
+def run_after_response(fn):
+    app = current_app._get_current_object()
+
+    def run():
+        with app.app_context():
+            try:
+                fn()
+            except Exception as e:
+                print(f"Deferred Task Failed: {e}")
+
+    if not has_request_context():
+        return run()
+
+    @after_this_request
+    def defer(response):
+        response.call_on_close(run)
+        return response
+
+# After-Commit Invalidation | ORM Changes To Cached Rows - Or Their Owner Links - Are Collected At Each Flush
+# And Dropped From Both Caches Once The Transaction Commits (Rolled Back Changes Are Forgotten)
+CACHED_ENTITIES = {
+    'Bank': ('Bank', 'bankID'),
+    'Budget': ('Budget', 'budgetID'),
+    'Goal': ('Goal', 'goalID'),
+    'User': ('User', 'id'),
+    'UserBank': ('Bank', 'bankID'),
+    'UserBudget': ('Budget', 'budgetID'),
+    'UserGoal': ('Goal', 'goalID')
+}
+
+@event.listens_for(Session, "after_flush")
+def collect_cache_changes(session, flush_context):
+    changes = session.info.setdefault('entity_cache_changes', set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        target = CACHED_ENTITIES.get(type(instance).__name__)
+        if target:
+            changes.add((target[0], getattr(instance, target[1])))
+
+@event.listens_for(Session, "after_commit")
+def invalidate_cache_changes(session):
+    changes = session.info.pop('entity_cache_changes', None)
+    if not changes or not has_app_context():
+        return
+    invalidate_references(changes)
+    cache = get_entity_cache()
+    if cache is not None:
+        cache.invalidate(changes)
+
+@event.listens_for(Session, "after_rollback")
+def discard_cache_changes(session):
+    session.info.pop('entity_cache_changes', None)
@@ -1,28 +1,70 @@
 import os
 import json
+import threading
+from types import MappingProxyType
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATEGORIES_PATH = os.path.join(BASE_DIR, '..', 'assets', 'static', 'categories.json')
+
+UNKNOWN_CATEGORY = "Unknown Category"
+
+class CategoryIndex:
+    """Immutable Lookup Tables Built Once From categories.json"""
+    __slots__ = ('categories', 'display_to_key')
+
+    def __init__(self, categories):
+        # Canonical Upper-Case Keys -> Display Names
+        self.categories = MappingProxyType({key.upper(): name for key, name in categories.items()})
+        # Case-Folded Display Names -> Canonical Keys
+        self.display_to_key = MappingProxyType({name.casefold(): key for key, name in self.categories.items()})
+
+    def get_key(self, value):
+        if not isinstance(value, str):
+            return None
+        key = value.strip().upper()
+        if key in self.categories:
+            return key
+        return self.display_to_key.get(value.strip().casefold())
+
+    def resolve(self, values):
+        categories = self.categories
+        get_key = self.get_key
+        result = []
+        for value in values:
+            key = get_key(value)
+            result.append(categories[key] if key else UNKNOWN_CATEGORY)
+        return result
 
 class CategoryService:
+    _index = None
+    _lock = threading.Lock()
 
     @staticmethod
     def load_transaction_categories():
-        with open(os.path.join(BASE_DIR, '..', 'assets', 'static', 'categories.json'), "r", encoding="utf-8") as file:
-            return json.load(file)
+        return dict(CategoryService.get_index().categories)
 
     @staticmethod
-    def get_category(category_key):
-        categories = CategoryService.load_transaction_categories()
+    def get_index():
+        index = CategoryService._index
+        if index is None:
+            with CategoryService._lock:
+                index = CategoryService._index
+                if index is None:
+                    with open(CATEGORIES_PATH, "r", encoding="utf-8") as file:
+                        index = CategoryIndex(json.load(file))
+                    CategoryService._index = index
+        return index
 
+    @staticmethod
+    def get_category_key(category):
+        return CategoryService.get_index().get_key(category)
+
+    @staticmethod
+    def get_categories(category_keys):
+        return CategoryService.get_index().resolve(category_keys)
+
+    @staticmethod
+    def get_category(category_key):
         if isinstance(category_key, list):
-            result = []
-            for key in category_key:
-                category = categories.get(key.upper())
-                if category:
-                    result.append(category)
-                else:
-                    result.append( "Unknown Category")
-            return result
-        else:
-            category = categories.get(category_key.upper())
-            return [category] if category else ["Unknown Category"]
\ No newline at end of file
+            return CategoryService.get_categories(category_key)
+        return CategoryService.get_categories([category_key])
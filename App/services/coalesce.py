@@ -0,0 +1,67 @@
+import threading
+from flask import current_app, has_app_context
+
+# Request Coalescing (Single-Flight) | Identical Reads Arriving While One Is Already Being Computed Wait For It
+# & Share Its Result Instead Of Running Again - Nothing Is Kept Once The Computation Finishes
+# threading's Lock & Event Are Swapped For Greenlet-Aware Ones When gevent Patches The Worker,
+# So The Same Code Coalesces Greenlets (Production) Or Threads
+
+class Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+class SingleFlight:
+    """key -> One In-Flight Computation | Counts Computations Run & Those Saved By Sharing One"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.computed = 0
+        self.coalesced = 0
+
+    # Returns (result, shared) - shared Is True When Another Caller's Computation Was Joined
+    # A Shared Result Is Handed To Every Waiter As Is, So It Must Not Be Mutated
+    def do(self, key, fn):
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                flight = self.flights[key] = Flight()
+                self.computed += 1
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+            return flight.result, False
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+
+    def stats(self):
+        with self.lock:
+            return {"computed": self.computed, "coalesced": self.coalesced, "inFlight": len(self.flights)}
+
+def get_single_flight():
+    return current_app.extensions.get('single_flight') if has_app_context() else None
+
+# COALESCE_REQUESTS Config: True (Default) Or False
+def setup_coalescing(app):
+    single_flight = SingleFlight() if app.config.get('COALESCE_REQUESTS', True) else None
+    app.extensions['single_flight'] = single_flight
+    return single_flight
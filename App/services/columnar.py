@@ -0,0 +1,42 @@
+from App.services.streaming import wants_stream
+
+# Columnar Encoding | One Array Per Field Instead Of One Object Per Row, So Each Key Name Is Sent Once
+# Dictionary Fields Hold Indexes Into A Shared List Of Their Distinct Values
+# Row i Is {field: columns[field][i]} - Or dictionaries[field][columns[field][i]] For A Dictionary Field
+
+RESPONSE_FORMATS = {"rows", "columnar"}
+
+# ?format=columnar Is Opt-In | Rows (One Object Per Transaction) Remain The Default
+def wants_columnar(args):
+    response_format = (args.get('format') or "rows").strip().lower()
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(f"Unknown Format: {response_format}")
+
+    # Columns Are Only Complete Once Every Row Is Read, So They Can't Be Sent Row By Row
+    if response_format == "columnar" and wants_stream(args):
+        raise ValueError("Columnar Responses Cannot Be Streamed")
+    return response_format == "columnar"
+
+# Lists (e.g. Categories) Aren't Hashable, So They're Matched As Tuples
+def dictionary_key(value):
+    return tuple(value) if isinstance(value, list) else value
+
+# Replaces Each Value With Its Index In The Distinct Values | Returns (indexes, distinct values)
+def encode_dictionary(values):
+    indexes, distinct, column = {}, [], []
+    for value in values:
+        key = dictionary_key(value)
+        index = indexes.get(key)
+        if index is None:
+            index = indexes[key] = len(distinct)
+            distinct.append(value)
+        column.append(index)
+    return column, distinct
+
+# {field: [value per row]} -> {"count": n, "columns": {field: [...]}, "dictionaries": {field: [...]}}
+def to_columnar(columns, count, dictionary_fields=frozenset()):
+    dictionaries = {}
+    for field, values in columns.items():
+        if field in dictionary_fields:
+            columns[field], dictionaries[field] = encode_dictionary(values)
+    return {"count": count, "columns": columns, "dictionaries": dictionaries}
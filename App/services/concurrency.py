@@ -0,0 +1,49 @@
+from flask import current_app
+from App.services.cache import mark_served_stale, pop_served_stale
+
+try:
+    from gevent import monkey
+    from gevent.pool import Pool
+except ImportError:  # gevent Only Ships With The Production (Gunicorn) Worker
+    monkey = Pool = None
+
+# Greenlets (And So Pooled Connections) One Request May Hold At Once
+MAX_CONCURRENT_SECTIONS = 4
+
+# Pure-Python Drivers Block On Sockets gevent Has Patched, So Their Queries Yield
+COOPERATIVE_DRIVERS = {'pymysql', 'pg8000'}
+
+# True When A Query On This Engine Lets Other Greenlets Run While It Waits On The Database
+def is_cooperative(engine):
+    if monkey is None or not monkey.is_module_patched('socket'):
+        return False
+
+    driver = engine.dialect.driver
+    if driver == 'psycopg2':
+        # psycopg2 Only Yields Once A Wait Callback Is Installed (e.g. psycogreen.gevent.patch_psycopg())
+        import psycopg2.extensions
+        return psycopg2.extensions.get_wait_callback() is not None
+    return driver in COOPERATIVE_DRIVERS
+
+# Runs Independent {name: callable} Sections & Returns {name: result}
+# Concurrently When The Driver Cooperates - Each Greenlet Gets Its Own App Context, So Its Own Session & Connection -
+# Otherwise One After Another On The Current Session
+def run_sections(sections, engine):
+    if not is_cooperative(engine):
+        return {name: section() for name, section in sections.items()}
+
+    app = current_app._get_current_object()
+
+    # A Section's g Ends With Its Context, So Whether It Served Stale Entries Comes Back With Its Result
+    def run(section):
+        with app.app_context():
+            return section(), pop_served_stale()
+
+    pool = Pool(MAX_CONCURRENT_SECTIONS)
+    greenlets = {name: pool.spawn(run, section) for name, section in sections.items()}
+    pool.join(raise_error=True)
+
+    results = {name: greenlet.value for name, greenlet in greenlets.items()}
+    if any(stale for _, stale in results.values()):
+        mark_served_stale()
+    return {name: result for name, (result, _) in results.items()}
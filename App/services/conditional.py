@@ -0,0 +1,71 @@
+import hashlib
+from functools import wraps
+from flask import current_app, make_response, request
+from flask_jwt_extended import get_jwt_identity
+from App.services.cache import pop_served_stale
+from App.services.coalesce import get_single_flight
+from App.services.streaming import wants_stream
+
+# Conditional GETs | A View Scoped To One Circle Gets A Weak ETag From The Circle's Version, So An Unchanged
+# Poll Is Answered With 304 After The Version Lookup Alone - Nothing Behind The View Is Queried Or Serialized
+
+# The Verified Caller Behind @jwt_required, Else None (Public Views)
+def caller_identity():
+    try:
+        return get_jwt_identity()
+    except RuntimeError:
+        return None
+
+# One Version Gives Different Bodies Per Path, Query (fields, limit, format...), Encoding & Caller -
+# Authenticated Views May Authorize Or Shape Their Body By Caller, So Callers Never Share A Tag Or A Flight
+def representation_key():
+    variant = f"{request.full_path}|{request.headers.get('Accept', '')}|{caller_identity()}"
+    return hashlib.sha256(variant.encode("utf-8")).hexdigest()[:16]
+
+# Runs The View | Returns (response, stale) - stale When Any Cached Entry Behind The Body Was Served Stale
+def render_view(view, args, kwargs):
+    pop_served_stale()
+    response = make_response(view(*args, **kwargs))
+    return response, pop_served_stale()
+
+# Concurrent Requests For One Representation Of One Version (Same ETag) Share A Single Run Of The View
+# Each Joiner Gets Its Own Copy Of The Body & Headers; Streamed Bodies Can Only Be Sent Once, So They Aren't Shared
+def coalesced_response(key, render):
+    single_flight = get_single_flight()
+    if single_flight is None or wants_stream(request.args):
+        return render()
+
+    def run():
+        response, stale = render()
+        return response, stale, (response.get_data(), response.status, response.headers.copy())
+
+    (response, stale, (body, status, headers)), shared = single_flight.do(key, run)
+    if not shared:
+        return response, stale
+    return current_app.response_class(body, status=status, headers=headers.copy()), stale
+
+# tag_of(**view_kwargs) Returns The Version Tag, Or None To Run The View Unconditionally
+def conditional_view(tag_of):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            tag = tag_of(**kwargs)
+            if tag is None:
+                return view(*args, **kwargs)
+
+            # Read Before The View Runs - A Change Landing Mid-Request Pairs The Old Tag With New Data,
+            # Which Costs One Extra 200 On The Next Poll But Never Hides The Change
+            etag = f"{tag}.{representation_key()}"
+            if request.if_none_match.contains_weak(etag):
+                response = make_response("", 304)
+            else:
+                # Stale Bodies Go Out Untagged, So The Next Poll Can't Be Answered 304 Until The Entries Are Refreshed
+                response, stale = coalesced_response(etag, lambda: render_view(view, args, kwargs))
+                if response.status_code != 200 or stale:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            response.cache_control.no_cache = True
+            return response
+        return wrapper
+    return decorator
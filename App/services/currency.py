@@ -1,33 +1,108 @@
 import os
 import json
+import time
+import threading
+from types import MappingProxyType
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CURRENCIES_PATH = os.path.join(BASE_DIR, '..', 'assets', 'static', 'currencies.json')
+
+# Currency Used When An Owner Has No Primary Bank
+DEFAULT_CURRENCY = "TTD"
+
+# How Often (In Seconds) The File's mtime Is Checked For Changes
+MTIME_CHECK_INTERVAL = 1.0
+
+class CurrencyFormatter:
+    """Precompiled Formatter For A Single Currency (Symbol + Decimal Digits)"""
+    __slots__ = ('code', 'symbol', 'decimal_digits', 'format')
+
+    def __init__(self, code, symbol, decimal_digits):
+        self.code = code
+        self.symbol = symbol
+        self.decimal_digits = decimal_digits
+        template = symbol.replace('{', '{{').replace('}', '}}') + '{:.%df}' % decimal_digits
+        self.format = template.format
+
+    def __call__(self, amount):
+        return self.format(amount)
+
+# Fallback For Unknown Currency Codes
+DEFAULT_FORMATTER = CurrencyFormatter(code=None, symbol="", decimal_digits=2)
+
+class CurrencyRegistry:
+    """Immutable Snapshot Of currencies.json, Shared By Every Request In The Worker"""
+    __slots__ = ('currencies', 'formatters', 'mtime')
+
+    def __init__(self, currencies, mtime):
+        self.currencies = MappingProxyType(currencies)
+        self.formatters = MappingProxyType({
+            code: CurrencyFormatter(
+                code=code,
+                symbol=currency.get("symbol", ""),
+                decimal_digits=currency.get("decimal_digits", 2)  # Fallback Default
+            )
+            for code, currency in currencies.items()
+        })
+        self.mtime = mtime
+
+    def get_formatter(self, currency_code):
+        if not currency_code:
+            return DEFAULT_FORMATTER
+        return self.formatters.get(currency_code.upper(), DEFAULT_FORMATTER)
 
 class CurrencyService:
+    _registry = None
+    _checked_at = 0.0
+    _lock = threading.Lock()
+
     @staticmethod
     def load_currencies():
-        with open(os.path.join(BASE_DIR, '..', 'assets', 'static', 'currencies.json'), "r", encoding="utf-8") as file:
+        with open(CURRENCIES_PATH, "r", encoding="utf-8") as file:
             return json.load(file)
 
+    @staticmethod
+    def get_registry():
+        registry = CurrencyService._registry
+        now = time.monotonic()
+
+        if registry is not None and now - CurrencyService._checked_at < MTIME_CHECK_INTERVAL:
+            return registry
+
+        # Only Reload When The File Has Actually Changed
+        mtime = os.stat(CURRENCIES_PATH).st_mtime_ns
+        if registry is None or registry.mtime != mtime:
+            with CurrencyService._lock:
+                registry = CurrencyService._registry
+                if registry is None or registry.mtime != mtime:
+                    registry = CurrencyRegistry(CurrencyService.load_currencies(), mtime)
+                    CurrencyService._registry = registry
+
+        CurrencyService._checked_at = now
+        return registry
+
     @staticmethod
     def fetch_currency(currency_code):
-        currencies = CurrencyService.load_currencies()
-        currency = currencies.get(currency_code.upper())
-        if currency:
-            return currency.get("symbol", "")
-        return ""
+        return CurrencyService.get_registry().get_formatter(currency_code).symbol
 
     @staticmethod
     def format_currency(amount, currency_code):
-        currencies = CurrencyService.load_currencies()
-        currency = currencies.get(currency_code.upper())
-
-        if currency:
-            symbol = currency.get("symbol", "")
-            decimal_digits = currency.get("decimal_digits", 2)  # Fallback Default
-        else:
-            symbol = ""
-            decimal_digits = 2  # Fallback Default
-
-        formatted_amount = f"{symbol}{amount:.{decimal_digits}f}"
-        return formatted_amount
+        return CurrencyService.get_registry().get_formatter(currency_code).format(amount)
+
+    @staticmethod
+    def format_many(amounts, currency_code):
+        format_amount = CurrencyService.get_registry().get_formatter(currency_code).format
+        return [format_amount(amount) for amount in amounts]
+
+    # amounts[i] In currency_codes[i] | Each Currency's Amounts Are Formatted Together With format_many
+    @staticmethod
+    def format_each(amounts, currency_codes):
+        groups = {}
+        for index, currency_code in enumerate(currency_codes):
+            groups.setdefault(currency_code, []).append(index)
+
+        formatted = [None] * len(amounts)
+        for currency_code, indexes in groups.items():
+            for index, value in zip(indexes, CurrencyService.format_many([amounts[index] for index in indexes], currency_code)):
+                formatted[index] = value
+        return formatted
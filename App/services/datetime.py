@@ -1,5 +1,5 @@
 # utils.py
-from datetime import datetime
+from datetime import date, datetime, time
 
 def convert_to_date(date_value):
     if isinstance(date_value, str):
@@ -10,3 +10,14 @@ def convert_to_time(time_value):
     if isinstance(time_value, str):
         return datetime.strptime(time_value, "%H:%M").time()
     return time_value 
+
+# ISO Fast Path For Bulk Work | fromisoformat Is Far Cheaper Than strptime Per Row
+def parse_iso_date(date_value):
+    if isinstance(date_value, str):
+        return date.fromisoformat(date_value.strip())
+    return date_value
+
+def parse_iso_time(time_value):
+    if isinstance(time_value, str):
+        return time.fromisoformat(time_value.strip())
+    return time_value
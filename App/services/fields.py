@@ -0,0 +1,67 @@
+from App.services.currency import CurrencyService
+
+# Sparse Fieldsets | ?fields=a,b Limits A Response To The Named Fields Of Each Model
+
+# Reads ?fields= Against A Model's JSON_FIELDS | None Means Every Field
+def parse_fields(args, allowed):
+    raw = args.get('fields')
+    if raw is None:
+        return None
+
+    fields = tuple(dict.fromkeys(field.strip() for field in raw.split(',') if field.strip()))
+    if not fields:
+        raise ValueError("No Fields Requested")
+
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown Field(s): {', '.join(unknown)}")
+    return fields
+
+# Serializes Only The Requested Fields - Unrequested Getters (And The Loads Behind Them) Never Run
+def select_fields(model, getters, fields=None, *args):
+    return {field: getters[field](model, *args) for field in (fields or getters)}
+
+# Loader Options Needed By The Requested Fields, Given {field: (options...)}
+def field_loads(fields, loads):
+    requested = loads if fields is None else [field for field in fields if field in loads]
+    return [option for field in requested for option in loads[field]]
+
+# Whether Any Of The Requested Fields Is In The Given Group
+def wants_any(fields, group):
+    return fields is None or not group.isdisjoint(fields)
+
+# Serializes With The Given API Version's Schema | v1 Is The Display Schema, v2 The Raw Wire Schema
+def to_json(model, fields=None, version=1, **kwargs):
+    serialize = model.get_json_v2 if version == 2 else model.get_json
+    return serialize(fields=fields, **kwargs)
+
+# The Field Map ?fields= Is Checked Against For An API Version
+def json_fields(model_class, version=1):
+    return model_class.JSON_FIELDS_V2 if version == 2 else model_class.JSON_FIELDS
+
+# Formatted Amounts Only Exist In The v1 Display Schema
+def amount_columns(model_class, version=1):
+    return {} if version == 2 else model_class.AMOUNT_COLUMNS
+
+# One Field's Values Across A List | Amount Fields Are Formatted A Currency At A Time
+def field_column(models, field, getters, amounts, args):
+    if field in amounts:
+        amount, currency = amounts[field]
+        return CurrencyService.format_each(
+            [amount(model, *model_args) for model, model_args in zip(models, args)],
+            [currency(model, *model_args) for model, model_args in zip(models, args)]
+        )
+    getter = getters[field]
+    return [getter(model, *model_args) for model, model_args in zip(models, args)]
+
+# Serializes A List Column By Column - {field: [value per model]} | args Holds Each Model's Extra Getter Arguments
+def json_columns(model_class, models, fields=None, version=1, args=None):
+    getters = json_fields(model_class, version)
+    amounts = amount_columns(model_class, version)
+    args = args or [()] * len(models)
+    return {field: field_column(models, field, getters, amounts, args) for field in (fields or getters)}
+
+# Serializes A List Into The Same Objects to_json Gives Per Model
+def to_json_list(model_class, models, fields=None, version=1, args=None):
+    columns = json_columns(model_class, models, fields, version, args)
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
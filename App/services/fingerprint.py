@@ -0,0 +1,14 @@
+import hashlib
+from App.services.datetime import parse_iso_date, parse_iso_time
+
+FIELD_SEPARATOR = "\x1f"
+
+# Identifies "The Same Real-World Transaction" Within A Circle - Title Case & Spacing, Amount Formatting
+# And Date/Time Spelling Are Normalized, So A Re-Imported Statement Line Hashes To The Same Value
+def transaction_fingerprint(transactionTitle, transactionAmount, transactionDate, transactionTime, bankID):
+    title = " ".join(str(transactionTitle or "").split()).casefold()
+    amount = f"{float(transactionAmount):.2f}"
+    transaction_date = parse_iso_date(transactionDate).isoformat()
+    transaction_time = parse_iso_time(transactionTime).replace(microsecond=0).isoformat()
+    payload = FIELD_SEPARATOR.join((title, amount, transaction_date, transaction_time, str(bankID)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
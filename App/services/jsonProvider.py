@@ -0,0 +1,98 @@
+import enum
+import decimal
+from datetime import date, datetime, time
+from flask import has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson Is Optional - The Standard Library Provider Is Used Without It
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack Is Optional - Responses Are Always JSON Without It
+    msgpack = None
+
+JSON_MIMETYPE = "application/json"
+MSGPACK_MIMETYPES = ("application/msgpack", "application/x-msgpack")
+
+# Values Neither Encoder Handles Natively | Dates & Times Are ISO 8601, Enums Their Value, Decimals Plain Numbers
+def encode_value(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, decimal.Decimal):
+        return float(value) if value.is_finite() else None
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+# True When The Request's Accept Header Prefers MessagePack | JSON Wins Ties (e.g. */*) So It Stays The Default
+def wants_msgpack():
+    if msgpack is None or not has_request_context():
+        return False
+    return request.accept_mimetypes.best_match((JSON_MIMETYPE, *MSGPACK_MIMETYPES), default=JSON_MIMETYPE) != JSON_MIMETYPE
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Flask's Provider, With ISO Dates (Not RFC 822) So Output Matches OrjsonProvider
+    Every jsonify() Goes Through response(), Which Also Negotiates MessagePack From The Same Values & encode_value"""
+    default = staticmethod(encode_value)
+    sort_keys = False
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if wants_msgpack():
+            response = self._app.response_class(msgpack.packb(obj, default=encode_value), mimetype=MSGPACK_MIMETYPES[0])
+        else:
+            response = self.json_response(obj)
+
+        # The Body Depends On Accept, So Caches Must Key On It
+        if msgpack is not None:
+            response.vary.add("Accept")
+        return response
+
+    def json_response(self, obj):
+        return super().response(obj)
+
+class OrjsonProvider(StdlibJSONProvider):
+    """orjson-Backed Provider | Responses Are Encoded Straight To Bytes, Skipping The str Round Trip"""
+    options = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        # Formatting Options (indent, sort_keys...) Are Only Understood By The Standard Library
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=encode_value, option=self.options).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def json_response(self, obj):
+        options = self.options | (orjson.OPT_INDENT_2 if self._app.debug else 0)
+        body = orjson.dumps(obj, default=encode_value, option=options | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+JSON_PROVIDERS = {
+    'stdlib': StdlibJSONProvider,
+    'orjson': OrjsonProvider
+}
+
+# JSON_PROVIDER Config: "orjson", "stdlib" Or "auto" (orjson When Installed)
+def get_json_provider_class(name="auto"):
+    if name == "auto":
+        name = "orjson" if orjson else "stdlib"
+    if name == "orjson" and not orjson:
+        raise RuntimeError("JSON_PROVIDER Is orjson But orjson Is Not Installed")
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f"Unknown JSON Provider: {name}")
+    return JSON_PROVIDERS[name]
+
+def setup_json(app):
+    app.json = get_json_provider_class(app.config.get('JSON_PROVIDER', 'auto'))(app)
+    return app.json
@@ -0,0 +1,48 @@
+import json
+import base64
+import binascii
+
+# Page Size Used When A Cursor Is Sent Without A Limit
+DEFAULT_PAGE_SIZE = 50
+
+# Upper Bound On A Single Page, Whatever The Client Asks For
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(values):
+    payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (TypeError, UnicodeError, binascii.Error, json.JSONDecodeError):
+        raise ValueError("Invalid Cursor")
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid Cursor")
+    return values
+
+# Reads limit/cursor From Query Parameters | (None, None) Means "Return Everything"
+def parse_page_args(args):
+    limit = args.get('limit')
+    cursor = args.get('cursor') or None
+
+    if limit is None:
+        return (DEFAULT_PAGE_SIZE if cursor else None), cursor
+
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid Limit")
+
+    if limit < 1:
+        raise ValueError("Invalid Limit")
+    return min(limit, MAX_PAGE_SIZE), cursor
+
+# Splits An Over-Fetched (limit + 1) Result Into The Page And Its Next Cursor
+def split_page(rows, limit, make_cursor):
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, make_cursor(rows[-1])
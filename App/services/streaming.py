@@ -0,0 +1,48 @@
+from collections.abc import Mapping
+from flask import Response, current_app, stream_with_context
+
+# Serialized Rows Are Held Until At Least This Many Characters Are Ready, Then Sent As One Chunk
+STREAM_BUFFER_SIZE = 8192
+
+STREAM_FLAGS = {"1", "true", "yes"}
+
+# Streaming Is Opt-In Per Request (?stream=1)
+def wants_stream(args):
+    return (args.get('stream') or "").strip().lower() in STREAM_FLAGS
+
+# Writes {**fields, key: [...items], **trailer()} Incrementally | Only One Item & The Buffer Are Held At A Time,
+# And trailer() Runs After The Items So It Can Report State Known Only Once They're Exhausted (e.g. next_cursor)
+def iter_json_object(fields, key, items, trailer=None, buffer_size=STREAM_BUFFER_SIZE):
+    dumps = current_app.json.dumps
+
+    buffer = [dumps(dict(fields))[:-1]]
+    if fields:
+        buffer.append(", ")
+    buffer.append(dumps(key) + ": ")
+
+    # Already Materialised Values (e.g. {"error": ...}) Are Written Whole
+    if isinstance(items, (Mapping, str)):
+        buffer.append(dumps(items))
+    else:
+        buffer.append("[")
+        size, separator = 0, ""
+        for item in items:
+            chunk = separator + dumps(item)
+            buffer.append(chunk)
+            size += len(chunk)
+            separator = ", "
+            if size >= buffer_size:
+                yield "".join(buffer)
+                buffer, size = [], 0
+        buffer.append("]")
+
+    for name, value in (trailer() if trailer else {}).items():
+        buffer.append(", " + dumps(name) + ": " + dumps(value))
+    buffer.append("}")
+    yield "".join(buffer)
+
+# Streams {"status": "success", key: [...], "next_cursor": ...} From A Lazy Page
+def stream_page_response(key, page):
+    trailer = lambda: {"next_cursor": getattr(page, 'next_cursor', None)}
+    body = iter_json_object({"status": "success"}, key, page, trailer)
+    return Response(stream_with_context(body), mimetype="application/json")
@@ -1,8 +1,22 @@
-import pytest, logging, unittest
+import pytest, logging, os, unittest, unittest.mock, io, gzip, json, tempfile, threading
+from contextlib import contextmanager
+from datetime import date, datetime, time
+from decimal import Decimal
+from flask import current_app, g
+from sqlalchemy import event, update
 from App.main import create_app
 from App.database import db, create_db
 from App.models import *
 from App.controllers import *
+from App.services.pagination import encode_cursor, decode_cursor, parse_page_args, MAX_PAGE_SIZE
+from App.services.fingerprint import transaction_fingerprint
+from App.services.streaming import iter_json_object
+from App.services.columnar import to_columnar, wants_columnar
+from App.services.fields import to_json_list
+from App.services.cache import LRUCache, SharedMemoryCache, EntityCache, get_reference, private_directory
+from App.services.coalesce import SingleFlight
+from flask_jwt_extended import create_access_token, decode_token
+from App.services.jsonProvider import StdlibJSONProvider, OrjsonProvider, get_json_provider_class, orjson, msgpack
 
 LOGGER = logging.getLogger(__name__)
 
@@ -13,6 +27,38 @@ def empty_db():
     yield app.test_client()
     db.drop_all()
 
+# Records Every SQL Statement Sent To The Database Within The Block
+@contextmanager
+def count_queries():
+    statements = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+# EXPLAIN QUERY PLAN For Every SELECT Issued Within The Block | Collects Any Full Table Scans
+@contextmanager
+def full_table_scans():
+    selects = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append((statement, parameters))
+    scans = []
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield scans
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+    connection = db.session.connection()
+    for statement, parameters in selects:
+        for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters):
+            detail = row[-1]
+            if detail.startswith("SCAN ") and "CONSTANT ROW" not in detail:
+                scans.append((detail, statement))
+
 '''
     Unit & Integration Tests
 
@@ -691,6 +737,212 @@ class TransactionUnitTests(unittest.TestCase):
         }
         self.assertDictEqual(transaction_json, expected)
 
+# Currency
+class CurrencyUnitTests(unittest.TestCase):
+
+    def test_unit_24_format_many_uses_cached_registry(self):
+        registry = CurrencyService.get_registry()
+
+        with unittest.mock.patch.object(CurrencyService, "load_currencies", wraps=CurrencyService.load_currencies) as load:
+            formatted = CurrencyService.format_many([500, 12.5, 0], "ttd")
+            single = CurrencyService.format_currency(20, "USD")
+            unknown = CurrencyService.format_currency(20, "???")
+            mixed = CurrencyService.format_each([1, 2, 3.5], ["TTD", "USD", "TTD"])
+
+        assert load.call_count == 0
+        assert CurrencyService.get_registry() is registry
+        self.assertListEqual(formatted, ["TT$500.00", "TT$12.50", "TT$0.00"])
+        assert single == "$20.00"
+        assert unknown == "20.00"
+        self.assertListEqual(mixed, ["TT$1.00", "$2.00", "TT$3.50"])
+
+        # List Serializers Format Amounts A Currency At A Time, Never Row By Row
+        banks = [Bank(bankTitle=f"Wallet {currency}", bankCurrency=currency, bankAmount=500, remainingBankAmount=250,
+                      isPrimary=False, color="#6A3D9A", circleID=None) for currency in ("TTD", "USD", "TTD")]
+        fields = ("bankTitle", "bankAmount", "remainingBankAmount")
+        with unittest.mock.patch.object(CurrencyService, "format_currency", side_effect=AssertionError):
+            listed = to_json_list(Bank, banks, fields)
+        assert listed == [bank.get_json(fields) for bank in banks]
+        assert listed[1] == {"bankTitle": "Wallet USD", "bankAmount": "$500.00", "remainingBankAmount": "$250.00"}
+
+# Category
+class CategoryUnitTests(unittest.TestCase):
+
+    def test_unit_25_resolve_categories(self):
+        index = CategoryService.get_index()
+
+        assert CategoryService.get_index() is index
+        assert CategoryService.get_category_key("groceries") == "GROCERIES"
+        assert CategoryService.get_category_key("Groceries") == "GROCERIES"
+        self.assertListEqual(CategoryService.get_categories(["shopping", "Transit", "nope"]),
+                             ["Shopping", "Transit", "Unknown Category"])
+        self.assertListEqual(CategoryService.get_category("BILLS"), ["Bills"])
+
+    def test_unit_26_categories_etag(self):
+        client = current_app.test_client()
+
+        response = client.get("/ffm/categories")
+        etag = response.headers["ETag"]
+        assert response.status_code == 200
+        assert response.get_json()["categories"]["INCOME"] == "Income"
+
+        cached = client.get("/ffm/categories", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.data == b""
+
+# Pagination
+class PaginationUnitTests(unittest.TestCase):
+
+    def test_unit_27_cursor_and_page_args(self):
+        cursor = encode_cursor(["2025-01-06", "09:30:00", 42])
+        assert "=" not in cursor
+        self.assertListEqual(decode_cursor(cursor), ["2025-01-06", "09:30:00", 42])
+
+        with self.assertRaises(ValueError):
+            decode_cursor("not-a-cursor!")
+        with self.assertRaises(ValueError):
+            parse_page_args({"limit": "0"})
+
+        assert parse_page_args({}) == (None, None)
+        assert parse_page_args({"cursor": cursor}) == (50, cursor)
+        assert parse_page_args({"limit": "100000"}) == (MAX_PAGE_SIZE, None)
+
+# Fingerprint
+class FingerprintUnitTests(unittest.TestCase):
+
+    def test_unit_28_fingerprint_normalization(self):
+        fingerprint = transaction_fingerprint("Picnic Lunch", 75, "2025-01-06", "14:30", 3)
+
+        assert len(fingerprint) == 64
+        assert transaction_fingerprint("  picnic   LUNCH ", 75.001, "2025-01-06", "14:30:00", 3) == fingerprint
+        assert transaction_fingerprint("Picnic Lunch", 75, "2025-01-06", "14:30", 4) != fingerprint
+        assert transaction_fingerprint("Picnic Lunch", 75, "2025-01-07", "14:30", 3) != fingerprint
+
+# JSON Provider
+class JSONProviderUnitTests(unittest.TestCase):
+
+    def test_unit_29_json_provider_native_types(self):
+        payload = {
+            "date": date(2025, 1, 6),
+            "time": time(9, 30),
+            "datetime": datetime(2025, 1, 6, 9, 30, 15),
+            "type": TransactionType.EXPENSE,
+            "circleType": CircleType.GROUP,
+            "amount": Decimal("12.50"),
+            "count": 3
+        }
+        expected = {"date": "2025-01-06", "time": "09:30:00", "datetime": "2025-01-06T09:30:15", "type": "Expense",
+                    "circleType": "Group", "amount": 12.5, "count": 3}
+
+        app = current_app._get_current_object()
+        providers = [StdlibJSONProvider(app)]
+        if orjson:
+            providers.append(OrjsonProvider(app))
+
+        for provider in providers:
+            assert json.loads(provider.dumps(payload)) == expected
+            assert provider.loads(provider.dumps(payload)) == expected
+            response = provider.response(payload)
+            assert response.mimetype == "application/json"
+            assert json.loads(response.get_data()) == expected
+
+        assert isinstance(current_app.json, StdlibJSONProvider)
+        assert get_json_provider_class("auto") is (OrjsonProvider if orjson else StdlibJSONProvider)
+        with self.assertRaises(ValueError):
+            get_json_provider_class("simplejson")
+
+class ColumnarUnitTests(unittest.TestCase):
+
+    def test_unit_30_columnar_encoding(self):
+        rows = [
+            {"transactionTitle": "Bread", "transactionCategory": ["Groceries"], "bankID": 1},
+            {"transactionTitle": "Bus", "transactionCategory": ["Transit"], "bankID": 1},
+            {"transactionTitle": "Milk", "transactionCategory": ["Groceries"], "bankID": 2}
+        ]
+        columns = {field: [row[field] for row in rows] for field in ("transactionTitle", "transactionCategory", "bankID")}
+        page = to_columnar(columns, len(rows), {"transactionCategory", "bankID"})
+        assert page == {
+            "count": 3,
+            "columns": {"transactionTitle": ["Bread", "Bus", "Milk"], "transactionCategory": [0, 1, 0], "bankID": [0, 0, 1]},
+            "dictionaries": {"transactionCategory": [["Groceries"], ["Transit"]], "bankID": [1, 2]}
+        }
+        assert to_columnar({"transactionTitle": []}, 0) == {"count": 0, "columns": {"transactionTitle": []}, "dictionaries": {}}
+
+        assert wants_columnar({"format": "Columnar"}) and not wants_columnar({})
+        with self.assertRaises(ValueError):
+            wants_columnar({"format": "xml"})
+        with self.assertRaises(ValueError):
+            wants_columnar({"format": "columnar", "stream": "1"})
+
+class EntityCacheUnitTests(unittest.TestCase):
+
+    def test_unit_31_entity_cache_backends(self):
+        lru = LRUCache(max_entries=2)
+        lru.set_many({"a": 1, "b": 2})
+        lru.get_many(["a"])
+        lru.set_many({"c": 3})
+        assert lru.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+        shared = SharedMemoryCache(path=f"{tempfile.gettempdir()}/test-entity-cache.sqlite")
+        shared.clear()
+        shared.set_many({"Bank.v1:1": {"bankTitle": "Shared"}}, ttl=60)
+        assert shared.get_many(["Bank.v1:1", "Bank.v1:2"]) == {"Bank.v1:1": {"bankTitle": "Shared"}}
+        shared.delete_many(["Bank.v1:1"])
+        assert shared.get_many(["Bank.v1:1"]) == {}
+
+        # The Default File Sits In A Private Directory - One Others Could Write To Is Refused
+        base = tempfile.mkdtemp()
+        assert os.stat(private_directory(base)).st_mode & 0o777 == 0o700
+        os.chmod(private_directory(base), 0o777)
+        with self.assertRaises(RuntimeError):
+            private_directory(base)
+
+        # Entries Only Hit At Their Circle Version - Unless They're Young Enough To Serve Stale
+        cache = EntityCache(LRUCache(), stale_seconds=60)
+        cache.set_many("Bank", {1: "one", 2: "two"}, {1: 5, 2: 5})
+        assert cache.get_many("Bank", {1: 5, 2: 6}) == ({1: "one", 2: "two"}, [2])
+        assert cache.get_many("Bank", {1: 5}, version=2) == ({}, [])
+        cache.invalidate([("Bank", 1)])
+        assert EntityCache(cache.backend).get_many("Bank", {1: 5, 2: 6}) == ({}, [])
+
+class SingleFlightUnitTests(unittest.TestCase):
+
+    def test_unit_32_single_flight_coalescing(self):
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        runs, results = [], []
+
+        def compute():
+            runs.append(1)
+            started.set()
+            release.wait(5)
+            return {"transactions": []}
+
+        def call():
+            results.append(single_flight.do("circle:1", compute))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=call) for _ in range(3)]
+        for follower in followers:
+            follower.start()
+        while single_flight.stats()["coalesced"] < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert len(runs) == 1 and len(results) == 4
+        assert all(result is results[0][0] for result, _ in results)
+        assert sorted(shared for _, shared in results) == [False, True, True, True]
+        assert single_flight.stats() == {"computed": 1, "coalesced": 3, "inFlight": 0}
+
+        # Errors Reach The Caller & Nothing Outlives Its Flight
+        with self.assertRaises(ZeroDivisionError):
+            single_flight.do("circle:1", lambda: 1 / 0)
+        assert single_flight.do("circle:1", lambda: "fresh") == ("fresh", False)
+
 '''
     Integration Tests
 
@@ -741,6 +993,61 @@ class UserIntegrationTests(unittest.TestCase):
         user = get_user(newuser.id)
         assert user.password == "newsonniepass"
 
+    def test_int_49_token_claims_and_user_cache(self):
+        user = create_user(name="Tia Token",
+                    email="tia@mail.com",
+                    password="tiapass")
+
+        home = create_circle(circleName="Token Home",
+                        circleType=CircleType.SELF,
+                        circleColor="#CAB2D6",
+                        circleImage="https://picsum.photos/id/90/300/300.jpg",
+                        userID=user.id)
+        away = create_circle(circleName="Token Away",
+                        circleType=CircleType.GROUP,
+                        circleColor="#CAB2D6",
+                        circleImage="https://picsum.photos/id/91/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=home.circleID)
+        create_bank(userID=user.id, bankTitle="Home Wallet", bankCurrency="TTD", bankAmount=100, isPrimary=True, color="#CAB2D6")
+
+        userID, homeID, awayID = user.id, home.circleID, away.circleID
+        client = current_app.test_client()
+        token = login("tia@mail.com", "tiapass")
+        assert decode_token(token)["activeCircleID"] == homeID and decode_token(token)["sub"] == userID
+
+        # Authenticated Reads Take The Circle From The Token & The User From The User Cache - Once Warm, No User Row Is Read
+        headers = {"Authorization": f"Bearer {token}"}
+        client.get("/goals", headers=headers)
+        with count_queries() as statements:
+            response = client.get("/banks", headers=headers)
+            client.get("/v2/transactions", headers=headers)
+        assert [bank["bankTitle"] for bank in response.get_json()["banks"]] == ["Home Wallet"]
+        assert not [statement for statement in statements if 'FROM user' in statement]
+
+        # Switching Circles Hands Back A Token Naming The New One
+        response = client.post("/active-circle", headers=headers, json={"circleID": awayID})
+        refreshed = response.get_json()["access_token"]
+        assert decode_token(refreshed)["activeCircleID"] == awayID
+        assert client.get("/banks", headers={"Authorization": f"Bearer {refreshed}"}).get_json()["banks"] == []
+        assert client.get("/active-circle", headers={"Authorization": f"Bearer {refreshed}"}).get_json()["activeCircle"]["circleID"] == awayID
+
+        # Tokens Without The Claim Fall Back To The User's Row
+        legacy = create_access_token(identity=get_user(userID))
+        assert client.get("/active-circle", headers={"Authorization": f"Bearer {legacy}"}).get_json()["activeCircle"]["circleID"] == awayID
+
+        # User Rows Are Cached Across Requests Until A Change To Them Commits
+        g.pop('reference_rows', None)
+        assert get_reference(User, userID).name == "Tia Token"
+        g.pop('reference_rows', None)
+        with count_queries() as statements:
+            assert get_reference(User, userID).activeCircleID == awayID
+        assert statements == []
+        update_user(userID, newName="Tia Retoken")
+        g.pop('reference_rows', None)
+        assert get_reference(User, userID).name == "Tia Retoken"
+
 # Circle
 class CircleIntegrationTests(unittest.TestCase):
 
@@ -863,6 +1170,327 @@ class CircleIntegrationTests(unittest.TestCase):
         self.assertListEqual([{"id":user2.id, "name":"Jenny Applesauce", "email":"jenny1@mail.com", "activeCircle": None}
                               ], circle_users)
 
+    def test_int_40_circle_snapshot(self):
+        user = create_user(name="Sami Snapshot",
+                    email="sami@mail.com",
+                    password="samipass")
+
+        outsider = create_user(name="Nora Nonmember",
+                    email="nora@mail.com",
+                    password="norapass")
+
+        circle = create_circle(circleName="Snapshot Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        userID, circleID = user.id, circle.circleID
+
+        def post(start, count):
+            for i in range(start, start + count):
+                bank = create_bank(userID=userID,
+                                   bankTitle=f"Snapshot Wallet {i}",
+                                   bankCurrency="TTD",
+                                   bankAmount=1000,
+                                   isPrimary=(i == 0),
+                                   color="#6A3D9A")
+                create_budget(budgetTitle=f"Snapshot Budget {i}",
+                              budgetAmount=100.00,
+                              budgetType=BudgetType.EXPENSE,
+                              budgetCategory=["GROCERIES"],
+                              transactionScope=TransactionScope.EXCLUSIVE,
+                              color="#6A3D9A",
+                              startDate="2025-01-01",
+                              endDate="2025-01-31",
+                              userID=userID,
+                              bankID=bank.bankID)
+                create_goal(goalTitle=f"Snapshot Goal {i}",
+                            targetAmount=500.00,
+                            goalType=GoalType.SAVINGS,
+                            color="#6A3D9A",
+                            startDate="2025-01-01",
+                            endDate="2025-12-31",
+                            userID=userID)
+                add_transaction(transactionTitle=f"Snapshot Spend {i}",
+                                transactionDesc="",
+                                transactionType=TransactionType.EXPENSE,
+                                transactionCategory=["SHOPPING"],
+                                transactionAmount=5.00,
+                                transactionDate="2025-01-06",
+                                transactionTime="12:00",
+                                bankID=bank.bankID,
+                                userID=userID,
+                                goalID=None)
+
+        post(0, 2)
+        db.session.expire_all()
+        with count_queries() as few:
+            snapshot = get_circle_snapshot(circleID, userID, transaction_limit=3)
+        assert len(snapshot["banks"]) == len(snapshot["budgets"]) == len(snapshot["goals"]) == len(snapshot["transactions"]) == 2
+        assert snapshot["next_cursor"] is None
+
+        post(2, 6)
+        db.session.expire_all()
+        with count_queries() as many:
+            snapshot = get_circle_snapshot(circleID, userID, transaction_limit=3)
+
+        # Sections Match Their Standalone Endpoints, With A Bounded Transaction Window
+        assert snapshot["circle"] == get_circle_json(circleID)
+        assert snapshot["users"] == get_circle_users_json(circleID)
+        assert snapshot["banks"] == get_circle_banks_json(circleID)
+        assert snapshot["budgets"] == get_circle_budgets_json(circleID)
+        assert snapshot["goals"] == get_circle_goals_json(circleID)
+        assert snapshot["transactions"] == get_circle_transactions_page(circleID, limit=3)[0]
+        assert snapshot["next_cursor"] is not None
+        assert len(many) == len(few)
+
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('sami@mail.com', 'samipass')}"}
+        response = client.get(f"/circle/{circleID}/snapshot", headers=headers)
+        assert response.status_code == 200
+        assert response.get_json()["circle"]["circleName"] == "Snapshot Circle"
+
+        outsider_headers = {"Authorization": f"Bearer {login('nora@mail.com', 'norapass')}"}
+        assert client.get(f"/circle/{circleID}/snapshot", headers=outsider_headers).status_code == 404
+
+    def test_int_45_circle_version_etags(self):
+        user = create_user(name="Etta Tagg",
+                    email="etta@mail.com",
+                    password="ettapass")
+
+        circle = create_circle(circleName="Tagged Circle",
+                        circleType=CircleType.GROUP,
+                        circleColor="#FF7F00",
+                        circleImage="https://picsum.photos/id/86/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Tagged Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#FF7F00")
+
+        userID, circleID, bankID, circleCode = user.id, circle.circleID, bank.bankID, circle.circleCode
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('etta@mail.com', 'ettapass')}"}
+
+        response = client.get("/transactions", headers=headers)
+        etag = response.headers["ETag"]
+        assert response.status_code == 200 and etag.startswith('W/"')
+
+        # An Unchanged Poll Is One Version Lookup, Then 304
+        with count_queries() as statements:
+            response = client.get("/transactions", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304 and response.headers["ETag"] == etag
+        assert len(statements) == 1
+
+        # Other Queries Or Encodings Are Other Representations
+        assert client.get("/transactions?fields=transactionTitle", headers={**headers, "If-None-Match": etag}).status_code == 200
+
+        # Every Kind Of Change Moves The Version
+        changes = [
+            lambda: add_transaction(transactionTitle="Tagged", transactionDesc="", transactionType=TransactionType.EXPENSE,
+                                    transactionCategory=["GROCERIES"], transactionAmount=5, transactionDate="2025-01-10",
+                                    transactionTime="08:00", bankID=bankID, userID=userID, goalID=None),
+            lambda: update_bank(bankID, bankTitle="Retagged Wallet"),
+            lambda: create_goal(goalTitle="Tagged Goal", targetAmount=100, goalType=GoalType.SAVINGS, color="#FF7F00",
+                                startDate="2025-01-01", endDate="2025-01-31", userID=userID),
+            lambda: update_circle(circleID, circleName="Retagged Circle"),
+            lambda: add_to_circle(circleCode, create_user(name="Tim Tagalong", email="tim@mail.com", password="timpass").id),
+            lambda: update_user(userID, newName="Etta Retagged")
+        ]
+        for change in changes:
+            tag = get_circle_version_tag(circleID)
+            change()
+            assert get_circle_version_tag(circleID) != tag
+
+        response = client.get("/transactions", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200 and response.headers["ETag"] != etag
+        assert response.get_json()["transactions"][0]["transactionTitle"] == "Tagged"
+
+        # Circle Routes & v2 Are Conditional Too; Missing Circles & Errors Aren't Tagged
+        etag = client.get(f"/v2/circle/{circleID}/transactions").headers["ETag"]
+        assert client.get(f"/v2/circle/{circleID}/transactions", headers={"If-None-Match": etag}).status_code == 304
+        assert "ETag" not in client.get("/circle/9999/transactions").headers
+        assert "ETag" not in client.get("/banks?fields=password", headers=headers).headers
+
+    def test_int_47_coalesced_circle_reads(self):
+        user = create_user(name="Fay Flight",
+                    email="fay@mail.com",
+                    password="faypass")
+
+        circle = create_circle(circleName="Coalesced Circle",
+                        circleType=CircleType.GROUP,
+                        circleColor="#A6CEE3",
+                        circleImage="https://picsum.photos/id/88/300/300.jpg",
+                        userID=user.id)
+
+        circleID = circle.circleID
+        app = current_app._get_current_object()
+        client = app.test_client()
+        before = app.extensions['single_flight'].stats()
+        expected = client.get(f"/circle/{circleID}/transactions").get_json()
+
+        # A Read Arriving While An Identical One Is In Flight Gets A Copy Of Its Response Without Running The View
+        started, release, runs = threading.Event(), threading.Event(), []
+        def slow_page(*args, **kwargs):
+            runs.append(1)
+            started.set()
+            release.wait(5)
+            return get_circle_transactions_page(*args, **kwargs)
+
+        responses = []
+        def read():
+            responses.append(app.test_client().get(f"/circle/{circleID}/transactions"))
+
+        with unittest.mock.patch("App.views.circle.get_circle_transactions_page", side_effect=slow_page):
+            leader, follower = threading.Thread(target=read), threading.Thread(target=read)
+            leader.start()
+            started.wait(5)
+            follower.start()
+            while app.extensions['single_flight'].stats()["coalesced"] == before["coalesced"]:
+                threading.Event().wait(0.01)
+            release.set()
+            leader.join(5)
+            follower.join(5)
+
+        assert len(runs) == 1
+        assert [response.status_code for response in responses] == [200, 200]
+        assert responses[0].get_json() == responses[1].get_json() == expected
+        assert responses[0].headers["ETag"] == responses[1].headers["ETag"]
+        stats = client.get("/health").get_json()["coalescing"]
+        assert stats["computed"] - before["computed"] == 2 and stats["coalesced"] - before["coalesced"] == 1
+
+    def test_int_50_coalescing_keeps_callers_apart(self):
+        member = create_user(name="Mina Member",
+                    email="mina@mail.com",
+                    password="minapass")
+        create_user(name="Olga Outsider",
+                    email="olga@mail.com",
+                    password="olgapass")
+
+        circle = create_circle(circleName="Private Circle",
+                        circleType=CircleType.GROUP,
+                        circleColor="#FFFF99",
+                        circleImage="https://picsum.photos/id/92/300/300.jpg",
+                        userID=member.id)
+
+        circleID = circle.circleID
+        app = current_app._get_current_object()
+        member_headers = {"Authorization": f"Bearer {login('mina@mail.com', 'minapass')}"}
+        outsider_headers = {"Authorization": f"Bearer {login('olga@mail.com', 'olgapass')}"}
+
+        # The Member's Snapshot Is Held In Flight While The Outsider Asks For The Same URL
+        started, release = threading.Event(), threading.Event()
+        def slow_snapshot(*args, **kwargs):
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+            return get_circle_snapshot(*args, **kwargs)
+
+        responses = []
+        with unittest.mock.patch("App.views.circle.get_circle_snapshot", side_effect=slow_snapshot):
+            reader = threading.Thread(target=lambda: responses.append(app.test_client().get(f"/circle/{circleID}/snapshot", headers=member_headers)))
+            reader.start()
+            started.wait(5)
+            outsider = app.test_client().get(f"/circle/{circleID}/snapshot", headers=outsider_headers)
+            release.set()
+            reader.join(5)
+
+        assert outsider.status_code == 404 and "users" not in outsider.get_json()
+        assert responses[0].status_code == 200
+
+        # Nor Can The Outsider Replay The Member's Tag For A 304
+        etag = responses[0].headers["ETag"]
+        assert app.test_client().get(f"/circle/{circleID}/snapshot", headers={**outsider_headers, "If-None-Match": etag}).status_code == 404
+
+    def test_int_51_member_changes_move_circle_tags(self):
+        user = create_user(name="Mae Member",
+                    email="mae@mail.com",
+                    password="maepass")
+
+        circle = create_circle(circleName="Member Circle",
+                        circleType=CircleType.GROUP,
+                        circleColor="#1F78B4",
+                        circleImage="https://picsum.photos/id/93/300/300.jpg",
+                        userID=user.id)
+        other = create_circle(circleName="Other Member Circle",
+                        circleType=CircleType.GROUP,
+                        circleColor="#1F78B4",
+                        circleImage="https://picsum.photos/id/94/300/300.jpg",
+                        userID=user.id)
+
+        userID, circleID, otherID = user.id, circle.circleID, other.circleID
+        client = current_app.test_client()
+
+        # /circle/<id>/users Lists Each Member's Email & Active Circle, So Changing Either Must Invalidate Its Tag
+        changes = [
+            lambda: update_user(userID, newEmail="mae.new@mail.com"),
+            lambda: set_active_circle(userID=userID, circleID=otherID)
+        ]
+        for change in changes:
+            etag = client.get(f"/circle/{circleID}/users").headers["ETag"]
+            change()
+            response = client.get(f"/circle/{circleID}/users", headers={"If-None-Match": etag})
+            assert response.status_code == 200 and response.headers["ETag"] != etag
+
+        assert response.get_json()["users"][0]["email"] == "mae.new@mail.com"
+        assert response.get_json()["users"][0]["activeCircle"] == otherID
+
+    def test_int_53_stale_snapshot_sections_are_not_tagged(self):
+        user = create_user(name="Sid Section",
+                    email="sid@mail.com",
+                    password="sidpass")
+
+        circle = create_circle(circleName="Section Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#FB9A99",
+                        circleImage="https://picsum.photos/id/96/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+        bank = create_bank(userID=user.id,
+                           bankTitle="Section Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=100,
+                           isPrimary=True,
+                           color="#FB9A99")
+
+        userID, bankID, circleID = user.id, bank.bankID, circle.circleID
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('sid@mail.com', 'sidpass')}"}
+        url = f"/circle/{circleID}/snapshot"
+
+        # gevent Only Ships With The Production Worker - Sections Run In Turn Here, Each Still In Its Own App Context
+        class SequentialPool:
+            def __init__(self, size):
+                pass
+
+            def spawn(self, fn, *args):
+                return unittest.mock.Mock(value=fn(*args))
+
+            def join(self, raise_error=False):
+                pass
+
+        with unittest.mock.patch.object(current_app.extensions['entity_cache'], "stale_seconds", 60), \
+             unittest.mock.patch("App.controllers.circleVersion.run_after_response"), \
+             unittest.mock.patch("App.services.concurrency.is_cooperative", return_value=True), \
+             unittest.mock.patch("App.services.concurrency.Pool", SequentialPool):
+            etag = client.get(url, headers=headers).headers["ETag"]
+
+            add_transaction(transactionTitle="Section Lunch", transactionDesc="", transactionType=TransactionType.EXPENSE,
+                            transactionCategory=["GROCERIES"], transactionAmount=25, transactionDate="2025-01-10",
+                            transactionTime="08:00", bankID=bankID, userID=userID, goalID=None)
+            response = client.get(url, headers={**headers, "If-None-Match": etag})
+            assert response.status_code == 200 and "ETag" not in response.headers
+            assert response.get_json()["banks"][0]["remainingBankAmount"] == "TT$100.00"
+
 # Bank
 class BankIntegrationTests(unittest.TestCase):
 
@@ -970,6 +1598,107 @@ class BankIntegrationTests(unittest.TestCase):
         deletedbank = get_bank(bankID=bank.bankID)
         self.assertIsNone(deletedbank)
 
+    def test_int_48_reference_rows(self):
+        user = create_user(name="Rex Reference",
+                    email="rex@mail.com",
+                    password="rexpass")
+
+        circle = create_circle(circleName="Reference Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#FB9A99",
+                        circleImage="https://picsum.photos/id/89/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Reference Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#FB9A99")
+
+        bankID = bank.bankID
+        def post(title):
+            transaction, _ = add_transaction(transactionTitle=title, transactionDesc="", transactionType=TransactionType.EXPENSE,
+                                             transactionCategory=["GROCERIES"], transactionAmount=5, transactionDate="2025-01-10",
+                                             transactionTime="08:00", bankID=bankID, userID=user.id, goalID=None)
+            return transaction
+
+        def bank_reads(statements):
+            return [statement for statement in statements if statement.lstrip().startswith("SELECT") and "FROM bank" in statement]
+
+        # The Just-Committed Transaction Reads Its Bank's Currency Once, However Often It's Serialized
+        g.pop('reference_rows', None)
+        transaction = post("Reference Bread")
+        with count_queries() as statements:
+            first = transaction.get_json()
+            post("Reference Milk").get_json()
+        assert first["transactionAmount"] == "TT$5.00"
+        assert len(bank_reads(statements)) == 1
+
+        # An ORM Change To The Bank Drops Its Reference Row On Commit
+        update_bank(bankID, bankCurrency="USD")
+        usd = CurrencyService.format_currency(5, get_bank(bankID).bankCurrency)
+        assert post("Reference Eggs").get_json()["transactionAmount"] == usd != first["transactionAmount"]
+        assert get_reference(Bank, bankID).bankCurrency == get_bank(bankID).bankCurrency and get_reference(Bank, 9999) is None
+
+        # With The Process Tier On, A Later Request Doesn't Read The Bank At All
+        config, extensions = current_app.config, current_app.extensions
+        with unittest.mock.patch.dict(config, {"REFERENCE_CACHE_TTL": 60}), unittest.mock.patch.dict(extensions, {"reference_cache": LRUCache()}):
+            g.pop('reference_rows', None)
+            post("Reference Jam").get_json()
+            g.pop('reference_rows', None)
+            with count_queries() as statements:
+                assert post("Reference Tea").get_json()["transactionAmount"] == usd
+            assert bank_reads(statements) == []
+
+            update_bank(bankID, bankTitle="Renamed Wallet")
+            g.pop('reference_rows', None)
+            assert get_reference(Bank, bankID).bankTitle == "Renamed Wallet"
+
+    def test_int_52_stale_entries_are_not_tagged(self):
+        user = create_user(name="Stu Stale",
+                    email="stu@mail.com",
+                    password="stupass")
+
+        circle = create_circle(circleName="Stale Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#E31A1C",
+                        circleImage="https://picsum.photos/id/95/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+        bank = create_bank(userID=user.id,
+                           bankTitle="Stale Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=100,
+                           isPrimary=True,
+                           color="#E31A1C")
+
+        userID, bankID = user.id, bank.bankID
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('stu@mail.com', 'stupass')}"}
+
+        with unittest.mock.patch.object(current_app.extensions['entity_cache'], "stale_seconds", 60), \
+             unittest.mock.patch("App.controllers.circleVersion.run_after_response"):
+            etag = client.get("/banks", headers=headers).headers["ETag"]
+
+            # Balances Move Through SQL, So The Cached Bank Is Only Stale By Version - And Is Served As Such, Untagged
+            add_transaction(transactionTitle="Stale Lunch", transactionDesc="", transactionType=TransactionType.EXPENSE,
+                            transactionCategory=["GROCERIES"], transactionAmount=25, transactionDate="2025-01-10",
+                            transactionTime="08:00", bankID=bankID, userID=userID, goalID=None)
+            for _ in range(2):
+                response = client.get("/banks", headers={**headers, "If-None-Match": etag})
+                assert response.status_code == 200 and "ETag" not in response.headers
+                assert response.get_json()["banks"][0]["remainingBankAmount"] == "TT$100.00"
+
+        # Once Refreshed, The Current Body Is Tagged Again
+        current_app.extensions['entity_cache'].invalidate([("Bank", bankID)])
+        response = client.get("/banks", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200 and response.headers["ETag"] != etag
+        assert response.get_json()["banks"][0]["remainingBankAmount"] == "TT$75.00"
+
 # Budget
 class BudgetIntegrationTests(unittest.TestCase):
 
@@ -1126,6 +1855,125 @@ class BudgetIntegrationTests(unittest.TestCase):
         deletedbudget = get_budget(budgetID=budget.budgetID)
         self.assertIsNone(deletedbudget)
 
+    def test_int_29_budget_goal_list_query_count(self):
+        user = create_user(name="Betty Batch",
+                    email="betty@mail.com",
+                    password="bettypass")
+
+        circle = create_circle(circleName="Batch Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Batch Wallet",
+                           bankCurrency="USD",
+                           bankAmount=5000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        def post(count):
+            for i in range(count):
+                create_budget(budgetTitle=f"Budget {i}",
+                              budgetAmount=100.00 + i,
+                              budgetType=BudgetType.EXPENSE,
+                              budgetCategory=["GROCERIES"],
+                              transactionScope=TransactionScope.EXCLUSIVE,
+                              color="#6A3D9A",
+                              startDate="2025-01-01",
+                              endDate="2025-01-31",
+                              userID=user.id,
+                              bankID=bank.bankID)
+                create_goal(goalTitle=f"Goal {i}",
+                            targetAmount=500.00 + i,
+                            goalType=GoalType.SAVINGS,
+                            color="#6A3D9A",
+                            startDate="2025-01-01",
+                            endDate="2025-12-31",
+                            userID=user.id)
+
+        circleID = circle.circleID
+
+        post(2)
+        db.session.expire_all()
+        with count_queries() as few:
+            few_budgets = get_budget_by_circle_json(circleID)
+            few_goals = get_goal_by_circle_json(circleID)
+
+        post(8)
+        db.session.expire_all()
+        with count_queries() as many:
+            many_budgets = get_budget_by_circle_json(circleID)
+            many_goals = get_goal_by_circle_json(circleID)
+
+        assert len(few_budgets) == len(few_goals) == 2
+        assert len(many_budgets) == len(many_goals) == 10
+        assert many_budgets[-1]["budgetAmount"] == "$107.00"
+        assert many_goals[-1]["owner"] == "Betty Batch"
+        assert len(many) == len(few)
+        assert len(many) <= 6
+
+    def test_int_46_entity_cache(self):
+        user = create_user(name="Cara Cache",
+                    email="cara@mail.com",
+                    password="carapass")
+
+        circle = create_circle(circleName="Cached Circle",
+                        circleType=CircleType.GROUP,
+                        circleColor="#B15928",
+                        circleImage="https://picsum.photos/id/87/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Cached Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#B15928")
+
+        for i in range(3):
+            create_budget(budgetTitle=f"Cached Budget {i}",
+                          budgetAmount=100 + i,
+                          budgetType=BudgetType.EXPENSE,
+                          budgetCategory=["GROCERIES"],
+                          transactionScope=TransactionScope.EXCLUSIVE,
+                          color="#B15928",
+                          startDate="2025-01-01",
+                          endDate="2025-01-31",
+                          userID=user.id,
+                          bankID=bank.bankID)
+
+        circleID, bankID = circle.circleID, bank.bankID
+        db.session.expire_all()
+        with count_queries() as cold_statements:
+            cold = get_budget_by_circle_json(circleID)
+
+        # Warm Lists Skip Serialization & The Owners' Currency Lookup
+        db.session.expire_all()
+        with count_queries() as warm_statements:
+            warm = get_budget_by_circle_json(circleID)
+        assert warm == cold and len(cold) == 3
+        assert len(warm_statements) == len(cold_statements) - 1
+
+        # A Committed Change Drops The Row & Moves The Circle Version Of Every Owner's Circle
+        assert get_bank_json(bankID)["bankTitle"] == "Cached Wallet"
+        update_bank(bankID, bankTitle="Recached Wallet", bankCurrency="USD")
+        assert get_bank_json(bankID)["bankTitle"] == "Recached Wallet"
+        assert get_budget_by_circle_json(circleID)[0]["budgetAmount"] != cold[0]["budgetAmount"]
+
+        # Disabled Caches Fall Back To Plain Serialization
+        entity_cache = current_app.extensions['entity_cache']
+        current_app.extensions['entity_cache'] = None
+        try:
+            assert get_budget_by_circle_json(circleID) == get_budget_by_circle_json(circleID, fields=set(Budget.JSON_FIELDS))
+        finally:
+            current_app.extensions['entity_cache'] = entity_cache
+
 # Goal
 class GoalIntegrationTests(unittest.TestCase):
 
@@ -1451,4 +2299,1040 @@ class TransactionIntegrationTests(unittest.TestCase):
 
         void_transaction(userID=user.id, transactionID=newtransaction.transactionID)
         transaction = get_transaction(newtransaction.transactionID)
-        assert transaction.voided == True
\ No newline at end of file
+        assert transaction.voided == True
+
+    def test_int_28_transaction_list_query_count(self):
+        user = create_user(name="Quincy Query",
+                    email="quincy@mail.com",
+                    password="quincypass")
+
+        circle = create_circle(circleName="Query Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Query Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=5000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        def post(start, count):
+            for i in range(start, start + count):
+                add_transaction(
+                    transactionTitle=f"Snack {i}",
+                    transactionDesc="",
+                    transactionType=TransactionType.EXPENSE,
+                    transactionCategory=["GROCERIES"],
+                    transactionAmount=1.00 + i,
+                    transactionDate="2025-01-06",
+                    transactionTime="09:30",
+                    bankID=bank.bankID,
+                    userID=user.id,
+                    goalID=None,
+                    attachments=[{"name": f"receipt{i}.jpg", "mimeType": "image/jpeg", "size": 10, "uri": "file://receipt"}]
+                )
+
+        circleID = circle.circleID
+
+        post(0, 2)
+        db.session.expire_all()
+        with count_queries() as few:
+            few_transactions = get_all_circle_transactions(circleID)
+
+        post(2, 8)
+        db.session.expire_all()
+        with count_queries() as many:
+            many_transactions = get_all_circle_transactions(circleID)
+
+        assert len(few_transactions) == 2
+        assert len(many_transactions) == 10
+        assert many_transactions[-1]["owner"] == "Quincy Query"
+        assert many_transactions[-1]["attachments"][0]["fileName"] == "receipt9.jpg"
+        assert len(many) == len(few)
+        assert len(many) <= 3
+
+    def test_int_30_paginate_circle_transactions(self):
+        user = create_user(name="Petra Pager",
+                    email="petra@mail.com",
+                    password="petrapass")
+
+        circle = create_circle(circleName="Pager Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Pager Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=5000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        # Several Transactions Share A Date & Time So The ID Tie-Breaker Is Exercised
+        for i in range(7):
+            add_transaction(
+                transactionTitle=f"Page {i}",
+                transactionDesc="",
+                transactionType=TransactionType.EXPENSE,
+                transactionCategory=["GROCERIES"],
+                transactionAmount=1.00,
+                transactionDate=f"2025-01-0{1 + i // 3}",
+                transactionTime="09:30",
+                bankID=bank.bankID,
+                userID=user.id,
+                goalID=None
+            )
+
+        circleID = circle.circleID
+        titles = []
+        cursor = None
+        pages = 0
+        while True:
+            page, cursor = get_circle_transactions_page(circleID, limit=3, cursor=cursor)
+            titles.extend(transaction["transactionTitle"] for transaction in page)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert pages == 3
+        self.assertListEqual(titles, [f"Page {i}" for i in reversed(range(7))])
+
+        everything, next_cursor = get_circle_transactions_page(circleID)
+        assert len(everything) == 7
+        assert next_cursor is None
+
+        with self.assertRaises(ValueError):
+            get_circle_transactions_page(circleID, limit=3, cursor="garbage")
+
+    def test_int_31_hot_queries_use_indexes(self):
+        user = create_user(name="Ivan Index",
+                    email="ivan@mail.com",
+                    password="ivanpass")
+
+        circle = create_circle(circleName="Index Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Index Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=5000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        budget = create_budget(budgetTitle="Index Budget",
+                               budgetAmount=200.00,
+                               budgetType=BudgetType.EXPENSE,
+                               budgetCategory=["GROCERIES"],
+                               transactionScope=TransactionScope.EXCLUSIVE,
+                               color="#6A3D9A",
+                               startDate="2025-01-01",
+                               endDate="2025-01-31",
+                               userID=user.id,
+                               bankID=bank.bankID)
+
+        goal = create_goal(goalTitle="Index Goal",
+                           targetAmount=1000.00,
+                           goalType=GoalType.SAVINGS,
+                           color="#6A3D9A",
+                           startDate="2025-01-01",
+                           endDate="2025-12-31",
+                           userID=user.id)
+
+        add_transaction(
+            transactionTitle="Indexed Refund",
+            transactionDesc="",
+            transactionType=TransactionType.INCOME,
+            transactionCategory=["GROCERIES"],
+            transactionAmount=5.00,
+            transactionDate="2025-01-06",
+            transactionTime="09:30",
+            bankID=bank.bankID,
+            userID=user.id,
+            budgetID=budget.budgetID,
+            goalID=goal.goalID,
+            attachments=[{"name": "receipt.jpg", "mimeType": "image/jpeg", "size": 10, "uri": "file://receipt"}]
+        )
+
+        circleID, bankID, budgetID, goalID, userID = circle.circleID, bank.bankID, budget.budgetID, goal.goalID, user.id
+        db.session.expire_all()
+
+        with full_table_scans() as scans:
+            page, cursor = get_circle_transactions_page(circleID, limit=1)
+            get_circle_transactions_page(circleID, limit=1, cursor=transaction_cursor(get_transaction(page[0]["transactionID"])))
+            get_budget_transactions_page(budgetID, limit=10)
+            get_goal_transactions_page(goalID, limit=10)
+            get_bank_transactions_json(bankID)
+            get_user_transactions_json(userID)
+            get_budget_by_circle_json(circleID)
+            get_goal_by_circle_json(circleID)
+            get_circle_banks_json(circleID)
+            get_user_budgets_json(userID)
+            get_user_goals_json(userID)
+
+        self.assertListEqual(scans, [])
+
+    def test_int_32_inclusive_budget_transactions(self):
+        user = create_user(name="Iris Inclusive",
+                    email="iris@mail.com",
+                    password="irispass")
+
+        circle = create_circle(circleName="Inclusive Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Inclusive Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=5000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        budget = create_budget(budgetTitle="January Groceries",
+                               budgetAmount=1000.00,
+                               budgetType=BudgetType.EXPENSE,
+                               budgetCategory=["GROCERIES"],
+                               transactionScope=TransactionScope.INCLUSIVE,
+                               color="#6A3D9A",
+                               startDate="2025-01-01",
+                               endDate="2025-01-31",
+                               userID=user.id,
+                               bankID=bank.bankID)
+
+        def post(title, category, transactionDate):
+            transaction, _ = add_transaction(
+                transactionTitle=title,
+                transactionDesc="",
+                transactionType=TransactionType.EXPENSE,
+                transactionCategory=category,
+                transactionAmount=10.00,
+                transactionDate=transactionDate,
+                transactionTime="12:00",
+                bankID=bank.bankID,
+                userID=user.id,
+                goalID=None
+            )
+            return transaction
+
+        post("Market", ["GROCERIES", "SHOPPING"], "2025-01-10")
+        post("Supermarket", ["GROCERIES"], "2025-01-20")
+        post("Last Year", ["GROCERIES"], "2024-12-31")
+        post("Cinema", ["ENTERTAINMENT"], "2025-01-15")
+        voided = post("Returned", ["GROCERIES"], "2025-01-12")
+        voided.voided = True
+        db.session.commit()
+
+        budgetID = budget.budgetID
+        with full_table_scans() as scans:
+            first, cursor = get_budget_transactions_page(budgetID, limit=1)
+            second, last_cursor = get_budget_transactions_page(budgetID, limit=1, cursor=cursor)
+
+        assert [transaction["transactionTitle"] for transaction in first + second] == ["Supermarket", "Market"]
+        assert last_cursor is None
+        self.assertListEqual(scans, [])
+
+    def test_int_33_add_transaction_single_commit(self):
+        user = create_user(name="Una Unit",
+                    email="una@mail.com",
+                    password="unapass")
+
+        other = create_user(name="Otto Other",
+                    email="otto@mail.com",
+                    password="ottopass")
+
+        circle = create_circle(circleName="Unit Circle",
+                        circleType=CircleType.GROUP,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id,
+                        userIDs=[other.id])
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Unit Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=100,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        goal = create_goal(goalTitle="Unit Goal",
+                           targetAmount=1000.00,
+                           goalType=GoalType.SAVINGS,
+                           color="#6A3D9A",
+                           startDate="2025-01-01",
+                           endDate="2025-12-31",
+                           userID=user.id)
+
+        commits = []
+        def on_commit(conn):
+            commits.append(conn)
+        event.listen(db.engine, "commit", on_commit)
+        try:
+            transaction, error = add_transaction(
+                transactionTitle="Shared Lunch",
+                transactionDesc="",
+                transactionType=TransactionType.EXPENSE,
+                transactionCategory=["FOOD"],
+                transactionAmount=40.00,
+                transactionDate="2025-01-06",
+                transactionTime="12:00",
+                bankID=bank.bankID,
+                userID=user.id,
+                userIDs=[other.id],
+                goalID=None,
+                attachments=[{"name": f"receipt{i}.jpg", "mimeType": "image/jpeg", "size": 10, "uri": "file://receipt"} for i in range(3)]
+            )
+        finally:
+            event.remove(db.engine, "commit", on_commit)
+
+        assert error is None
+        assert len(commits) == 1
+        assert len(transaction.attachments) == 3
+        assert [link.userID for link in transaction.user_transactions] == [user.id, other.id]
+        assert is_transaction_owner(user.id, transaction.transactionID)
+
+        # Bank Is Debited Before The Goal Check Fails - Nothing May Be Left Half-Applied
+        failed, error = add_transaction(
+            transactionTitle="Overdrawn Goal",
+            transactionDesc="",
+            transactionType=TransactionType.EXPENSE,
+            transactionCategory=["FOOD"],
+            transactionAmount=10.00,
+            transactionDate="2025-01-07",
+            transactionTime="12:00",
+            bankID=bank.bankID,
+            userID=user.id,
+            goalID=goal.goalID
+        )
+
+        assert failed is None
+        assert error == "Insufficient Goal Balance"
+        assert get_bank(bank.bankID).remainingBankAmount == 60.00
+
+    def test_int_34_atomic_balance_updates(self):
+        user = create_user(name="Ada Atomic",
+                    email="ada@mail.com",
+                    password="adapass")
+
+        circle = create_circle(circleName="Atomic Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Atomic Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=100,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        budget = create_budget(budgetTitle="Atomic Groceries",
+                               budgetAmount=50.00,
+                               budgetType=BudgetType.EXPENSE,
+                               budgetCategory=["GROCERIES"],
+                               transactionScope=TransactionScope.INCLUSIVE,
+                               color="#6A3D9A",
+                               startDate="2025-01-01",
+                               endDate="2025-01-31",
+                               userID=user.id,
+                               bankID=bank.bankID)
+
+        def post(amount, category=["GROCERIES"]):
+            return add_transaction(
+                transactionTitle="Atomic Spend",
+                transactionDesc="",
+                transactionType=TransactionType.EXPENSE,
+                transactionCategory=category,
+                transactionAmount=amount,
+                transactionDate="2025-01-06",
+                transactionTime="12:00",
+                bankID=bank.bankID,
+                userID=user.id,
+                goalID=None
+            )
+
+        # Another Worker Spends From The Same Bank After This Session Loaded It
+        assert bank.remainingBankAmount == 100
+        with db.engine.begin() as connection:
+            connection.execute(update(Bank).where(Bank.bankID == bank.bankID).values(remainingBankAmount=Bank.remainingBankAmount - 10))
+
+        with count_queries() as statements:
+            _, error = post(5.00, category=["ENTERTAINMENT"])
+        assert error is None
+        assert not any(statement.lstrip().startswith("SELECT") and "FROM bank" in statement for statement in statements)
+        assert get_bank(bank.bankID).remainingBankAmount == 85
+
+        _, error = post(100.00, category=["ENTERTAINMENT"])
+        assert error == "Insufficient Bank Balance"
+
+        _, error = post(60.00)
+        assert "Insufficient Budget Balance in Inclusive Budget" in error
+        assert get_bank(bank.bankID).remainingBankAmount == 85
+        assert get_budget(budget.budgetID).remainingBudgetAmount == 50
+
+        _, error = post(20.00)
+        assert error is None
+        assert get_budget(budget.budgetID).remainingBudgetAmount == 30
+
+    def test_int_35_update_transaction_net_delta(self):
+        user = create_user(name="Nate Net",
+                    email="nate@mail.com",
+                    password="natepass")
+
+        circle = create_circle(circleName="Net Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Net Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=300,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        savings = create_bank(userID=user.id,
+                              bankTitle="Net Savings",
+                              bankCurrency="TTD",
+                              bankAmount=500,
+                              isPrimary=False,
+                              color="#6A3D9A")
+
+        linked = create_budget(budgetTitle="Net Linked",
+                               budgetAmount=100.00,
+                               budgetType=BudgetType.EXPENSE,
+                               budgetCategory=["SHOPPING"],
+                               transactionScope=TransactionScope.EXCLUSIVE,
+                               color="#6A3D9A",
+                               startDate="2025-01-01",
+                               endDate="2025-01-31",
+                               userID=user.id,
+                               bankID=bank.bankID)
+
+        inclusive = create_budget(budgetTitle="Net Groceries",
+                                  budgetAmount=200.00,
+                                  budgetType=BudgetType.EXPENSE,
+                                  budgetCategory=["GROCERIES"],
+                                  transactionScope=TransactionScope.INCLUSIVE,
+                                  color="#6A3D9A",
+                                  startDate="2025-01-01",
+                                  endDate="2025-01-31",
+                                  userID=user.id,
+                                  bankID=bank.bankID)
+
+        transaction, _ = add_transaction(
+            transactionTitle="Groceries Run",
+            transactionDesc="",
+            transactionType=TransactionType.EXPENSE,
+            transactionCategory=["GROCERIES"],
+            transactionAmount=40.00,
+            transactionDate="2025-01-06",
+            transactionTime="12:00",
+            bankID=bank.bankID,
+            userID=user.id,
+            goalID=None,
+            budgetID=linked.budgetID
+        )
+        transactionID, bankID, savingsID, linkedID, inclusiveID = transaction.transactionID, bank.bankID, savings.bankID, linked.budgetID, inclusive.budgetID
+
+        def balances():
+            return (get_bank(bankID).remainingBankAmount, get_bank(savingsID).remainingBankAmount,
+                    get_budget(linkedID).remainingBudgetAmount, get_budget(inclusiveID).remainingBudgetAmount)
+
+        def balance_updates(statements):
+            return [statement for statement in statements if statement.startswith(("UPDATE bank", "UPDATE budget", "UPDATE goal"))]
+
+        assert balances() == (260, 500, 60, 160)
+
+        with count_queries() as statements:
+            assert update_transaction(transactionID, transactionTitle="Weekly Groceries", transactionDesc="Market")
+        assert balance_updates(statements) == []
+        assert get_transaction(transactionID).budgetID == linkedID
+
+        # Linked & Inclusive Budgets Share The Same -10 Delta, So They Move In One Statement
+        with count_queries() as statements:
+            assert update_transaction(transactionID, transactionType="EXPENSE", transactionAmount=50.00)
+        assert len(balance_updates(statements)) == 2
+        assert balances() == (250, 500, 50, 150)
+
+        assert update_transaction(transactionID, bankID=savingsID, budgetID=None)
+        assert balances() == (300, 450, 100, 150)
+
+        assert update_transaction(transactionID, transactionCategory=["ENTERTAINMENT"], transactionType="Income")
+        assert balances() == (300, 550, 100, 200)
+
+        assert update_transaction(transactionID, transactionType=TransactionType.EXPENSE, transactionAmount=10000.00) is None
+        assert balances() == (300, 550, 100, 200)
+        assert get_transaction(transactionID).transactionAmount == 50.00
+
+    def test_int_36_bulk_import_transactions(self):
+        user = create_user(name="Bree Bulk",
+                    email="bree@mail.com",
+                    password="breepass")
+
+        circle = create_circle(circleName="Bulk Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Bulk Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        budget = create_budget(budgetTitle="Bulk Groceries",
+                               budgetAmount=500.00,
+                               budgetType=BudgetType.EXPENSE,
+                               budgetCategory=["GROCERIES"],
+                               transactionScope=TransactionScope.INCLUSIVE,
+                               color="#6A3D9A",
+                               startDate="2025-01-01",
+                               endDate="2025-01-31",
+                               userID=user.id,
+                               bankID=bank.bankID)
+
+        bankID, budgetID, userID, circleID = bank.bankID, budget.budgetID, user.id, circle.circleID
+
+        rows = [{"transactionTitle": f"Imported {i}", "transactionType": "EXPENSE", "transactionCategory": ["GROCERIES"],
+                 "transactionAmount": 10, "transactionDate": "2025-01-06", "transactionTime": "09:30", "bankID": bankID}
+                for i in range(5)]
+        rows.append({"transactionTitle": "Salary", "transactionType": "Income", "transactionCategory": ["INCOME"],
+                     "transactionAmount": 100, "transactionDate": "2025-01-07", "transactionTime": "08:00:00", "bankID": bankID})
+        lines = [json.dumps(row) for row in rows]
+        lines.insert(2, "{not json")
+        lines.append(json.dumps({"transactionTitle": "Elsewhere", "transactionType": "EXPENSE", "transactionAmount": 1,
+                                 "transactionDate": "2025-01-06", "transactionTime": "09:30", "bankID": 999999}))
+
+        with count_queries() as statements:
+            report = import_transactions(io.BytesIO(gzip.compress("\n".join(lines).encode("utf-8"))), userID, chunk_size=4)
+
+        assert report["imported"] == 6
+        assert report["chunks"] == 2
+        assert [failure["line"] for failure in report["failed"]] == [3, 8]
+        assert sum(statement.startswith("UPDATE bank") for statement in statements) == 2
+        assert get_bank(bankID).remainingBankAmount == 1050
+        assert get_budget(budgetID).remainingBudgetAmount == 450
+
+        imported = get_all_circle_transactions(circleID)
+        assert len(imported) == 6
+        assert imported[0]["transactionCategory"] == ["Groceries"]
+        assert all(transaction["owner"] == "Bree Bulk" for transaction in imported)
+
+        csv_body = (
+            "transactionTitle,transactionDesc,transactionType,transactionCategory,transactionAmount,transactionDate,transactionTime,bankID,budgetID,goalID\n"
+            f"Corner Shop,,EXPENSE,GROCERIES|SHOPPING,20,2025-01-08,10:15,{bankID},,\n"
+            f"Too Expensive,,EXPENSE,SHOPPING,5000,2025-01-08,10:20,{bankID},,\n"
+        )
+        report = import_transactions(io.BytesIO(csv_body.encode("utf-8")), userID, import_format="csv")
+
+        # Both Rows Share A Chunk, So The Overdraft Rolls Back The Whole Chunk
+        assert report["imported"] == 0
+        assert [failure["error"] for failure in report["failed"]] == ["Insufficient Bank Balance"] * 2
+        assert get_bank(bankID).remainingBankAmount == 1050
+
+        report = import_transactions(io.BytesIO(csv_body.encode("utf-8")), userID, import_format="csv", chunk_size=1)
+        assert report["imported"] == 1
+        assert get_bank(bankID).remainingBankAmount == 1030
+        assert get_budget(budgetID).remainingBudgetAmount == 430
+
+        # Non-Finite Amounts Parse As Floats But Must Never Reach A Balance
+        csv_body = (
+            "transactionTitle,transactionType,transactionCategory,transactionAmount,transactionDate,transactionTime,bankID\n"
+            + "".join(f"Broken {amount},EXPENSE,SHOPPING,{amount},2025-01-09,11:00,{bankID}\n" for amount in ["nan", "inf", "-inf"])
+        )
+        report = import_transactions(io.BytesIO(csv_body.encode("utf-8")), userID, import_format="csv", chunk_size=1)
+        assert report["imported"] == 0
+        assert [failure["error"] for failure in report["failed"]] == ["Invalid Transaction Amount"] * 3
+        assert get_bank(bankID).remainingBankAmount == 1030
+
+    def test_int_37_duplicate_transactions(self):
+        user = create_user(name="Dora Duplicate",
+                    email="dora@mail.com",
+                    password="dorapass")
+
+        circle = create_circle(circleName="Duplicate Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Duplicate Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        bankID, userID, circleID = bank.bankID, user.id, circle.circleID
+
+        def post(title, **kwargs):
+            return add_transaction(
+                transactionTitle=title,
+                transactionDesc="",
+                transactionType=TransactionType.EXPENSE,
+                transactionCategory=["FOOD"],
+                transactionAmount=25.00,
+                transactionDate="2025-01-06",
+                transactionTime="12:00",
+                bankID=bankID,
+                userID=userID,
+                goalID=None,
+                **kwargs
+            )
+
+        original, error = post("Team Lunch")
+        assert error is None
+
+        retried, error = post("  team   LUNCH ")
+        assert retried is None
+        assert error == DUPLICATE_TRANSACTION
+        assert get_bank(bankID).remainingBankAmount == 975
+
+        allowed, error = post("Team Lunch", allowDuplicates=True)
+        assert error is None
+        assert get_bank(bankID).remainingBankAmount == 950
+
+        # Editing The Title Re-Fingerprints The Row
+        update_transaction(allowed.transactionID, transactionTitle="Team Dinner")
+        assert get_transaction(allowed.transactionID).transactionFingerprint == transaction_fingerprint("Team Dinner", 25.00, "2025-01-06", "12:00", bankID)
+
+        rows = [
+            {"transactionTitle": "Team Lunch", "transactionType": "EXPENSE", "transactionAmount": 25, "transactionDate": "2025-01-06", "transactionTime": "12:00", "bankID": bankID},
+            {"transactionTitle": "Coffee", "transactionType": "EXPENSE", "transactionAmount": 5, "transactionDate": "2025-01-06", "transactionTime": "08:00", "bankID": bankID},
+            {"transactionTitle": "coffee", "transactionType": "EXPENSE", "transactionAmount": 5.0, "transactionDate": "2025-01-06", "transactionTime": "08:00:00", "bankID": bankID},
+        ]
+        body = "\n".join(json.dumps(row) for row in rows).encode("utf-8")
+
+        with full_table_scans() as scans:
+            report = import_transactions(io.BytesIO(body), userID)
+        assert report["imported"] == 1
+        assert [duplicate["line"] for duplicate in report["duplicates"]] == [1, 3]
+        assert get_bank(bankID).remainingBankAmount == 945
+        self.assertListEqual(scans, [])
+
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('dora@mail.com', 'dorapass')}"}
+        response = client.post("/transactions/bulk", headers=headers, data=body, content_type="application/x-ndjson")
+        assert response.status_code == 200
+        assert response.get_json()["status"] == "success"
+        assert response.get_json()["imported"] == 0 and len(response.get_json()["duplicates"]) == 3
+
+        # A Voided Transaction No Longer Blocks A Legitimate Re-Post
+        void_transaction(userID, original.transactionID)
+        _, error = post("Team Lunch")
+        assert error is None
+
+        # The React Client Sends An Unpadded Hour Outside AM/PM Times
+        payload = {"transactionTitle": "Early Bus", "transactionType": "EXPENSE", "transactionCategory": ["FOOD"],
+                   "transactionAmount": 4, "transactionDate": "2025-01-07", "transactionTime": "9:30", "bankID": bankID}
+        response = client.post("/add-transaction", headers=headers, json=payload)
+        assert response.status_code == 201
+        assert client.post("/add-transaction", headers=headers, json=payload).status_code == 409
+
+    def test_int_38_export_circle_transactions(self):
+        user = create_user(name="Esme Export",
+                    email="esme@mail.com",
+                    password="esmepass")
+
+        outsider = create_user(name="Olive Outsider",
+                    email="olive@mail.com",
+                    password="olivepass")
+
+        circle = create_circle(circleName="Export Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Export Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        bankID, userID, circleID = bank.bankID, user.id, circle.circleID
+
+        rows = [{"transactionTitle": f"Exported, {i}", "transactionType": "EXPENSE", "transactionCategory": ["GROCERIES", "SHOPPING"],
+                 "transactionAmount": 10.5, "transactionDate": "2025-01-06", "transactionTime": "09:30", "bankID": bankID}
+                for i in range(5)]
+        body = "\n".join(json.dumps(row) for row in rows).encode("utf-8")
+        assert import_transactions(io.BytesIO(body), userID)["imported"] == 5
+
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('esme@mail.com', 'esmepass')}"}
+        url = f"/circle/{circleID}/transactions/export"
+
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        assert response.mimetype == "text/csv"
+        assert response.is_streamed
+        assert "attachment" in response.headers["Content-Disposition"]
+
+        csv_lines = response.get_data(as_text=True).splitlines()
+        assert csv_lines[0] == ",".join(EXPORT_COLUMNS)
+        assert len(csv_lines) == 6
+        assert '"Exported, 0"' in csv_lines[1]
+        assert "Groceries|Shopping" in csv_lines[1]
+
+        # Exports Re-Import Cleanly - Every Row Is Recognised As Already Posted
+        report = import_transactions(io.BytesIO(response.get_data()), userID, import_format="csv")
+        assert report["imported"] == 0
+        assert report["failed"] == []
+        assert len(report["duplicates"]) == 5
+
+        response = client.get(f"{url}?format=ndjson", headers=headers)
+        assert response.mimetype == "application/x-ndjson"
+        records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        assert [record["transactionTitle"] for record in records] == [row["transactionTitle"] for row in rows]
+        assert records[0]["transactionCategory"] == ["Groceries", "Shopping"]
+        assert records[0]["transactionTime"] == "09:30:00"
+
+        # Small Batches Still Cover Every Row
+        chunks, _ = export_circle_transactions(circleID, "ndjson", batch_size=2)
+        assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+
+        assert client.get(f"{url}?format=xml", headers=headers).status_code == 400
+        outsider_headers = {"Authorization": f"Bearer {login('olive@mail.com', 'olivepass')}"}
+        assert client.get(url, headers=outsider_headers).status_code == 404
+
+        # Voided Rows Are Exported But Must Not Come Back As Live Transactions
+        void_transaction(userID, records[0]["transactionID"])
+        balance = get_bank(bankID).remainingBankAmount
+        for export_format in ("csv", "ndjson"):
+            body = client.get(f"{url}?format={export_format}", headers=headers).get_data()
+            report = import_transactions(io.BytesIO(body), userID, import_format=export_format)
+            assert report["imported"] == 0
+            assert [voided["transactionTitle"] for voided in report["voided"]] == ["Exported, 0"]
+            assert len(report["duplicates"]) == 4
+        assert get_bank(bankID).remainingBankAmount == balance
+        assert len(get_all_circle_transactions(circleID)) == 5
+
+    def test_int_39_streamed_transaction_lists(self):
+        user = create_user(name="Stella Stream",
+                    email="stella@mail.com",
+                    password="stellapass")
+
+        circle = create_circle(circleName="Stream Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Stream Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        bankID, userID, circleID = bank.bankID, user.id, circle.circleID
+
+        rows = [{"transactionTitle": f"Streamed {i}", "transactionType": "EXPENSE", "transactionCategory": ["SHOPPING"],
+                 "transactionAmount": 1 + i, "transactionDate": f"2025-02-{i + 1:02d}", "transactionTime": "10:00", "bankID": bankID}
+                for i in range(5)]
+        body = "\n".join(json.dumps(row) for row in rows).encode("utf-8")
+        assert import_transactions(io.BytesIO(body), userID)["imported"] == 5
+
+        client = current_app.test_client()
+        url = f"/circle/{circleID}/transactions"
+
+        for query in ("", "?limit=2"):
+            buffered = client.get(url + query)
+            streamed = client.get(url + query + ("&" if query else "?") + "stream=1")
+            assert streamed.status_code == 200
+            assert streamed.is_streamed
+            assert streamed.get_json() == buffered.get_json()
+
+        page = client.get(f"{url}?limit=2&stream=1").get_json()
+        assert [transaction["transactionTitle"] for transaction in page["transactions"]] == ["Streamed 4", "Streamed 3"]
+        last = client.get(f"{url}?limit=2&stream=1&cursor={page['next_cursor']}").get_json()
+        assert last["next_cursor"] is not None
+        last = client.get(f"{url}?limit=2&stream=1&cursor={last['next_cursor']}").get_json()
+        assert [transaction["transactionTitle"] for transaction in last["transactions"]] == ["Streamed 0"]
+        assert last["next_cursor"] is None
+
+        # An Invalid Cursor Is Rejected Before The Stream Starts
+        assert client.get(f"{url}?limit=2&stream=1&cursor=bogus").status_code == 400
+
+        # Rows Are Flushed As The Buffer Fills, Not Held Until The End
+        transactions, _ = get_circle_transactions_page(circleID, stream=True)
+        chunks = list(iter_json_object({"status": "success"}, "transactions", transactions, buffer_size=1))
+        assert len(chunks) == 6
+        assert json.loads("".join(chunks))["transactions"] == get_all_circle_transactions(circleID)
+
+    def test_int_41_sparse_fieldsets(self):
+        user = create_user(name="Fern Fields",
+                    email="fern@mail.com",
+                    password="fernpass")
+
+        circle = create_circle(circleName="Fields Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#6A3D9A",
+                        circleImage="https://picsum.photos/id/82/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Fields Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#6A3D9A")
+
+        create_budget(budgetTitle="Fields Budget",
+                      budgetAmount=100.00,
+                      budgetType=BudgetType.EXPENSE,
+                      budgetCategory=["GROCERIES"],
+                      transactionScope=TransactionScope.EXCLUSIVE,
+                      color="#6A3D9A",
+                      startDate="2025-01-01",
+                      endDate="2025-01-31",
+                      userID=user.id,
+                      bankID=bank.bankID)
+
+        bankID, userID, circleID = bank.bankID, user.id, circle.circleID
+
+        rows = [{"transactionTitle": f"Sparse {i}", "transactionType": "EXPENSE", "transactionAmount": 1, "transactionDate": "2025-01-06",
+                 "transactionTime": f"10:0{i}", "bankID": bankID} for i in range(3)]
+        import_transactions(io.BytesIO("\n".join(json.dumps(row) for row in rows).encode("utf-8")), userID)
+
+        # Only The Row Query Runs - No Bank Join, Attachment Or Owner Loads
+        db.session.expire_all()
+        with count_queries() as statements:
+            transactions, _ = get_circle_transactions_page(circleID, limit=2, fields=("transactionID", "transactionTitle"))
+        assert len(statements) == 1
+        assert "JOIN" not in statements[0]
+        assert transactions == [{"transactionID": t["transactionID"], "transactionTitle": t["transactionTitle"]}
+                                for t in get_circle_transactions_page(circleID, limit=2)[0]]
+
+        # Skipping The Amount Fields Skips The Owner Currency Lookup
+        db.session.expire_all()
+        with count_queries() as statements:
+            budgets = get_budget_by_circle_json(circleID, ("budgetTitle",))
+        assert budgets == [{"budgetTitle": "Fields Budget"}]
+        assert len(statements) == 1
+
+        db.session.expire_all()
+        with count_queries() as statements:
+            banks = get_bank_by_circle_json(circleID, ("bankTitle", "remainingBankAmount"))
+        assert banks == [{"bankTitle": "Fields Wallet", "remainingBankAmount": "TT$997.00"}]
+        assert len(statements) == 1
+
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('fern@mail.com', 'fernpass')}"}
+        response = client.get("/transactions?fields=transactionTitle,%20owner&limit=1", headers=headers)
+        assert response.get_json()["transactions"] == [{"transactionTitle": "Sparse 2", "owner": "Fern Fields"}]
+        assert client.get(f"/circle/{circleID}?fields=circleName", headers=headers).get_json()["circle"] == {"circleName": "Fields Circle"}
+
+        response = client.get("/banks?fields=bankTitle,password", headers=headers)
+        assert response.status_code == 400
+        assert response.get_json()["message"] == "Unknown Field(s): password"
+        assert client.get("/budgets?fields=", headers=headers).status_code == 400
+
+    def test_int_42_v2_wire_schema(self):
+        user = create_user(name="Vera Version",
+                    email="vera@mail.com",
+                    password="verapass")
+
+        circle = create_circle(circleName="Wire Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#1F78B4",
+                        circleImage="https://picsum.photos/id/83/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Wire Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#1F78B4")
+
+        budget = create_budget(budgetTitle="Wire Budget",
+                               budgetAmount=100.00,
+                               budgetType=BudgetType.EXPENSE,
+                               budgetCategory=["GROCERIES"],
+                               transactionScope=TransactionScope.EXCLUSIVE,
+                               color="#1F78B4",
+                               startDate="2025-01-01",
+                               endDate="2025-01-31",
+                               userID=user.id,
+                               bankID=bank.bankID)
+
+        bankID, budgetID, userID, circleID = bank.bankID, budget.budgetID, user.id, circle.circleID
+
+        rows = [{"transactionTitle": f"Wire {i}", "transactionType": "EXPENSE", "transactionAmount": 12.5, "transactionDate": "2025-01-07",
+                 "transactionTime": f"09:3{i}", "bankID": bankID, "budgetID": budgetID} for i in range(2)]
+        import_transactions(io.BytesIO("\n".join(json.dumps(row) for row in rows).encode("utf-8")), userID)
+
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('vera@mail.com', 'verapass')}"}
+
+        # Raw Amounts With A Currency Code, ISO Timestamps, Enum Names & Owner IDs
+        response = client.get("/v2/transactions?limit=1", headers=headers)
+        assert response.status_code == 200
+        transaction = response.get_json()["transactions"][0]
+        assert transaction["transactionTitle"] == "Wire 1"
+        assert transaction["transactionAmount"] == 12.5
+        assert transaction["currency"] == "TTD"
+        assert transaction["transactionAt"] == "2025-01-07T09:31:00"
+        assert transaction["transactionType"] == "EXPENSE"
+        assert transaction["ownerID"] == userID
+        assert client.get(f"/v2/transaction/{transaction['transactionID']}").get_json()["transaction"] == transaction
+
+        # v1 Is Unchanged
+        v1 = client.get("/transactions?limit=1", headers=headers).get_json()["transactions"][0]
+        assert v1["transactionAmount"] != 12.5 and "currency" not in v1 and "transactionAt" not in v1
+
+        bank = client.get("/v2/banks", headers=headers).get_json()["banks"][0]
+        assert (bank["currency"], bank["bankAmount"], bank["remainingBankAmount"], bank["ownerID"]) == ("TTD", 1000, 975, userID)
+
+        budget = client.get(f"/v2/budget/{budgetID}").get_json()["budget"]
+        assert (budget["currency"], budget["budgetType"], budget["startDate"], budget["ownerID"]) == ("TTD", "EXPENSE", "2025-01-01", userID)
+        assert client.get(f"/v2/circle/{circleID}").get_json()["circle"]["circleType"] == "SELF"
+
+        snapshot = client.get(f"/v2/circle/{circleID}/snapshot", headers=headers).get_json()
+        assert snapshot["transactions"][0]["currency"] == "TTD"
+        assert snapshot["banks"][0]["bankAmount"] == 1000
+
+        # Fields Are Checked Against The v2 Map & Streaming Works As In v1
+        response = client.get(f"/v2/budget/{budgetID}/transactions?fields=transactionAmount,currency", headers=headers)
+        assert response.get_json()["transactions"] == [{"transactionAmount": 12.5, "currency": "TTD"}] * 2
+        assert client.get("/v2/transactions?fields=owner", headers=headers).status_code == 400
+        streamed = client.get(f"/v2/bank/{bankID}/transactions?stream=1&limit=5&fields=transactionAt", headers=headers)
+        assert json.loads(streamed.get_data()) == {"status": "success", "transactions": [{"transactionAt": "2025-01-07T09:31:00"},
+                                                   {"transactionAt": "2025-01-07T09:30:00"}], "next_cursor": None}
+        assert client.get("/v2/goal/9999/transactions").status_code == 404
+
+    def test_int_43_columnar_transaction_pages(self):
+        user = create_user(name="Cole Columns",
+                    email="cole@mail.com",
+                    password="colepass")
+
+        circle = create_circle(circleName="Columnar Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#33A02C",
+                        circleImage="https://picsum.photos/id/84/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Columnar Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#33A02C")
+
+        bankID, userID = bank.bankID, user.id
+
+        rows = [{"transactionTitle": f"Column {i}", "transactionType": "EXPENSE" if i % 2 else "INCOME", "transactionCategory": ["GROCERIES"],
+                 "transactionAmount": 2, "transactionDate": "2025-01-08", "transactionTime": f"11:0{i}", "bankID": bankID} for i in range(3)]
+        import_transactions(io.BytesIO("\n".join(json.dumps(row) for row in rows).encode("utf-8")), userID)
+
+        client = current_app.test_client()
+        headers = {"Authorization": f"Bearer {login('cole@mail.com', 'colepass')}"}
+
+        # Decoding The Columnar Page Gives Back The Row Page
+        expected = client.get("/transactions?limit=3", headers=headers).get_json()["transactions"]
+
+        # Columns Come Straight From The Loaded Rows, Never Via Serialized Row Objects
+        with unittest.mock.patch("App.controllers.transaction.to_json_list", side_effect=AssertionError):
+            page = client.get("/transactions?limit=3&format=columnar", headers=headers).get_json()["transactions"]
+        columns, dictionaries = page["columns"], page["dictionaries"]
+        decoded = [{field: dictionaries[field][values[i]] if field in dictionaries else values[i] for field, values in columns.items()}
+                   for i in range(page["count"])]
+        assert decoded == expected
+        assert dictionaries["transactionType"] == ["Income", "Expense"] and columns["transactionType"] == [0, 1, 0]
+        assert dictionaries["transactionBank"] == [bankID] and dictionaries["owner"] == ["Cole Columns"]
+
+        # Sparse Fields Pick The Columns, On v1 & v2
+        page = client.get(f"/v2/bank/{bankID}/transactions?format=columnar&fields=transactionAmount,currency", headers=headers).get_json()["transactions"]
+        assert page == {"count": 3, "columns": {"transactionAmount": [2, 2, 2], "currency": [0, 0, 0]}, "dictionaries": {"currency": ["TTD"]}}
+        assert client.get("/v2/bank/999999/transactions?format=columnar", headers=headers).status_code == 404
+
+        assert client.get("/transactions?format=columnar&stream=1", headers=headers).status_code == 400
+        assert client.get("/transactions?format=xml", headers=headers).status_code == 400
+
+    @unittest.skipIf(msgpack is None, "msgpack Is Not Installed")
+    def test_int_44_msgpack_negotiation(self):
+        user = create_user(name="Max Packer",
+                    email="max@mail.com",
+                    password="maxpass")
+
+        circle = create_circle(circleName="Packed Circle",
+                        circleType=CircleType.SELF,
+                        circleColor="#E31A1C",
+                        circleImage="https://picsum.photos/id/85/300/300.jpg",
+                        userID=user.id)
+
+        set_active_circle(userID=user.id, circleID=circle.circleID)
+
+        bank = create_bank(userID=user.id,
+                           bankTitle="Packed Wallet",
+                           bankCurrency="TTD",
+                           bankAmount=1000,
+                           isPrimary=True,
+                           color="#E31A1C")
+
+        rows = [{"transactionTitle": f"Packed {i}", "transactionType": "EXPENSE", "transactionCategory": ["GROCERIES"], "transactionAmount": 3,
+                 "transactionDate": "2025-01-09", "transactionTime": f"12:0{i}", "bankID": bank.bankID} for i in range(2)]
+        import_transactions(io.BytesIO("\n".join(json.dumps(row) for row in rows).encode("utf-8")), user.id)
+
+        client = current_app.test_client()
+        token = login('max@mail.com', 'maxpass')
+        packed = {"Authorization": f"Bearer {token}", "Accept": "application/msgpack"}
+
+        # The Same Values As The JSON Body - Native Dates Included - Across Blueprints
+        for path in ("/transactions", "/v2/transactions", f"/circle/{circle.circleID}/snapshot", "/ffm/categories", "/user"):
+            response = client.get(path, headers=packed)
+            assert response.mimetype == "application/msgpack"
+            assert "Accept" in response.vary
+            assert msgpack.unpackb(response.get_data()) == client.get(path, headers={"Authorization": f"Bearer {token}"}).get_json()
+
+        # JSON Stays The Default, Including For */* & When JSON Is Preferred
+        for accept in (None, "*/*", "application/json, application/msgpack;q=0.5"):
+            headers = {"Authorization": f"Bearer {token}", **({"Accept": accept} if accept else {})}
+            assert client.get("/banks", headers=headers).mimetype == "application/json"
+
+        # Errors Are Negotiated Too, While Streamed Bodies Stay JSON
+        response = client.get("/v2/goal/9999/transactions", headers=packed)
+        assert response.status_code == 404 and msgpack.unpackb(response.get_data())["status"] == "error"
+        assert client.get("/transactions?stream=1", headers=packed).mimetype == "application/json"
@@ -9,6 +9,7 @@ from .circle import circle_views
 from .transaction import transaction_views
 from .bank import bank_views
 from .static import static_views
+from .v2 import v2_views
 
 # Blueprints Are Then Added To This List!
 views = [
@@ -20,5 +21,6 @@ views = [
         circle_views,
         transaction_views,
         bank_views,
-        static_views
+        static_views,
+        v2_views
     ]
\ No newline at end of file
@@ -1,16 +1,23 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from App.models import Bank, Budget, Transaction
+from App.services.fields import parse_fields
+from App.services.conditional import conditional_view
+from App.services.pagination import parse_page_args
+from App.services.streaming import wants_stream, stream_page_response
+from App.services.columnar import wants_columnar
 
 from App.controllers import (
     create_bank,
     update_bank,
     delete_bank,
     get_bank_json,
-    get_user,
     get_circle_banks_json,
     get_all_bank_budgets,
     get_bank_users_json,
-    get_all_bank_transactions
+    get_bank_transactions_page,
+    active_circle_version_tag,
+    current_active_circle_id
 )
 
 bank_views = Blueprint('bank_views', __name__)
@@ -52,14 +59,17 @@ def new_bank():
 # 2. List User Banks
 @bank_views.route('/banks', methods=['GET'])
 @jwt_required()
+@conditional_view(active_circle_version_tag)
 def list_user_banks():
     try:
-        userID = get_jwt_identity()
-        user = get_user(userID)
-        circleID = user.activeCircleID
-        banks = get_circle_banks_json(circleID)
+        circleID = current_active_circle_id()
+        fields = parse_fields(request.args, Bank.JSON_FIELDS)
+        banks = get_circle_banks_json(circleID, fields)
         return jsonify({"status": "success", "banks": banks}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Banks"}), 500
@@ -69,9 +79,13 @@ def list_user_banks():
 @jwt_required()
 def get_bank_details(bankID):
     try:
-        bank_data = get_bank_json(bankID)
+        fields = parse_fields(request.args, Bank.JSON_FIELDS)
+        bank_data = get_bank_json(bankID, fields)
         return jsonify({"status": "success", "bank": bank_data}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Bank"}), 500
@@ -81,8 +95,17 @@ def get_bank_details(bankID):
 @jwt_required()
 def get_bank_transactions(bankID):
     try:
-        transactions = get_all_bank_transactions(bankID)
-        return jsonify({"status":"success", "transactions": transactions}), 200
+        limit, cursor = parse_page_args(request.args)
+        stream = wants_stream(request.args)
+        columnar = wants_columnar(request.args)
+        fields = parse_fields(request.args, Transaction.JSON_FIELDS)
+        transactions, next_cursor = get_bank_transactions_page(bankID, limit=limit, cursor=cursor, stream=stream, fields=fields, columnar=columnar)
+        if stream:
+            return stream_page_response("transactions", transactions), 200
+        return jsonify({"status":"success", "transactions": transactions, "next_cursor": next_cursor}), 200
+
+    except ValueError as e:
+        return jsonify({"status":"error", "message": str(e)}), 400
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
@@ -92,9 +115,13 @@ def get_bank_transactions(bankID):
 @bank_views.route('/bank/<int:bankID>/budgets', methods=['GET'])
 def get_bank_budgets(bankID):
     try:
-        budgets = get_all_bank_budgets(bankID)
+        fields = parse_fields(request.args, Budget.JSON_FIELDS)
+        budgets = get_all_bank_budgets(bankID, fields)
         return jsonify({"status":"success", "budgets": budgets}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status":"error", "message": f"Failed To Fetch Budgets: {str(e)}"}), 500
@@ -1,15 +1,22 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from App.models import Budget, Transaction
+from App.services.fields import parse_fields
+from App.services.conditional import conditional_view
+from App.services.pagination import parse_page_args
+from App.services.streaming import wants_stream, stream_page_response
+from App.services.columnar import wants_columnar
 
 from App.controllers import (
     create_budget,
     delete_budget,
     update_budget,
-    get_user,
     get_budget_json,
     get_budget_users_json,
     get_circle_budgets_json,
-    get_all_budget_transactions
+    get_budget_transactions_page,
+    active_circle_version_tag,
+    current_active_circle_id
 )
 
 budget_views = Blueprint('budget_views', __name__)
@@ -59,14 +66,17 @@ def new_budget():
 # 2. List User Budgets
 @budget_views.route('/budgets', methods=['GET'])
 @jwt_required()
+@conditional_view(active_circle_version_tag)
 def list_user_budgets():
     try:
-        userID = get_jwt_identity()
-        user = get_user(userID)
-        circleID = user.activeCircleID
-        budgets = get_circle_budgets_json(circleID)
+        circleID = current_active_circle_id()
+        fields = parse_fields(request.args, Budget.JSON_FIELDS)
+        budgets = get_circle_budgets_json(circleID, fields)
         return jsonify({"status": "success", "budgets": budgets}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Budgets"}), 500
@@ -75,9 +85,13 @@ def list_user_budgets():
 @budget_views.route('/budget/<int:budgetID>', methods=['GET'])
 def get_budget_details(budgetID):
     try:
-        budget_data = get_budget_json(budgetID)
+        fields = parse_fields(request.args, Budget.JSON_FIELDS)
+        budget_data = get_budget_json(budgetID, fields)
         return jsonify({"status": "success", "budget": budget_data}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Budget"}), 500
@@ -86,8 +100,17 @@ def get_budget_details(budgetID):
 @budget_views.route('/budget/<int:budgetID>/transactions', methods=['GET'])
 def get_budget_transactions(budgetID):
     try:
-        transactions = get_all_budget_transactions(budgetID)
-        return jsonify({"status":"success", "transactions": transactions}), 200
+        limit, cursor = parse_page_args(request.args)
+        stream = wants_stream(request.args)
+        columnar = wants_columnar(request.args)
+        fields = parse_fields(request.args, Transaction.JSON_FIELDS)
+        transactions, next_cursor = get_budget_transactions_page(budgetID, limit=limit, cursor=cursor, stream=stream, fields=fields, columnar=columnar)
+        if stream:
+            return stream_page_response("transactions", transactions), 200
+        return jsonify({"status":"success", "transactions": transactions, "next_cursor": next_cursor}), 200
+
+    except ValueError as e:
+        return jsonify({"status":"error", "message": str(e)}), 400
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
@@ -1,20 +1,30 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from App.models import Circle, Transaction
+from App.services.fields import parse_fields
+from App.services.conditional import conditional_view
+from App.services.pagination import parse_page_args
+from App.services.streaming import wants_stream, stream_page_response
+from App.services.columnar import wants_columnar
 
 from App.controllers import (
     create_circle,
     get_user_circles_json,
     get_circle_json,
-    get_all_circle_transactions,
+    get_circle_transactions_page,
     get_circle_users_json,
     delete_circle,
     update_circle,
     get_user,
     get_circle,
     set_active_circle,
-    get_active_circle
+    export_circle_transactions,
+    get_circle_snapshot,
+    get_circle_version_tag,
+    current_active_circle_id,
+    refresh_user_token
 )
-from App.controllers.userCircle import add_to_circle
+from App.controllers.userCircle import add_to_circle, is_circle_member
 
 circle_views = Blueprint('circle_views', __name__)
 
@@ -56,30 +66,49 @@ def new_circle():
 def list_user_circles():
     try:
         userID = get_jwt_identity()
-        circles = get_user_circles_json(userID)
+        fields = parse_fields(request.args, Circle.JSON_FIELDS)
+        circles = get_user_circles_json(userID, fields)
         return jsonify({"status": "success", "circles": circles}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Circles"}), 500
 
 # 3. Retrieve A Specific Circle
 @circle_views.route('/circle/<int:circleID>', methods=['GET'])
+@conditional_view(get_circle_version_tag)
 def get_circle_details(circleID):
     try:
-        circle_data = get_circle_json(circleID)
+        fields = parse_fields(request.args, Circle.JSON_FIELDS)
+        circle_data = get_circle_json(circleID, fields)
         return jsonify({"status": "success", "circle": circle_data}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Circle"}), 500
 
 # 4. Retrieve Circle Transactions
 @circle_views.route('/circle/<int:circleID>/transactions', methods=['GET'])
+@conditional_view(get_circle_version_tag)
 def get_circle_transactions(circleID):
     try:
-        transactions = get_all_circle_transactions(circleID)
-        return jsonify({"status":"success", "transactions": transactions}), 200
+        limit, cursor = parse_page_args(request.args)
+        stream = wants_stream(request.args)
+        columnar = wants_columnar(request.args)
+        fields = parse_fields(request.args, Transaction.JSON_FIELDS)
+        transactions, next_cursor = get_circle_transactions_page(circleID, limit=limit, cursor=cursor, stream=stream, fields=fields, columnar=columnar)
+        if stream:
+            return stream_page_response("transactions", transactions), 200
+        return jsonify({"status":"success", "transactions": transactions, "next_cursor": next_cursor}), 200
+
+    except ValueError as e:
+        return jsonify({"status":"error", "message": str(e)}), 400
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
@@ -87,6 +116,7 @@ def get_circle_transactions(circleID):
 
 # 5. Retrieve Circle Users
 @circle_views.route('/circle/<int:circleID>/users', methods=['GET'])
+@conditional_view(get_circle_version_tag)
 def get_circle_users(circleID):
     try:
         users = get_circle_users_json(circleID)
@@ -141,14 +171,18 @@ def update_user_circle(circleID):
 @jwt_required()
 def get_active_circle_route():
     try:
-        userID = get_jwt_identity()
-        active_circle = get_active_circle(userID)
+        circleID = current_active_circle_id()
+        fields = parse_fields(request.args, Circle.JSON_FIELDS)
+        active_circle = get_circle(circleID) if circleID else None
 
         if active_circle:
-            return jsonify({"status": "success", "activeCircle": active_circle.get_json()}), 200
+            return jsonify({"status": "success", "activeCircle": active_circle.get_json(fields)}), 200
         else:
             return jsonify({"status": "error", "message": "Active Circle Not Found For This User"}), 404
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"Error Getting Active Circle: {e}")
         return jsonify({"status": "error", "message": "An Error Occurred While Fetching Active Circle"}), 500
@@ -166,7 +200,9 @@ def set_active_circle_route():
             return jsonify({"status": "error", "message": "UserID And CircleID Are Required"}), 400
 
         set_active_circle(userID, circleID)
-        return jsonify({"status": "success", "message": "Active Circle Updated Successfully"}), 200
+
+        # The Active Circle Travels In The Token, So Clients Swap In The Refreshed One
+        return jsonify({"status": "success", "message": "Active Circle Updated Successfully", "access_token": refresh_user_token(userID)}), 200
 
     except Exception as e:
         print(f"Error setting active circle: {e}")
@@ -193,4 +229,44 @@ def add_user_to_circle():
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
-        return jsonify({"status": "error", "message": "An error occurred while processing your request."}), 500
\ No newline at end of file
+        return jsonify({"status": "error", "message": "An error occurred while processing your request."}), 500
+
+# 11. Export Circle Transactions - Streams CSV / NDJSON Without Buffering The Whole Circle
+@circle_views.route('/circle/<int:circleID>/transactions/export', methods=['GET'])
+@jwt_required()
+def export_transactions(circleID):
+    try:
+        userID = get_jwt_identity()
+        if not is_circle_member(userID, circleID):
+            return jsonify({"status": "error", "message": "Circle Not Found"}), 404
+
+        export_format = request.args.get('format', 'csv')
+        chunks, mimetype = export_circle_transactions(circleID, export_format)
+
+        response = Response(stream_with_context(chunks), mimetype=mimetype)
+        response.headers['Content-Disposition'] = f'attachment; filename="circle-{circleID}-transactions.{export_format}"'
+        return response
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": f"Failed To Export Transactions: {str(e)}"}), 500
+
+# 12. Circle Snapshot - Active Circle, Banks, Budgets, Goals, Recent Transactions & Users In One Response
+@circle_views.route('/circle/<int:circleID>/snapshot', methods=['GET'])
+@jwt_required()
+@conditional_view(get_circle_version_tag)
+def get_snapshot(circleID):
+    try:
+        userID = get_jwt_identity()
+        snapshot = get_circle_snapshot(circleID, userID)
+
+        if snapshot is None:
+            return jsonify({"status": "error", "message": "Circle Not Found"}), 404
+        return jsonify({"status": "success", **snapshot}), 200
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": f"Failed To Fetch Snapshot: {str(e)}"}), 500
@@ -1,16 +1,23 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from App.models import Goal, Transaction
+from App.services.fields import parse_fields
+from App.services.conditional import conditional_view
+from App.services.pagination import parse_page_args
+from App.services.streaming import wants_stream, stream_page_response
+from App.services.columnar import wants_columnar
 
 from App.controllers import (
     create_goal,
     delete_goal,
     update_goal,
-    get_user,
     get_circle_goals_json,
     get_goal_json,
     get_goal_users_json,
     get_user_goals_json,
-    get_all_goal_transactions
+    get_goal_transactions_page,
+    active_circle_version_tag,
+    current_active_circle_id
 )
 
 goal_views = Blueprint('goal_views', __name__)
@@ -54,14 +61,17 @@ def new_goal():
 # 2. List User Goals
 @goal_views.route('/goals', methods=['GET'])
 @jwt_required()
+@conditional_view(active_circle_version_tag)
 def list_user_goals():
     try:
-        userID = get_jwt_identity()
-        user = get_user(userID)
-        circleID = user.activeCircleID
-        goals = get_circle_goals_json(circleID)
+        circleID = current_active_circle_id()
+        fields = parse_fields(request.args, Goal.JSON_FIELDS)
+        goals = get_circle_goals_json(circleID, fields)
         return jsonify({"status": "success", "goals": goals}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Goals"}), 500
@@ -70,9 +80,13 @@ def list_user_goals():
 @goal_views.route('/goal/<int:goalID>', methods=['GET'])
 def get_goal_details(goalID):
     try:
-        goal_data = get_goal_json(goalID)
+        fields = parse_fields(request.args, Goal.JSON_FIELDS)
+        goal_data = get_goal_json(goalID, fields)
         return jsonify({"status": "success", "goal": goal_data}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Goal"}), 500
@@ -81,8 +95,17 @@ def get_goal_details(goalID):
 @goal_views.route('/goal/<int:goalID>/transactions', methods=['GET'])
 def get_goal_transactions(goalID):
     try:
-        transactions = get_all_goal_transactions(goalID)
-        return jsonify({"status":"success", "transactions": transactions}), 200
+        limit, cursor = parse_page_args(request.args)
+        stream = wants_stream(request.args)
+        columnar = wants_columnar(request.args)
+        fields = parse_fields(request.args, Transaction.JSON_FIELDS)
+        transactions, next_cursor = get_goal_transactions_page(goalID, limit=limit, cursor=cursor, stream=stream, fields=fields, columnar=columnar)
+        if stream:
+            return stream_page_response("transactions", transactions), 200
+        return jsonify({"status":"success", "transactions": transactions, "next_cursor": next_cursor}), 200
+
+    except ValueError as e:
+        return jsonify({"status":"error", "message": str(e)}), 400
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify
 from App.controllers import initialize
+from App.services.coalesce import get_single_flight
 
 index_views = Blueprint('index_views', __name__)
 
@@ -14,4 +15,6 @@ def init():
 
 @index_views.route('/health', methods=['GET'])
 def health_check():
-    return jsonify({'status':'healthy'})
\ No newline at end of file
+    # Coalescing Counters Are Per Worker Process
+    single_flight = get_single_flight()
+    return jsonify({'status':'healthy', 'coalescing': single_flight.stats() if single_flight else None})
\ No newline at end of file
@@ -1,13 +1,44 @@
-from flask import Blueprint, jsonify
+import json
+import hashlib
+from functools import lru_cache
+from flask import Blueprint, Response, jsonify, request
 from App.services.category import CategoryService
+from App.services.jsonProvider import MSGPACK_MIMETYPES, msgpack, wants_msgpack
 
 static_views = Blueprint('static_views', __name__)
 
+def serialize_static(payload, packed=False):
+    if packed:
+        body = msgpack.packb(payload)
+    else:
+        body = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return body, hashlib.sha256(body).hexdigest()
+
+# Serialized Once Per Process & Encoding - Categories Never Change While The Worker Is Running
+@lru_cache(maxsize=2)
+def categories_body(packed=False):
+    categories = dict(CategoryService.get_index().categories)
+    return serialize_static({"status": "success", "categories": categories}, packed)
+
+@lru_cache(maxsize=128)
+def category_body(category_key, packed=False):
+    category = CategoryService.get_category(category_key)
+    return serialize_static({"status": "success", "category": category}, packed)
+
+def static_response(body, etag, packed=False):
+    response = Response(body, mimetype=MSGPACK_MIMETYPES[0] if packed else "application/json")
+    if msgpack is not None:
+        response.vary.add("Accept")
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 @static_views.route('/ffm/categories', methods=['GET'])
 def get_categories():
     try:
-        categories = CategoryService.load_transaction_categories()
-        return jsonify({"status":"success", "categories": categories})
+        packed = wants_msgpack()
+        body, etag = categories_body(packed)
+        return static_response(body, etag, packed)
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
@@ -16,9 +47,10 @@ def get_categories():
 @static_views.route('/ffm/categories/<string:category_key>', methods=['GET'])
 def get_category(category_key):
     try:
-        category = CategoryService.get_category(category_key)
-        return jsonify({"status":"success", "category": category})
+        packed = wants_msgpack()
+        body, etag = category_body(category_key.upper(), packed)
+        return static_response(body, etag, packed)
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
-        return jsonify({"status":"error", "message": str(e)}), 500
\ No newline at end of file
+        return jsonify({"status":"error", "message": str(e)}), 500
@@ -1,13 +1,23 @@
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import get_jwt_identity, jwt_required
+from App.models import Transaction
+from App.services.fields import parse_fields
+from App.services.conditional import conditional_view
+from App.services.pagination import parse_page_args
+from App.services.streaming import wants_stream, stream_page_response
+from App.services.columnar import wants_columnar
 
 from App.controllers import (
     get_transaction_json,
-    get_circle_transactions_json,
-    get_user,
+    get_circle_transactions_page,
     add_transaction,
     void_transaction,
-    update_transaction
+    update_transaction,
+    UNCHANGED,
+    DUPLICATE_TRANSACTION,
+    import_transactions,
+    active_circle_version_tag,
+    current_active_circle_id
 )
 
 transaction_views = Blueprint('transaction_views', __name__)
@@ -31,6 +41,7 @@ def new_transaction():
         goalID = data.get('goalID')
         userIDs = data.get('userIDs') or []
         attachments = data.get('attachments') or []
+        allowDuplicates = bool(data.get('allowDuplicates'))
 
         if not all([userID, transactionTitle, transactionType, transactionAmount, transactionDate,
                     transactionTime, bankID]):
@@ -52,9 +63,13 @@ def new_transaction():
             budgetID=budgetID,
             bankID=bankID,
             goalID=goalID,
-            attachments=attachments
+            attachments=attachments,
+            allowDuplicates=allowDuplicates
         )
 
+        if error_message == DUPLICATE_TRANSACTION:
+            return jsonify({"status": "error", "message": error_message}), 409
+
         if error_message:
             return jsonify({"status": "error", "message": error_message}), 500
 
@@ -72,13 +87,21 @@ def new_transaction():
 # 2. List User Transactions
 @transaction_views.route('/transactions', methods=['GET'])
 @jwt_required()
+@conditional_view(active_circle_version_tag)
 def list_user_transactions():
     try:
-        userID = get_jwt_identity()
-        user = get_user(userID)
-        circleID = user.activeCircleID
-        transactions = get_circle_transactions_json(circleID)
-        return jsonify({"status":"success", "transactions": transactions}), 200
+        circleID = current_active_circle_id()
+        limit, cursor = parse_page_args(request.args)
+        stream = wants_stream(request.args)
+        columnar = wants_columnar(request.args)
+        fields = parse_fields(request.args, Transaction.JSON_FIELDS)
+        transactions, next_cursor = get_circle_transactions_page(circleID, limit=limit, cursor=cursor, stream=stream, fields=fields, columnar=columnar)
+        if stream:
+            return stream_page_response("transactions", transactions), 200
+        return jsonify({"status":"success", "transactions": transactions, "next_cursor": next_cursor}), 200
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
@@ -88,9 +111,13 @@ def list_user_transactions():
 @transaction_views.route('/transaction/<int:transactionID>', methods=['GET'])
 def get_transation_details(transactionID):
     try:
-        transaction_data = get_transaction_json(transactionID)
+        fields = parse_fields(request.args, Transaction.JSON_FIELDS)
+        transaction_data = get_transaction_json(transactionID, fields)
         return jsonify({"status": "success", "transaction": transaction_data}), 200
 
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
     except Exception as e:
         print(f"An Error Occurred: {e}")
         return jsonify({"status": "error", "message": "Failed To Fetch Transaction"}), 500
@@ -128,8 +155,9 @@ def update_user_transaction(transactionID):
         transactionDate = data.get('transactionDate')
         transactionTime = data.get('transactionTime')
         voided = data.get('voided')
-        budgetID = data.get('budgetID')
-        goalID = data.get('goalID')
+        # Omitted Links Are Left Alone, An Explicit null Unlinks
+        budgetID = data.get('budgetID', UNCHANGED)
+        goalID = data.get('goalID', UNCHANGED)
         bankID = data.get('bankID')
 
         updated_transaction = update_transaction (
@@ -154,4 +182,37 @@ def update_user_transaction(transactionID):
 
     except Exception as e:
         print(f"An Error Occurred: {e}")
-        return jsonify({"status": "error", "message": f"Failed To Update Budget: {str(e)}"}), 500
\ No newline at end of file
+        return jsonify({"status": "error", "message": f"Failed To Update Budget: {str(e)}"}), 500
+
+# Bulk Import Formats By Content-Type | ?format= Takes Precedence
+IMPORT_CONTENT_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonlines": "ndjson",
+    "text/csv": "csv"
+}
+
+# 6. Bulk Import Transactions - NDJSON Or CSV, Optionally gzip Compressed
+@transaction_views.route('/transactions/bulk', methods=['POST'])
+@jwt_required()
+def bulk_import_transactions():
+    try:
+        userID = get_jwt_identity()
+        import_format = request.args.get('format') or IMPORT_CONTENT_TYPES.get(request.mimetype, "ndjson")
+
+        allow_duplicates = request.args.get('allowDuplicates', '').lower() in ('1', 'true')
+
+        report = import_transactions(request.stream, userID, import_format=import_format, allow_duplicates=allow_duplicates)
+        # Nothing Imported Is Only An Error When Rows Failed - An All-Duplicate Re-Import Is A Clean No-Op
+        if report["imported"]:
+            return jsonify({"status": "success", **report}), 201
+        if report["failed"]:
+            return jsonify({"status": "error", **report}), 400
+        return jsonify({"status": "success", **report}), 200
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": f"Failed To Import Transactions: {str(e)}"}), 500
@@ -0,0 +1,293 @@
+from flask import Blueprint, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from App.models import Bank, Budget, Circle, Goal, Transaction
+from App.services.fields import parse_fields
+from App.services.conditional import conditional_view
+from App.services.pagination import parse_page_args
+from App.services.streaming import wants_stream, stream_page_response
+from App.services.columnar import wants_columnar
+
+from App.controllers import (
+    get_user_circles_json,
+    get_circle_json,
+    get_circle_snapshot,
+    get_circle_banks_json,
+    get_circle_budgets_json,
+    get_circle_goals_json,
+    get_bank_json,
+    get_budget_json,
+    get_goal_json,
+    get_transaction_json,
+    get_all_bank_budgets,
+    get_circle_transactions_page,
+    get_bank_transactions_page,
+    get_budget_transactions_page,
+    get_goal_transactions_page,
+    active_circle_version_tag,
+    current_active_circle_id,
+    get_circle_version_tag
+)
+
+# v2 Serves The Raw Wire Schema (get_json_v2) - Amounts As Numbers With A Currency Code, ISO Timestamps & Owner IDs
+# v1 Routes Are Left Untouched For Older App Versions
+v2_views = Blueprint('v2_views', __name__, url_prefix='/v2')
+
+API_VERSION = 2
+
+# Shared By Every Transaction List | Paging, Streaming, Columnar Pages & Sparse Fields Work As In v1
+def transactions_response(get_page, entityID):
+    limit, cursor = parse_page_args(request.args)
+    stream = wants_stream(request.args)
+    columnar = wants_columnar(request.args)
+    fields = parse_fields(request.args, Transaction.JSON_FIELDS_V2)
+    transactions, next_cursor = get_page(entityID, limit=limit, cursor=cursor, stream=stream, fields=fields, version=API_VERSION, columnar=columnar)
+
+    # Columnar Pages Are Dicts Too - Only A Missing Entity Carries "error"
+    if isinstance(transactions, dict) and "error" in transactions:
+        return jsonify({"status": "error", "message": transactions["error"]}), 404
+    if stream:
+        return stream_page_response("transactions", transactions), 200
+    return jsonify({"status": "success", "transactions": transactions, "next_cursor": next_cursor}), 200
+
+def item_response(key, item, message):
+    if item is None:
+        return jsonify({"status": "error", "message": message}), 404
+    return jsonify({"status": "success", key: item}), 200
+
+# 1. List User Circles
+@v2_views.route('/circles', methods=['GET'])
+@jwt_required()
+def list_circles():
+    try:
+        fields = parse_fields(request.args, Circle.JSON_FIELDS_V2)
+        circles = get_user_circles_json(get_jwt_identity(), fields, API_VERSION)
+        return jsonify({"status": "success", "circles": circles}), 200
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Circles"}), 500
+
+# 2. Retrieve A Specific Circle
+@v2_views.route('/circle/<int:circleID>', methods=['GET'])
+@conditional_view(get_circle_version_tag)
+def get_circle(circleID):
+    try:
+        fields = parse_fields(request.args, Circle.JSON_FIELDS_V2)
+        return item_response("circle", get_circle_json(circleID, fields, API_VERSION), "Circle Not Found")
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Circle"}), 500
+
+# 3. Circle Snapshot
+@v2_views.route('/circle/<int:circleID>/snapshot', methods=['GET'])
+@jwt_required()
+@conditional_view(get_circle_version_tag)
+def get_snapshot(circleID):
+    try:
+        snapshot = get_circle_snapshot(circleID, get_jwt_identity(), version=API_VERSION)
+        if snapshot is None:
+            return jsonify({"status": "error", "message": "Circle Not Found"}), 404
+        return jsonify({"status": "success", **snapshot}), 200
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": f"Failed To Fetch Snapshot: {str(e)}"}), 500
+
+# 4. Retrieve Circle Transactions
+@v2_views.route('/circle/<int:circleID>/transactions', methods=['GET'])
+@conditional_view(get_circle_version_tag)
+def get_circle_transactions(circleID):
+    try:
+        return transactions_response(get_circle_transactions_page, circleID)
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Transactions"}), 500
+
+# 5. List Active Circle Transactions
+@v2_views.route('/transactions', methods=['GET'])
+@jwt_required()
+@conditional_view(active_circle_version_tag)
+def list_transactions():
+    try:
+        return transactions_response(get_circle_transactions_page, current_active_circle_id())
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Transactions"}), 500
+
+# 6. Retrieve A Specific Transaction
+@v2_views.route('/transaction/<int:transactionID>', methods=['GET'])
+def get_transaction(transactionID):
+    try:
+        fields = parse_fields(request.args, Transaction.JSON_FIELDS_V2)
+        return item_response("transaction", get_transaction_json(transactionID, fields, API_VERSION), "Transaction Not Found")
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Transaction"}), 500
+
+# 7. List Active Circle Banks
+@v2_views.route('/banks', methods=['GET'])
+@jwt_required()
+@conditional_view(active_circle_version_tag)
+def list_banks():
+    try:
+        fields = parse_fields(request.args, Bank.JSON_FIELDS_V2)
+        banks = get_circle_banks_json(current_active_circle_id(), fields, API_VERSION)
+        return jsonify({"status": "success", "banks": banks}), 200
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Banks"}), 500
+
+# 8. Retrieve A Specific Bank
+@v2_views.route('/bank/<int:bankID>', methods=['GET'])
+@jwt_required()
+def get_bank(bankID):
+    try:
+        fields = parse_fields(request.args, Bank.JSON_FIELDS_V2)
+        return item_response("bank", get_bank_json(bankID, fields, API_VERSION), "Bank Not Found")
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Bank"}), 500
+
+# 9. Retrieve Bank Transactions
+@v2_views.route('/bank/<int:bankID>/transactions', methods=['GET'])
+@jwt_required()
+def get_bank_transactions(bankID):
+    try:
+        return transactions_response(get_bank_transactions_page, bankID)
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Transactions"}), 500
+
+# 10. Retrieve Bank Budgets
+@v2_views.route('/bank/<int:bankID>/budgets', methods=['GET'])
+def get_bank_budgets(bankID):
+    try:
+        fields = parse_fields(request.args, Budget.JSON_FIELDS_V2)
+        budgets = get_all_bank_budgets(bankID, fields, API_VERSION)
+        return jsonify({"status": "success", "budgets": budgets}), 200
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Budgets"}), 500
+
+# 11. List Active Circle Budgets
+@v2_views.route('/budgets', methods=['GET'])
+@jwt_required()
+@conditional_view(active_circle_version_tag)
+def list_budgets():
+    try:
+        fields = parse_fields(request.args, Budget.JSON_FIELDS_V2)
+        budgets = get_circle_budgets_json(current_active_circle_id(), fields, API_VERSION)
+        return jsonify({"status": "success", "budgets": budgets}), 200
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Budgets"}), 500
+
+# 12. Retrieve A Specific Budget
+@v2_views.route('/budget/<int:budgetID>', methods=['GET'])
+def get_budget(budgetID):
+    try:
+        fields = parse_fields(request.args, Budget.JSON_FIELDS_V2)
+        return item_response("budget", get_budget_json(budgetID, fields, API_VERSION), "Budget Not Found")
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Budget"}), 500
+
+# 13. Retrieve Budget Transactions
+@v2_views.route('/budget/<int:budgetID>/transactions', methods=['GET'])
+def get_budget_transactions(budgetID):
+    try:
+        return transactions_response(get_budget_transactions_page, budgetID)
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Transactions"}), 500
+
+# 14. List Active Circle Goals
+@v2_views.route('/goals', methods=['GET'])
+@jwt_required()
+@conditional_view(active_circle_version_tag)
+def list_goals():
+    try:
+        fields = parse_fields(request.args, Goal.JSON_FIELDS_V2)
+        goals = get_circle_goals_json(current_active_circle_id(), fields, API_VERSION)
+        return jsonify({"status": "success", "goals": goals}), 200
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Goals"}), 500
+
+# 15. Retrieve A Specific Goal
+@v2_views.route('/goal/<int:goalID>', methods=['GET'])
+def get_goal(goalID):
+    try:
+        fields = parse_fields(request.args, Goal.JSON_FIELDS_V2)
+        return item_response("goal", get_goal_json(goalID, fields, API_VERSION), "Goal Not Found")
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Goal"}), 500
+
+# 16. Retrieve Goal Transactions
+@v2_views.route('/goal/<int:goalID>/transactions', methods=['GET'])
+def get_goal_transactions(goalID):
+    try:
+        return transactions_response(get_goal_transactions_page, goalID)
+
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    except Exception as e:
+        print(f"An Error Occurred: {e}")
+        return jsonify({"status": "error", "message": "Failed To Fetch Transactions"}), 500
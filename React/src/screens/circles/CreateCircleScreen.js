@@ -60,6 +60,10 @@ export default function CreateCircleScreen({ navigation, route }) {
         const data = await response.json();
   
         if (response.ok && data.status === 'success') {
+          // The Active Circle Is Carried In The Token, So Keep The Refreshed One
+          if (data.access_token) {
+            await AsyncStorage.setItem('access_token', data.access_token);
+          }
           console.log(data.message)
         } else {
           console.error(data.message);
@@ -100,6 +100,10 @@ export default function Dashboard({ navigation }) {
       const data = await response.json();
 
       if (response.ok && data.status === 'success') {
+        // The Active Circle Is Carried In The Token, So Keep The Refreshed One
+        if (data.access_token) {
+          await AsyncStorage.setItem('access_token', data.access_token);
+        }
         setReload(prevState => !prevState);
         fetchActiveCircle();
       } else {
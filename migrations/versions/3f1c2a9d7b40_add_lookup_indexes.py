@@ -0,0 +1,62 @@
+"""Add indexes for transaction and association lookups
+
+Revision ID: 3f1c2a9d7b40
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a9d7b40'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# Tables Are Created By db.create_all() (flask init), So This Revision Only Adds
+# The Indexes - if_not_exists Keeps It Safe On Databases Created After The Models Declared Them
+def upgrade():
+    op.create_index('ix_transaction_circle_date', 'transaction', ['circleID', 'transactionDate', 'transactionTime', 'transactionID'], unique=False, if_not_exists=True)
+    op.create_index('ix_transaction_bank_date', 'transaction', ['bankID', 'transactionDate', 'transactionTime', 'transactionID'], unique=False, if_not_exists=True)
+    op.create_index('ix_transaction_budget_date', 'transaction', ['budgetID', 'transactionDate', 'transactionTime', 'transactionID'], unique=False, if_not_exists=True)
+    op.create_index('ix_transaction_goal_date', 'transaction', ['goalID', 'transactionDate', 'transactionTime', 'transactionID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userTransaction_transaction_user', 'userTransaction', ['transactionID', 'userTransactionID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userTransaction_user_transaction', 'userTransaction', ['userID', 'transactionID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userBank_bank_user', 'userBank', ['bankID', 'userID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userBank_user_bank', 'userBank', ['userID', 'bankID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userBudget_budget_user', 'userBudget', ['budgetID', 'userID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userBudget_user_budget', 'userBudget', ['userID', 'budgetID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userGoal_goal_user', 'userGoal', ['goalID', 'userID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userGoal_user_goal', 'userGoal', ['userID', 'goalID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userCircle_circle_user', 'userCircle', ['circleID', 'userID'], unique=False, if_not_exists=True)
+    op.create_index('ix_userCircle_user_circle', 'userCircle', ['userID', 'circleID'], unique=False, if_not_exists=True)
+    op.create_index('ix_bank_circle_primary', 'bank', ['circleID', 'isPrimary'], unique=False, if_not_exists=True)
+    op.create_index('ix_budget_circle', 'budget', ['circleID'], unique=False, if_not_exists=True)
+    op.create_index('ix_budget_bank', 'budget', ['bankID'], unique=False, if_not_exists=True)
+    op.create_index('ix_goal_circle', 'goal', ['circleID'], unique=False, if_not_exists=True)
+    op.create_index('ix_transactionAttachment_transaction', 'transactionAttachment', ['transactionID'], unique=False, if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index('ix_transactionAttachment_transaction', table_name='transactionAttachment', if_exists=True)
+    op.drop_index('ix_goal_circle', table_name='goal', if_exists=True)
+    op.drop_index('ix_budget_bank', table_name='budget', if_exists=True)
+    op.drop_index('ix_budget_circle', table_name='budget', if_exists=True)
+    op.drop_index('ix_bank_circle_primary', table_name='bank', if_exists=True)
+    op.drop_index('ix_userCircle_user_circle', table_name='userCircle', if_exists=True)
+    op.drop_index('ix_userCircle_circle_user', table_name='userCircle', if_exists=True)
+    op.drop_index('ix_userGoal_user_goal', table_name='userGoal', if_exists=True)
+    op.drop_index('ix_userGoal_goal_user', table_name='userGoal', if_exists=True)
+    op.drop_index('ix_userBudget_user_budget', table_name='userBudget', if_exists=True)
+    op.drop_index('ix_userBudget_budget_user', table_name='userBudget', if_exists=True)
+    op.drop_index('ix_userBank_user_bank', table_name='userBank', if_exists=True)
+    op.drop_index('ix_userBank_bank_user', table_name='userBank', if_exists=True)
+    op.drop_index('ix_userTransaction_user_transaction', table_name='userTransaction', if_exists=True)
+    op.drop_index('ix_userTransaction_transaction_user', table_name='userTransaction', if_exists=True)
+    op.drop_index('ix_transaction_goal_date', table_name='transaction', if_exists=True)
+    op.drop_index('ix_transaction_budget_date', table_name='transaction', if_exists=True)
+    op.drop_index('ix_transaction_bank_date', table_name='transaction', if_exists=True)
+    op.drop_index('ix_transaction_circle_date', table_name='transaction', if_exists=True)
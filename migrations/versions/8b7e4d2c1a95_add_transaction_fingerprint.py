@@ -0,0 +1,81 @@
+"""Add transaction fingerprints for duplicate detection
+
+Revision ID: 8b7e4d2c1a95
+Revises: 3f1c2a9d7b40
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from App.services.fingerprint import transaction_fingerprint
+
+
+# revision identifiers, used by Alembic.
+revision = '8b7e4d2c1a95'
+down_revision = '3f1c2a9d7b40'
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+transaction = sa.table(
+    'transaction',
+    sa.column('transactionID', sa.Integer),
+    sa.column('transactionTitle', sa.String),
+    sa.column('transactionAmount', sa.Float),
+    sa.column('transactionDate', sa.Date),
+    sa.column('transactionTime', sa.Time),
+    sa.column('bankID', sa.Integer),
+    sa.column('transactionFingerprint', sa.String)
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    # Databases Created By db.create_all() After The Model Change Already Have The Column
+    columns = {column['name'] for column in sa.inspect(bind).get_columns('transaction')}
+    if 'transactionFingerprint' not in columns:
+        with op.batch_alter_table('transaction') as batch_op:
+            batch_op.add_column(sa.Column('transactionFingerprint', sa.String(length=64), nullable=True))
+    op.create_index('ix_transaction_circle_fingerprint', 'transaction', ['circleID', 'transactionFingerprint'], unique=False, if_not_exists=True)
+
+    # Backfill In Keyset Batches So Large Tables Never Load At Once
+    lastID = 0
+    while True:
+        rows = bind.execute(
+            sa.select(
+                transaction.c.transactionID,
+                transaction.c.transactionTitle,
+                transaction.c.transactionAmount,
+                transaction.c.transactionDate,
+                transaction.c.transactionTime,
+                transaction.c.bankID
+            )
+            .where(transaction.c.transactionID > lastID, transaction.c.transactionFingerprint.is_(None))
+            .order_by(transaction.c.transactionID)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+
+        bind.execute(
+            transaction.update()
+            .where(transaction.c.transactionID == sa.bindparam('b_transactionID'))
+            .values(transactionFingerprint=sa.bindparam('b_fingerprint')),
+            [
+                {
+                    'b_transactionID': row.transactionID,
+                    'b_fingerprint': transaction_fingerprint(row.transactionTitle, row.transactionAmount, row.transactionDate, row.transactionTime, row.bankID)
+                }
+                for row in rows
+            ]
+        )
+        lastID = rows[-1].transactionID
+
+
+def downgrade():
+    op.drop_index('ix_transaction_circle_fingerprint', table_name='transaction', if_exists=True)
+    with op.batch_alter_table('transaction') as batch_op:
+        batch_op.drop_column('transactionFingerprint')
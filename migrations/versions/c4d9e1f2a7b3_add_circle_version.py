@@ -0,0 +1,29 @@
+"""Add a per-circle version counter for conditional GETs
+
+Revision ID: c4d9e1f2a7b3
+Revises: 8b7e4d2c1a95
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d9e1f2a7b3'
+down_revision = '8b7e4d2c1a95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases Created By db.create_all() After The Model Change Already Have The Column
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('circle')}
+    if 'circleVersion' not in columns:
+        with op.batch_alter_table('circle') as batch_op:
+            batch_op.add_column(sa.Column('circleVersion', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    with op.batch_alter_table('circle') as batch_op:
+        batch_op.drop_column('circleVersion')
@@ -1,11 +1,19 @@
-import click, pytest, sys
+import click, pytest, sys, time, io, json, re, threading
+from uuid import uuid4
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask.cli import with_appcontext, AppGroup
+from sqlalchemy import event
 
 from App.database import db, get_migrate
-from App.models import User
+from App.models import User, CircleType, TransactionType, BudgetType, TransactionScope, GoalType, Transaction
 from App.main import create_app
-from App.controllers import ( create_user, get_all_users_json, get_all_users, initialize )
+from App.services.jsonProvider import JSON_PROVIDERS, orjson, msgpack
+from App.services.fields import to_json_list
+from App.views import views
+from App.controllers import ( create_user, get_all_users_json, get_all_users, initialize,
+                              create_circle, set_active_circle, create_bank, add_transaction, import_transactions,
+                              get_all_circle_transactions, columnar_transactions, transaction_list_query, create_budget, create_goal, login )
 
 app = create_app()
 migrate = get_migrate(app)
@@ -15,6 +23,27 @@ def init():
     initialize()
     print('Database Intialized!')
 
+def print_import_report(report):
+    print(f"imported: {report['imported']} | duplicates: {len(report['duplicates'])} | voided: {len(report['voided'])} | failed: {len(report['failed'])} | chunks: {report['chunks']}")
+    for failure in report["failed"][:20]:
+        print(f"  line {failure['line']}: {failure['error']}")
+
+# eg : flask import history.csv.gz bob@mail.com
+@app.cli.command("import", help="Bulk Imports Transactions (NDJSON Or CSV, Optionally gzip) Into A User's Active Circle")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+@click.argument("email")
+@click.option("--format", "import_format", type=click.Choice(["ndjson", "csv"]), default=None, help="Defaults From The File Extension")
+@click.option("--allow-duplicates", is_flag=True, help="Import Rows Matching An Existing Transaction's Fingerprint")
+def import_command(path, email, import_format, allow_duplicates):
+    user = User.query.filter_by(email=email).first()
+    if not user:
+        raise click.ClickException(f"No User With Email {email}")
+
+    import_format = import_format or ("csv" if ".csv" in path.lower() else "ndjson")
+    with open(path, "rb") as file:
+        report = import_transactions(file, user.id, import_format=import_format, allow_duplicates=allow_duplicates)
+    print_import_report(report)
+
 '''
 Test Commands
 '''
@@ -99,4 +128,247 @@ def all_tests_command(type):
     else:
         sys.exit(pytest.main(["-k", "App"]))
 
-app.cli.add_command(test)
\ No newline at end of file
+app.cli.add_command(test)
+
+'''
+Benchmark Commands
+
+Each benchmark creates its own user, circle & bank, so run them against a scratch database (eg : after flask init)
+'''
+
+bench = AppGroup('bench', help='Benchmark Commands')
+# eg : flask bench <command>
+
+def create_bench_circle(label):
+    user = create_user(f"Bench {label.title()}", f"bench-{label}-{uuid4().hex[:8]}@mail.com", "benchpass")
+    circle = create_circle(circleName=f"Bench {label.title()}",
+                           circleType=CircleType.SELF,
+                           circleColor="#6A3D9A",
+                           circleImage="https://picsum.photos/id/82/300/300.jpg",
+                           userID=user.id)
+    set_active_circle(userID=user.id, circleID=circle.circleID)
+    bank = create_bank(userID=user.id,
+                       bankTitle="Bench Wallet",
+                       bankCurrency="TTD",
+                       bankAmount=1_000_000_000,
+                       isPrimary=True,
+                       color="#6A3D9A")
+    return user, circle, bank
+
+def print_timings(label, timings):
+    timings = sorted(timings)
+    mean = sum(timings) / len(timings)
+    p50 = timings[len(timings) // 2]
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label}: mean {mean * 1000:.2f}ms | p50 {p50 * 1000:.2f}ms | p95 {p95 * 1000:.2f}ms")
+
+# eg : flask bench post 500
+@bench.command("post", help="Times add_transaction & Counts Database Commits Per Post")
+@click.argument("count", default=200)
+@click.option("--attachments", default=2, help="Attachments Per Transaction")
+def bench_post_command(count, attachments):
+    user, circle, bank = create_bench_circle("post")
+
+    commits = []
+    def on_commit(conn):
+        commits.append(conn)
+
+    timings = []
+    event.listen(db.engine, "commit", on_commit)
+    try:
+        for i in range(count):
+            start = time.perf_counter()
+            _, error = add_transaction(
+                transactionTitle=f"Bench Transaction {i}",
+                transactionDesc="",
+                transactionType=TransactionType.EXPENSE,
+                transactionCategory=["GROCERIES"],
+                transactionAmount=1.00,
+                transactionDate="2025-01-06",
+                transactionTime="09:30",
+                bankID=bank.bankID,
+                userID=user.id,
+                goalID=None,
+                attachments=[{"name": f"receipt{j}.jpg", "mimeType": "image/jpeg", "size": 10, "uri": "file://receipt"} for j in range(attachments)]
+            )
+            timings.append(time.perf_counter() - start)
+            if error:
+                raise click.ClickException(error)
+    finally:
+        event.remove(db.engine, "commit", on_commit)
+
+    print(f"posts: {count} | commits: {len(commits)} | commits/post: {len(commits) / count:.2f}")
+    print_timings("add_transaction", timings)
+
+# eg : flask bench import 50000
+@bench.command("import", help="Times A Bulk NDJSON Import & Reports Rows Per Second")
+@click.argument("count", default=50000)
+def bench_import_command(count):
+    user, circle, bank = create_bench_circle("import")
+    payload = io.BytesIO(b"".join(
+        json.dumps({
+            "transactionTitle": f"Imported {i}",
+            "transactionType": "EXPENSE",
+            "transactionCategory": ["GROCERIES"],
+            "transactionAmount": 1.25,
+            "transactionDate": "2025-01-06",
+            "transactionTime": "09:30",
+            "bankID": bank.bankID
+        }).encode("utf-8") + b"\n"
+        for i in range(count)
+    ))
+
+    start = time.perf_counter()
+    report = import_transactions(payload, user.id)
+    elapsed = time.perf_counter() - start
+
+    print_import_report(report)
+    print(f"import: {elapsed:.2f}s | {report['imported'] / elapsed:,.0f} rows/s")
+
+def import_bench_transactions(user, bank, count):
+    payload = io.BytesIO(b"".join(
+        json.dumps({
+            "transactionTitle": f"Rendered {i}",
+            "transactionType": "EXPENSE" if i % 4 else "INCOME",
+            "transactionCategory": ["GROCERIES"] if i % 3 else ["SHOPPING"],
+            "transactionAmount": 1.25,
+            "transactionDate": "2025-01-06",
+            "transactionTime": "09:30",
+            "bankID": bank.bankID
+        }).encode("utf-8") + b"\n"
+        for i in range(count)
+    ))
+    return import_transactions(payload, user.id)
+
+# Imports count Rendered Transactions Into A New Bench Circle & Returns Them Serialized
+def create_bench_transactions(label, count):
+    user, circle, bank = create_bench_circle(label)
+    import_bench_transactions(user, bank, count)
+    return get_all_circle_transactions(circle.circleID)
+
+# eg : flask bench json 10000
+@bench.command("json", help="Times Each JSON Provider Rendering A Transaction List Response")
+@click.argument("count", default=10000)
+@click.option("--rounds", default=20, help="Renders Per Provider")
+def bench_json_command(count, rounds):
+    transactions = create_bench_transactions("json", count)
+
+    providers = {"flask default": DefaultJSONProvider(app)}
+    providers.update({name: provider_class(app) for name, provider_class in JSON_PROVIDERS.items() if name != "orjson" or orjson})
+
+    print(f"transactions: {len(transactions)} | active provider: {type(app.json).__name__}")
+    for name, provider in providers.items():
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            response = provider.response(status="success", transactions=transactions, next_cursor=None)
+            timings.append(time.perf_counter() - start)
+        print_timings(f"{name} ({len(response.get_data()) / 1024:,.0f} KiB)", timings)
+
+# eg : flask bench columnar 10000
+@bench.command("columnar", help="Compares Row & Columnar Transaction Pages - Size, Server Encode & Client Parse Time")
+@click.argument("count", default=10000)
+@click.option("--rounds", default=20, help="Encodes & Parses Per Format")
+def bench_columnar_command(count, rounds):
+    user, circle, bank = create_bench_circle("columnar")
+    import_bench_transactions(user, bank, count)
+    transactions = transaction_list_query(circleID=circle.circleID).all()
+
+    # Both Encodes Start From The Loaded Rows, As The Endpoints Do - Serializing Is Part Of The Cost
+    pages = {"rows": lambda: to_json_list(Transaction, transactions), "columnar": lambda: columnar_transactions(transactions)}
+
+    print(f"transactions: {len(transactions)} | provider: {type(app.json).__name__}")
+    for name, page in pages.items():
+        encodes, parses = [], []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            body = app.json.response(status="success", transactions=page(), next_cursor=None).get_data()
+            encodes.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            json.loads(body)
+            parses.append(time.perf_counter() - start)
+        print_timings(f"{name} encode ({len(body) / 1024:,.0f} KiB)", encodes)
+        print_timings(f"{name} parse", parses)
+
+# eg : flask bench msgpack 1000
+@bench.command("msgpack", help="Compares JSON & MessagePack Bytes And CPU Time For Every GET Endpoint")
+@click.argument("count", default=1000)
+@click.option("--rounds", default=10, help="Requests Per Endpoint & Encoding")
+def bench_msgpack_command(count, rounds):
+    if msgpack is None:
+        raise click.ClickException("msgpack Is Not Installed")
+
+    user, circle, bank = create_bench_circle("msgpack")
+    import_bench_transactions(user, bank, count)
+    budget = create_budget(budgetTitle="Bench Budget", budgetAmount=1000.00, budgetType=BudgetType.EXPENSE, budgetCategory=["GROCERIES"],
+                           transactionScope=TransactionScope.INCLUSIVE, color="#6A3D9A", startDate="2025-01-01", endDate="2025-01-31",
+                           userID=user.id, bankID=bank.bankID)
+    goal = create_goal(goalTitle="Bench Goal", targetAmount=1000.00, goalType=GoalType.SAVINGS, color="#6A3D9A",
+                       startDate="2025-01-01", endDate="2025-01-31", userID=user.id)
+
+    ids = {"circleID": circle.circleID, "bankID": bank.bankID, "budgetID": budget.budgetID, "goalID": goal.goalID,
+           "transactionID": get_all_circle_transactions(circle.circleID)[0]["transactionID"], "category_key": "GROCERIES"}
+    headers = {"Authorization": f"Bearer {login(user.email, 'benchpass')}"}
+    encodings = {"json": "application/json", "msgpack": "application/msgpack"}
+
+    # index_views Is Skipped - Its GET /init Drops The Database
+    blueprints = {view.name for view in views} - {"index_views"}
+    client = app.test_client()
+
+    print(f"transactions: {count} | {rounds} requests per endpoint & encoding")
+    for rule in sorted(app.url_map.iter_rules(), key=lambda rule: rule.rule):
+        if "GET" not in rule.methods or rule.endpoint.split(".")[0] not in blueprints or not rule.arguments <= ids.keys():
+            continue
+        path = rule.rule
+        for argument in rule.arguments:
+            path = re.sub(rf"<[^>]*{argument}>", str(ids[argument]), path)
+
+        sizes, cpu = {}, {}
+        for name, mimetype in encodings.items():
+            client.get(path, headers={**headers, "Accept": mimetype}).get_data()
+            start = time.process_time()
+            for _ in range(rounds):
+                response = client.get(path, headers={**headers, "Accept": mimetype})
+                body = response.get_data()
+            cpu[name] = (time.process_time() - start) / rounds
+            sizes[name] = len(body)
+
+        # Streamed & Exported Bodies Aren't Negotiated
+        if response.mimetype != "application/msgpack":
+            continue
+        print(f"{path}: json {sizes['json']:,}B {cpu['json'] * 1000:.2f}ms | msgpack {sizes['msgpack']:,}B {cpu['msgpack'] * 1000:.2f}ms"
+              f" | bytes {sizes['msgpack'] / sizes['json'] - 1:+.0%} cpu {cpu['msgpack'] / cpu['json'] - 1:+.0%}")
+
+# eg : flask bench coalesce 5000
+@bench.command("coalesce", help="Fires Identical Circle Transaction Reads At Once & Reports The Computations Coalescing Saved")
+@click.argument("count", default=5000)
+@click.option("--readers", default=8, help="Concurrent Identical Requests")
+def bench_coalesce_command(count, readers):
+    single_flight = app.extensions['single_flight']
+    if single_flight is None:
+        raise click.ClickException("COALESCE_REQUESTS Is Disabled")
+
+    user, circle, bank = create_bench_circle("coalesce")
+    import_bench_transactions(user, bank, count)
+    path = f"/circle/{circle.circleID}/transactions"
+    before = single_flight.stats()
+    gate = threading.Barrier(readers)
+
+    def read():
+        gate.wait()
+        app.test_client().get(path).get_data()
+
+    threads = [threading.Thread(target=read) for _ in range(readers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    stats = single_flight.stats()
+    computed, coalesced = stats["computed"] - before["computed"], stats["coalesced"] - before["coalesced"]
+    print(f"{readers} identical reads of {path} ({count} transactions) in {elapsed * 1000:.0f}ms | computed: {computed} | coalesced: {coalesced}")
+
+app.cli.add_command(bench)